@@ -0,0 +1 @@
+from .problem import Problem, make_problem
@@ -0,0 +1,71 @@
+# cec2017.batch
+# Helpers shared by f1 to f30 which allow evaluating a whole population
+# (a matrix holding one individual per row) in a single call
+
+import numpy as np
+
+def as_population(x):
+    """
+    Converts the input of a benchmark function into a population matrix.
+
+    Args:
+        x (numpy.array): Single input vector (D) or population matrix (M x D).
+
+    Returns:
+        (numpy.array, bool): The population matrix (M x D) and whether the
+            input was a single vector.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim == 1:
+        return x[np.newaxis, :], True
+    if x.ndim != 2:
+        raise ValueError(f'expected a vector or a matrix, got {x.ndim} dimensions')
+    return x, False
+
+def unwrap(values, single):
+    """
+    Converts the population values back to the shape of the original input.
+
+    Args:
+        values (numpy.array): Function values of the population (M).
+        single (bool): Whether the original input was a single vector.
+
+    Returns:
+        The only value for a single vector input, the values otherwise.
+    """
+    return values[0] if single else values
+
+def shift_rotate(x, shift, rotation):
+    """
+    Shifts and rotates every individual of the population with one matrix
+    product.
+
+    Args:
+        x (numpy.array): Population matrix (M x D).
+        shift (numpy.array): Shift vector (D).
+        rotation (matrix): Rotation matrix (D x D).
+
+    Returns:
+        (numpy.array): Matrix (M x D) holding rotation * (x - shift) rows.
+    """
+    return np.matmul(x - shift, rotation.T)
+
+def frozen(a, dtype=np.float64):
+    """
+    Prepares transformation data for repeated evaluations.
+
+    Args:
+        a (numpy.array): Rotation, shift or shuffle data.
+        dtype (numpy.dtype): Required type of the data.
+
+    Returns:
+        (numpy.array): Read-only, C-contiguous version of the data. Writeable
+            data is copied, so that modifying it later has no effect, while
+            read-only data of the required layout is shared.
+    """
+    a = np.asarray(a)
+    if a.flags.writeable or a.dtype != dtype or not a.flags.c_contiguous:
+        a = np.array(a, dtype=dtype, order='C')
+    a = a.view()
+    a.flags.writeable = False
+    return a
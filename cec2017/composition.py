@@ -1,356 +1,336 @@
 # cec2017.composition
 # Author: Duncan Tilley
 # Composition function definitions, f21 to f30
+# Every function accepts a single vector or a population matrix (M x D) holding
+# one individual per row, in which case a vector of M values is returned.
 
-from . import basic
+from . import batch
+from . import kernels
 from . import transforms
 from . import hybrid
 
+import functools
 import numpy as np
 
-def _calc_w(x, sigma):
-    nx = len(x)
-    w = 0
-    for i in range(0, nx):
-        w += x[i]*x[i]
-    if (w != 0):
-        w = ((1.0/w)**0.5) * np.exp(-w / (2.0*nx*sigma*sigma))
-    else:
-        w = float('inf')
-    return w
+def _calc_w(x, sigmas):
+    """
+    Calculates the unnormalized weights of all components for every
+    individual.
 
-def f21(x, rotations=None, shifts=None):
+    Args:
+        x (numpy.array): Population (M x N x D) shifted by the optimum of each
+            of the N components.
+        sigmas (numpy.array): Sigma values of the components (N).
+
+    Returns:
+        (numpy.array): Weights of the population (M x N).
     """
-    Composition Function 1 (N=3)
+    nx = x.shape[2]
+    w = np.sum(x*x, axis=2)
+    with np.errstate(divide='ignore'):
+        return np.where(
+            w != 0,
+            ((1.0/w)**0.5) * np.exp(-w / (2.0*nx*sigmas*sigmas)),
+            float('inf'))
+
+def _normalize_w(w):
+    """
+    Normalizes the component weights (M x N) of every individual to sum up to
+    one. Individuals with all weights equal to zero get equal weights.
+    """
+    N = w.shape[1]
+    w_sm = np.sum(w, axis=1, keepdims=True)
+    zero = w_sm == 0.0
+    with np.errstate(invalid='ignore'):
+        return np.where(zero, 1/N, w / np.where(zero, 1.0, w_sm))
+
+# Basic functions and sigma, lambda and bias values of the components of f21 to
+# f28
+_definitions = [
+    (
+        [kernels.rosenbrock, kernels.high_conditioned_elliptic, kernels.rastrigin],
+        [10.0, 20.0, 30.0],
+        [1.0, 1.0e-6, 1.0],
+        [0.0, 100.0, 200.0]
+    ),
+    (
+        [kernels.rastrigin, kernels.griewank, kernels.modified_schwefel],
+        [10.0, 20.0, 30.0],
+        [1.0, 10.0, 1.0],
+        [0.0, 100.0, 200.0]
+    ),
+    (
+        [kernels.rosenbrock, kernels.ackley, kernels.modified_schwefel, kernels.rastrigin],
+        [10.0, 20.0, 30.0, 40.0],
+        [1.0, 10.0, 1.0, 1.0],
+        [0.0, 100.0, 200.0, 300.0]
+    ),
+    (
+        [kernels.ackley, kernels.high_conditioned_elliptic, kernels.griewank, kernels.rastrigin],
+        [10.0, 20.0, 30.0, 40.0],
+        [1.0, 1.0e-6, 10.0, 1.0],
+        [0.0, 100.0, 200.0, 300.0]
+    ),
+    (
+        [kernels.rastrigin, kernels.happy_cat, kernels.ackley, kernels.discus, kernels.rosenbrock],
+        [10.0, 20.0, 30.0, 40.0, 50.0],
+        [10.0, 1.0, 10.0, 1.0e-6, 1.0],
+        [0.0, 100.0, 200.0, 300.0, 400.0]
+    ),
+    (
+        [
+            kernels.expanded_schaffers_f6,
+            kernels.modified_schwefel,
+            kernels.griewank,
+            kernels.rosenbrock,
+            kernels.rastrigin],
+        [10.0, 20.0, 20.0, 30.0, 40.0],
+        # Note: the lambdas specified in the problem definitions (below) differ from what is used in the code
+        # [1.0e-26, 10.0, 1.0e-6, 10.0, 5.0e-4]
+        [5.0e-4, 1.0, 10.0, 1.0, 10.0],
+        [0.0, 100.0, 200.0, 300.0, 400.0]
+    ),
+    (
+        [
+            kernels.h_g_bat,
+            kernels.rastrigin,
+            kernels.modified_schwefel,
+            kernels.bent_cigar,
+            kernels.high_conditioned_elliptic,
+            kernels.expanded_schaffers_f6],
+        [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+        [10.0, 10.0, 2.5, 1.0e-26, 1.0e-6, 5.0e-4],
+        [0.0, 100.0, 200.0, 300.0, 400.0, 500.0]
+    ),
+    (
+        [
+            kernels.ackley,
+            kernels.griewank,
+            kernels.discus,
+            kernels.rosenbrock,
+            kernels.happy_cat,
+            kernels.expanded_schaffers_f6],
+        [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+        [10.0, 10.0, 1.0e-6, 1.0, 1.0, 5.0e-4],
+        [0.0, 100.0, 200.0, 300.0, 400.0, 500.0]
+    )
+]
+
+# Hybrid function indices (0 for f11) and sigma and bias values of the
+# components of f29 and f30
+_hybrid_definitions = [
+    ([4, 5, 6], [10.0, 30.0, 50.0], [0.0, 100.0, 200.0]),
+    ([4, 7, 8], [10.0, 30.0, 50.0], [0.0, 100.0, 200.0])
+]
+
+def _compile(k, nx, rotations=None, shifts=None, shuffles=None):
+    """
+    Binds the transformations and constants of the function f(k+21) for the
+    given dimension, so they are resolved only once.
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        k (int): Index of the function (0 for f21).
+        nx (int): Dimension of the function.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
         shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
             official vectors from the benchmark suite will be used.
+        shuffles (numpy.array): Optional shuffle vectors (NxD), used only by f29
+            and f30. If None (default), the official permutation vectors from
+            the benchmark suite will be used.
+
+    Returns:
+        (function): Function evaluating a population matrix (M x nx).
     """
-    nx = len(x)
+    if rotations is None and shifts is None and shuffles is None:
+        return _compile_official(k, nx)
     if rotations is None:
-        rotations = transforms.rotations_cf[nx][0]
+        rotations = transforms.rotations_cf[nx][k]
     if shifts is None:
-        shifts = transforms.shifts_cf[0]
-
-    N = 3
-    funcs = [basic.rosenbrock, basic.high_conditioned_elliptic, basic.rastrigin]
-    sigmas = np.array([10.0, 20.0, 30.0])
-    lambdas = np.array([1.0, 1.0e-6, 1.0])
-    biases = np.array([0.0, 100.0, 200.0])
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](np.matmul(rotations[i], x_shifted))
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
+        shifts = transforms.shifts_cf[k]
+    optimum = 2100.0 + 100.0*k
+
+    if k < len(_definitions):
+        funcs, sigmas, lambdas, biases = _definitions[k]
+        offsets = np.zeros(len(funcs))
     else:
-        w = np.full(N, 1/N)
+        if shuffles is None:
+            shuffles = transforms.shuffles_cf[nx][k - len(_definitions)]
+        indices, sigmas, biases = _hybrid_definitions[k - len(_definitions)]
+        # the hybrid functions get their input already shifted, rotated and
+        # shuffled, see the permutation of the rotations below
+        funcs = [hybrid._compile_shuffled(j, nx) for j in indices]
+        rotations = [np.asarray(rotations[i])[np.asarray(shuffles[i], dtype=np.intp)] for i in range(len(funcs))]
+        lambdas = np.ones(len(funcs))
+        # subtract F* added at the end of the functions
+        offsets = [hybrid._definitions[j][2] for j in indices]
+
+    N = len(funcs)
+    rotations = batch.frozen(np.asarray(rotations)[:N])
+    shifts = batch.frozen(np.asarray(shifts)[:N, :nx])
+    # all components are transformed with a single product with the stacked
+    # rotations, using rotation * (x - shift) = rotation * x - rotation * shift
+    stacked_rotations = rotations.reshape(N*nx, nx)
+    rotated_shifts = batch.frozen(np.einsum('nij,nj->ni', rotations, shifts).reshape(N*nx))
+    sigmas = batch.frozen(sigmas)
+    lambdas = batch.frozen(lambdas)
+    biases = batch.frozen(biases)
+    offsets = batch.frozen(offsets)
+
+    def evaluate(x):
+        z = np.matmul(x, stacked_rotations.T) - rotated_shifts
+        z = z.reshape(len(x), N, nx)
+        vals = np.empty((len(x), N))
+        for i in range(0, N):
+            vals[:, i] = funcs[i](z[:, i])
+        w = _normalize_w(_calc_w(x[:, np.newaxis, :] - shifts, sigmas))
+        return np.sum(w * (lambdas*(vals - offsets) + biases), axis=1) + optimum
+
+    return evaluate
+
+@functools.lru_cache(maxsize=None)
+def _compile_official(k, nx):
+    # the official data is bound and the shifts are rotated only once per
+    # dimension
+    shuffles = transforms.shuffles_cf[nx][k - len(_definitions)] if k >= len(_definitions) else None
+    return _compile(k, nx, transforms.rotations_cf[nx][k], transforms.shifts_cf[k], shuffles)
 
-    return np.sum(w * (lambdas*vals + biases)) + 2100
+def f21(x, rotations=None, shifts=None):
+    """
+    Composition Function 1 (N=3)
+
+    Args:
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
+        rotations (matrix): Optional rotation matrices (NxDxD). If None
+            (default), the official matrices from the benchmark suite will be
+            used.
+        shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
+            official vectors from the benchmark suite will be used.
+    """
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(0, x.shape[1], rotations, shifts)(x), single)
 
 def f22(x, rotations=None, shifts=None):
     """
     Composition Function 2 (N=3)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
         shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
             official vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][1]
-    if shifts is None:
-        shifts = transforms.shifts_cf[1]
-
-    N = 3
-    funcs = [basic.rastrigin, basic.griewank, basic.modified_schwefel]
-    sigmas = np.array([10.0, 20.0, 30.0])
-    lambdas = np.array([1.0, 10.0, 1.0])
-    biases = np.array([0.0, 100.0, 200.0])
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](np.matmul(rotations[i], x_shifted))
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (lambdas*vals + biases)) + 2200
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(1, x.shape[1], rotations, shifts)(x), single)
 
 def f23(x, rotations=None, shifts=None):
     """
     Composition Function 3 (N=4)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
         shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
             official vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][2]
-    if shifts is None:
-        shifts = transforms.shifts_cf[2]
-
-    N = 4
-    funcs = [basic.rosenbrock, basic.ackley, basic.modified_schwefel, basic.rastrigin]
-    sigmas = np.array([10.0, 20.0, 30.0, 40.0])
-    lambdas = np.array([1.0, 10.0, 1.0, 1.0])
-    biases = np.array([0.0, 100.0, 200.0, 300.0])
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](np.matmul(rotations[i], x_shifted))
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (lambdas*vals + biases)) + 2300
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(2, x.shape[1], rotations, shifts)(x), single)
 
 def f24(x, rotations=None, shifts=None):
     """
     Composition Function 4 (N=4)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
         shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
             official vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][3]
-    if shifts is None:
-        shifts = transforms.shifts_cf[3]
-
-    N = 4
-    funcs = [basic.ackley, basic.high_conditioned_elliptic, basic.griewank, basic.rastrigin]
-    sigmas = np.array([10.0, 20.0, 30.0, 40.0])
-    lambdas = np.array([1.0, 1.0e-6, 10.0, 1.0])
-    biases = np.array([0.0, 100.0, 200.0, 300.0])
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](np.matmul(rotations[i], x_shifted))
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (lambdas*vals + biases)) + 2400
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(3, x.shape[1], rotations, shifts)(x), single)
 
 def f25(x, rotations=None, shifts=None):
     """
     Composition Function 5 (N=5)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
         shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
             official vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][4]
-    if shifts is None:
-        shifts = transforms.shifts_cf[4]
-
-    N = 5
-    funcs = [basic.rastrigin, basic.happy_cat, basic.ackley, basic.discus, basic.rosenbrock]
-    sigmas = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
-    lambdas = np.array([10.0, 1.0, 10.0, 1.0e-6, 1.0])
-    biases = np.array([0.0, 100.0, 200.0, 300.0, 400.0])
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](np.matmul(rotations[i], x_shifted))
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (lambdas*vals + biases)) + 2500
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(4, x.shape[1], rotations, shifts)(x), single)
 
 def f26(x, rotations=None, shifts=None):
     """
     Composition Function 6 (N=5)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
         shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
             official vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][5]
-    if shifts is None:
-        shifts = transforms.shifts_cf[5]
-
-    N = 5
-    funcs = [basic.expanded_schaffers_f6, basic.modified_schwefel, basic.griewank, basic.rosenbrock, basic.rastrigin]
-    sigmas = np.array([10.0, 20.0, 20.0, 30.0, 40.0])
-    # Note: the lambdas specified in the problem definitions (below) differ from what is used in the code
-    #lambdas = np.array([1.0e-26, 10.0, 1.0e-6, 10.0, 5.0e-4])
-    lambdas = np.array([5.0e-4, 1.0, 10.0, 1.0, 10.0])
-    biases = np.array([0.0, 100.0, 200.0, 300.0, 400.0])
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](np.matmul(rotations[i], x_shifted))
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (lambdas*vals + biases)) + 2600
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(5, x.shape[1], rotations, shifts)(x), single)
 
 def f27(x, rotations=None, shifts=None):
     """
     Composition Function 7 (N=6)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
         shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
             official vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][6]
-    if shifts is None:
-        shifts = transforms.shifts_cf[6]
-
-    N = 6
-    funcs = [
-        basic.h_g_bat,
-        basic.rastrigin,
-        basic.modified_schwefel,
-        basic.bent_cigar,
-        basic.high_conditioned_elliptic,
-        basic.expanded_schaffers_f6]
-    sigmas = np.array([10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
-    lambdas = np.array([10.0, 10.0, 2.5, 1.0e-26, 1.0e-6, 5.0e-4])
-    biases = np.array([0.0, 100.0, 200.0, 300.0, 400.0, 500.0])
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](np.matmul(rotations[i], x_shifted))
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (lambdas*vals + biases)) + 2700
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(6, x.shape[1], rotations, shifts)(x), single)
 
 def f28(x, rotations=None, shifts=None):
     """
     Composition Function 8 (N=6)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
         shifts (numpy.array): Optional shift vectors (NxD). If None (default), the
             official vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][7]
-    if shifts is None:
-        shifts = transforms.shifts_cf[7]
-
-    N = 6
-    funcs = [
-        basic.ackley,
-        basic.griewank,
-        basic.discus,
-        basic.rosenbrock,
-        basic.happy_cat,
-        basic.expanded_schaffers_f6]
-    sigmas = np.array([10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
-    lambdas = np.array([10.0, 10.0, 1.0e-6, 1.0, 1.0, 5.0e-4])
-    biases = np.array([0.0, 100.0, 200.0, 300.0, 400.0, 500.0])
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](np.matmul(rotations[i], x_shifted))
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (lambdas*vals + biases)) + 2800
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(7, x.shape[1], rotations, shifts)(x), single)
 
 def f29(x, rotations=None, shifts=None, shuffles=None):
     """
     Composition Function 9 (N=3)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
@@ -359,42 +339,16 @@ def f29(x, rotations=None, shifts=None, shuffles=None):
         shuffles (numpy.array): Optional shuffle vectors (NxD). If None (default), the
             official permutation vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][8]
-    if shifts is None:
-        shifts = transforms.shifts_cf[8]
-    if shuffles is None:
-        shuffles = transforms.shuffles_cf[nx][0]
-
-    N = 3
-    funcs = [hybrid.f15, hybrid.f16, hybrid.f17]
-    sigmas = np.array([10.0, 30.0, 50.0])
-    biases = np.array([0.0, 100.0, 200.0])
-    offsets = np.array([1500, 1600, 1700]) # subtract F* added at the end of the functions
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](x, rotation=rotations[i], shift=shifts[i][:nx], shuffle=shuffles[i])
-        vals[i] -= offsets[i]
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (vals + biases)) + 2900
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(8, x.shape[1], rotations, shifts, shuffles)(x), single)
 
 def f30(x, rotations=None, shifts=None, shuffles=None):
     """
     Composition Function 10 (N=3)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotations (matrix): Optional rotation matrices (NxDxD). If None
             (default), the official matrices from the benchmark suite will be
             used.
@@ -403,32 +357,5 @@ def f30(x, rotations=None, shifts=None, shuffles=None):
         shuffles (numpy.array): Optional shuffle vectors (NxD). If None (default), the
             official permutation vectors from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotations is None:
-        rotations = transforms.rotations_cf[nx][9]
-    if shifts is None:
-        shifts = transforms.shifts_cf[9]
-    if shuffles is None:
-        shuffles = transforms.shuffles_cf[nx][1]
-
-    N = 3
-    funcs = [hybrid.f15, hybrid.f18, hybrid.f19]
-    sigmas = np.array([10.0, 30.0, 50.0])
-    biases = np.array([0.0, 100.0, 200.0])
-    offsets = np.array([1500, 1800, 1900]) # subtract F* added at the end of the functions
-    vals = np.zeros(N)
-    w = np.zeros(N)
-    w_sm = 0.0
-    for i in range(0, N):
-        x_shifted = x-shifts[i][:nx]
-        vals[i] = funcs[i](x, rotation=rotations[i], shift=shifts[i][:nx], shuffle=shuffles[i])
-        vals[i] -= offsets[i]
-        w[i] = _calc_w(x_shifted, sigmas[i])
-        w_sm += w[i]
-
-    if (w_sm != 0.0):
-        w /= w_sm
-    else:
-        w = np.full(N, 1/N)
-
-    return np.sum(w * (vals + biases)) + 3000
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(9, x.shape[1], rotations, shifts, shuffles)(x), single)
@@ -1,75 +1,194 @@
 # cec2017.hybrid
 # Author: Duncan Tilley
 # Hybrid function definitions, f11 to f20
+# Every function accepts a single vector or a population matrix (M x D) holding
+# one individual per row, in which case a vector of M values is returned.
 
-from . import basic
+from . import batch
+from . import kernels
 from . import transforms
 
+import functools
 import numpy as np
 
-def _shuffle_and_partition(x, shuffle, partitions):
+def _partition_slices(nx, partitions):
     """
-    First applies the given permutation, then splits x into partitions given
-    the percentages.
+    Computes the column ranges which split a shuffled vector into partitions
+    given the percentages.
 
     Args:
-        x (numpy.array): Input vector.
-        shuffle (numpy.array): Shuffle vector.
+        nx (int): Dimension of the vector.
         partitions (list): List of percentages. Assumed to add up to 1.0.
 
     Returns:
-        (list of numpy.arrays): The partitions of x after shuffling.
+        (list of slices): The column ranges of the partitions.
     """
-    nx = len(x)
-    # shuffle
-    xs = np.zeros(x.shape)
-    for i in range(0, nx):
-        xs[i] = x[shuffle[i]]
-    # and partition
-    parts = []
+    slices = []
     start, end = 0, 0
     for p in partitions[:-1]:
         end = start + int(np.ceil(p * nx))
-        parts.append(xs[start:end])
+        slices.append(slice(start, end))
         start = end
-    parts.append(xs[end:])
-    return parts
+    slices.append(slice(end, nx))
+    return slices
+
+# Basic functions, partition percentages and optimum value of f11 to f20
+_definitions = [
+    (
+        [kernels.zakharov, kernels.rosenbrock, kernels.rastrigin],
+        [0.2, 0.4, 0.4],
+        1100.0
+    ),
+    (
+        [kernels.high_conditioned_elliptic, kernels.modified_schwefel, kernels.bent_cigar],
+        [0.3, 0.3, 0.4],
+        1200.0
+    ),
+    (
+        [kernels.bent_cigar, kernels.rosenbrock, kernels.lunacek_bi_rastrigin],
+        [0.3, 0.3, 0.4],
+        1300.0
+    ),
+    (
+        [
+            kernels.high_conditioned_elliptic,
+            kernels.ackley,
+            kernels.schaffers_f7,
+            kernels.rastrigin],
+        [0.2, 0.2, 0.2, 0.4],
+        1400.0
+    ),
+    (
+        [kernels.bent_cigar, kernels.h_g_bat, kernels.rastrigin, kernels.rosenbrock],
+        [0.2, 0.2, 0.3, 0.3],
+        1500.0
+    ),
+    (
+        [
+            kernels.expanded_schaffers_f6,
+            kernels.h_g_bat,
+            kernels.rosenbrock,
+            kernels.modified_schwefel],
+        [0.2, 0.2, 0.3, 0.3],
+        1600.0
+    ),
+    (
+        [
+            kernels.katsuura,
+            kernels.ackley,
+            kernels.expanded_griewanks_plus_rosenbrock,
+            kernels.modified_schwefel,
+            kernels.rastrigin],
+        [0.1, 0.2, 0.2, 0.2, 0.3],
+        1700.0
+    ),
+    (
+        [
+            kernels.high_conditioned_elliptic,
+            kernels.ackley,
+            kernels.rastrigin,
+            kernels.h_g_bat,
+            kernels.discus],
+        [0.2, 0.2, 0.2, 0.2, 0.2],
+        1800.0
+    ),
+    (
+        [
+            kernels.bent_cigar,
+            kernels.rastrigin,
+            kernels.expanded_griewanks_plus_rosenbrock,
+            kernels.weierstrass,
+            kernels.expanded_schaffers_f6],
+        [0.2, 0.2, 0.2, 0.2, 0.2],
+        1900.0
+    ),
+    (
+        [
+            kernels.happy_cat,
+            kernels.katsuura,
+            kernels.ackley,
+            kernels.rastrigin,
+            kernels.modified_schwefel,
+            kernels.schaffers_f7],
+        [0.1, 0.1, 0.2, 0.2, 0.2, 0.2],
+        2000.0
+    )
+]
 
-def f11(x, rotation=None, shift=None, shuffle=None):
+def _compile(k, nx, rotation=None, shift=None, shuffle=None):
     """
-    Hybrid Function 1 (N=3)
+    Binds the transformations and constants of the function f(k+11) for the
+    given dimension, so they are resolved only once.
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        k (int): Index of the function (0 for f11).
+        nx (int): Dimension of the function.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
-        shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
+        shuffle (numpy.array): Optional shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
+
+    Returns:
+        (function): Function evaluating a population matrix (M x nx).
     """
-    nx = len(x)
+    if rotation is None and shift is None and shuffle is None:
+        return _compile_official(k, nx)
     if rotation is None:
-        rotation = transforms.rotations[nx][10]
+        rotation = transforms.rotations[nx][10+k]
     if shift is None:
-        shift = transforms.shifts[10][:nx]
+        shift = transforms.shifts[10+k][:nx]
     if shuffle is None:
-        shuffle = transforms.shuffles[nx][0]
+        shuffle = transforms.shuffles[nx][k]
+    # permuting the rows of the rotation once shuffles every transformed
+    # individual without gathering its coordinates on each evaluation
+    rotation = batch.frozen(np.asarray(rotation)[np.asarray(shuffle, dtype=np.intp)])
+    shift = batch.frozen(shift)
+    evaluate_shuffled = _compile_shuffled(k, nx)
+    return lambda x: evaluate_shuffled(batch.shift_rotate(x, shift, rotation))
+
+@functools.lru_cache(maxsize=None)
+def _compile_official(k, nx):
+    # the official data is bound only once per dimension
+    return _compile(k, nx, transforms.rotations[nx][10+k], transforms.shifts[10+k][:nx], transforms.shuffles[nx][k])
+
+def _compile_shuffled(k, nx):
+    """
+    Binds the partitions and basic functions of the function f(k+11) for the
+    given dimension.
+
+    Args:
+        k (int): Index of the function (0 for f11).
+        nx (int): Dimension of the function.
 
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.2, 0.4, 0.4])
+    Returns:
+        (function): Function evaluating a population matrix (M x nx) which is
+            already shifted, rotated and shuffled.
+    """
+    funcs, _, optimum = _definitions[k]
+    slices = _partitions(k, nx)
 
-    y = basic.zakharov(x_parts[0])
-    y += basic.rosenbrock(x_parts[1])
-    y += basic.rastrigin(x_parts[2])
-    return y + 1100.0
+    def evaluate(x_shuffled):
+        y = funcs[0](x_shuffled[:, slices[0]])
+        for func, columns in zip(funcs[1:], slices[1:]):
+            y += func(x_shuffled[:, columns])
+        return y + optimum
 
-def f12(x, rotation=None, shift=None, shuffle=None):
+    return evaluate
+
+@functools.lru_cache(maxsize=None)
+def _partitions(k, nx):
+    # column ranges of the partitions of f(k+11), computed once per dimension
+    return tuple(_partition_slices(nx, _definitions[k][1]))
+
+def f11(x, rotation=None, shift=None, shuffle=None):
     """
-    Hybrid Function 2 (N=3)
+    Hybrid Function 1 (N=3)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -77,28 +196,33 @@ def f12(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][11]
-    if shift is None:
-        shift = transforms.shifts[11][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][1]
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(0, x.shape[1], rotation, shift, shuffle)(x), single)
 
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.3, 0.3, 0.4])
+def f12(x, rotation=None, shift=None, shuffle=None):
+    """
+    Hybrid Function 2 (N=3)
 
-    y = basic.high_conditioned_elliptic(x_parts[0])
-    y += basic.modified_schwefel(x_parts[1])
-    y += basic.bent_cigar(x_parts[2])
-    return y + 1200.0
+    Args:
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
+        rotation (matrix): Optional rotation matrix. If None (default), the
+            official matrix from the benchmark suite will be used.
+        shift (numpy.array): Optional shift vector. If None (default), the official
+            vector from the benchmark suite will be used.
+        shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
+            official permutation vector from the benchmark suite will be used.
+    """
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(1, x.shape[1], rotation, shift, shuffle)(x), single)
 
 def f13(x, rotation=None, shift=None, shuffle=None):
     """
     Hybrid Function 3 (N=3)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -106,28 +230,16 @@ def f13(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][12]
-    if shift is None:
-        shift = transforms.shifts[12][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][2]
-
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.3, 0.3, 0.4])
-
-    y = basic.bent_cigar(x_parts[0])
-    y += basic.rosenbrock(x_parts[1])
-    y += basic.lunacek_bi_rastrigin(x_parts[2])
-    return y + 1300.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(2, x.shape[1], rotation, shift, shuffle)(x), single)
 
 def f14(x, rotation=None, shift=None, shuffle=None):
     """
     Hybrid Function 4 (N=4)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -135,29 +247,16 @@ def f14(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][13]
-    if shift is None:
-        shift = transforms.shifts[13][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][3]
-
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.2, 0.2, 0.2, 0.4])
-
-    y = basic.high_conditioned_elliptic(x_parts[0])
-    y += basic.ackley(x_parts[1])
-    y += basic.schaffers_f7(x_parts[2])
-    y += basic.rastrigin(x_parts[3])
-    return y + 1400.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(3, x.shape[1], rotation, shift, shuffle)(x), single)
 
 def f15(x, rotation=None, shift=None, shuffle=None):
     """
     Hybrid Function 5 (N=4)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -165,29 +264,16 @@ def f15(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][14]
-    if shift is None:
-        shift = transforms.shifts[14][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][4]
-
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.2, 0.2, 0.3, 0.3])
-
-    y = basic.bent_cigar(x_parts[0])
-    y += basic.h_g_bat(x_parts[1])
-    y += basic.rastrigin(x_parts[2])
-    y += basic.rosenbrock(x_parts[3])
-    return y + 1500.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(4, x.shape[1], rotation, shift, shuffle)(x), single)
 
 def f16(x, rotation=None, shift=None, shuffle=None):
     """
     Hybrid Function 6 (N=4)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -195,29 +281,16 @@ def f16(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][15]
-    if shift is None:
-        shift = transforms.shifts[15][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][5]
-
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.2, 0.2, 0.3, 0.3])
-
-    y = basic.expanded_schaffers_f6(x_parts[0])
-    y += basic.h_g_bat(x_parts[1])
-    y += basic.rosenbrock(x_parts[2])
-    y += basic.modified_schwefel(x_parts[3])
-    return y + 1600.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(5, x.shape[1], rotation, shift, shuffle)(x), single)
 
 def f17(x, rotation=None, shift=None, shuffle=None):
     """
     Hybrid Function 7 (N=5)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -225,30 +298,16 @@ def f17(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][16]
-    if shift is None:
-        shift = transforms.shifts[16][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][6]
-
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.1, 0.2, 0.2, 0.2, 0.3])
-
-    y = basic.katsuura(x_parts[0])
-    y += basic.ackley(x_parts[1])
-    y += basic.expanded_griewanks_plus_rosenbrock(x_parts[2])
-    y += basic.modified_schwefel(x_parts[3])
-    y += basic.rastrigin(x_parts[4])
-    return y + 1700.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(6, x.shape[1], rotation, shift, shuffle)(x), single)
 
 def f18(x, rotation=None, shift=None, shuffle=None):
     """
     Hybrid Function 8 (N=5)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -256,30 +315,16 @@ def f18(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][17]
-    if shift is None:
-        shift = transforms.shifts[17][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][7]
-
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.2, 0.2, 0.2, 0.2, 0.2])
-
-    y = basic.high_conditioned_elliptic(x_parts[0])
-    y += basic.ackley(x_parts[1])
-    y += basic.rastrigin(x_parts[2])
-    y += basic.h_g_bat(x_parts[3])
-    y += basic.discus(x_parts[4])
-    return y + 1800.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(7, x.shape[1], rotation, shift, shuffle)(x), single)
 
 def f19(x, rotation=None, shift=None, shuffle=None):
     """
     Hybrid Function 9 (N=5)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -287,30 +332,16 @@ def f19(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][18]
-    if shift is None:
-        shift = transforms.shifts[18][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][8]
-
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.2, 0.2, 0.2, 0.2, 0.2])
-
-    y = basic.bent_cigar(x_parts[0])
-    y += basic.rastrigin(x_parts[1])
-    y += basic.expanded_griewanks_plus_rosenbrock(x_parts[2])
-    y += basic.weierstrass(x_parts[3])
-    y += basic.expanded_schaffers_f6(x_parts[4])
-    return y + 1900.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(8, x.shape[1], rotation, shift, shuffle)(x), single)
 
 def f20(x, rotation=None, shift=None, shuffle=None):
     """
     Hybrid Function 10 (N=6)
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -318,24 +349,8 @@ def f20(x, rotation=None, shift=None, shuffle=None):
         shuffle (numpy.array): Optionbal shuffle vector. If None (default), the
             official permutation vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][19]
-    if shift is None:
-        shift = transforms.shifts[19][:nx]
-    if shuffle is None:
-        shuffle = transforms.shuffles[nx][9]
-
-    x_transformed = np.matmul(rotation, x - shift)
-    x_parts = _shuffle_and_partition(x_transformed, shuffle, [0.1, 0.1, 0.2, 0.2, 0.2, 0.2])
-
-    y = basic.happy_cat(x_parts[0])
-    y += basic.katsuura(x_parts[1])
-    y += basic.ackley(x_parts[2])
-    y += basic.rastrigin(x_parts[3])
-    y += basic.modified_schwefel(x_parts[4])
-    y += basic.schaffers_f7(x_parts[5])
-    return y + 2000.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(9, x.shape[1], rotation, shift, shuffle)(x), single)
 
 all_functions = [
     f11,
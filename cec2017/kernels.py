@@ -0,0 +1,220 @@
+# cec2017.kernels
+# Vectorized versions of the basic functions from cec2017.basic
+# Every kernel takes a population matrix (M x D) holding one individual per row
+# and returns a vector of M values. The results match the reference
+# implementations in cec2017.basic, including their known quirks.
+
+import numpy as np
+
+# Precomputed tables of the weierstrass function
+_WEIERSTRASS_AK = 0.5**np.arange(start=0, stop=21, step=1)
+_WEIERSTRASS_BK = np.pi * (3.0**np.arange(start=0, stop=21, step=1))
+_WEIERSTRASS_OFFSET = np.sum(_WEIERSTRASS_AK * np.cos(_WEIERSTRASS_BK))
+
+# Precomputed table of the katsuura function
+_KATSUURA_TJ = 2.0**np.arange(start=1, stop=33, step=1)
+
+def _indices(nx):
+    # 1-based indices of the coordinates
+    return np.arange(start=1, stop=nx+1, dtype=np.float64)
+
+def bent_cigar(x):
+    return x[:, 0]*x[:, 0] + 10e6*np.sum(x[:, 1:]*x[:, 1:], axis=1)
+
+def sum_diff_pow(x):
+    return np.sum(np.abs(x)**_indices(x.shape[1]), axis=1)
+
+def zakharov(x):
+    sms = np.sum(x*x, axis=1)
+    # Note: the i+1 term is not in the CEC function definitions, but is
+    # in the code and in any definition you find online
+    sm = 0.5 * np.sum(_indices(x.shape[1])*x, axis=1)
+    sm = sm * sm
+    return sms + sm + (sm * sm)
+
+def rosenbrock(x):
+    x = 0.02048 * x + 1.0
+    t1 = x[:, :-1]*x[:, :-1] - x[:, 1:]
+    t2 = x[:, :-1] - 1
+    return np.sum(100*t1*t1 + t2*t2, axis=1)
+
+def rastrigin(x):
+    # Note: the 0.0512 shrinking is omitted in the problem definitions but is
+    # present in the provided code
+    x = 0.0512 * x
+    return np.sum(x*x - 10*np.cos(2.0*np.pi*x), axis=1) + 10*x.shape[1]
+
+def expanded_schaffers_f6(x):
+    t = x[:, :-1]*x[:, :-1] + x[:, 1:]*x[:, 1:]
+    t1 = np.sin(np.sqrt(t))
+    t1 = t1*t1 - 0.5
+    t2 = 1 + 0.001*t
+    return np.sum(0.5 + t1/(t2*t2), axis=1)
+
+def lunacek_bi_rastrigin(x, shift=None, rotation=None):
+    # a special case; we need the shift vector and rotation matrix
+    nx = x.shape[1]
+    if shift is None:
+        shift = np.zeros(nx)
+
+    # calculate the coefficients
+    mu0 = 2.5
+    s = 1 - 1 / (2 * ((nx+20)**0.5) - 8.2)
+    mu1 = -((mu0*mu0-1)/s)**0.5
+
+    # shift, scale and mirror the coordinates with negative shift
+    z = 2 * (0.1 * (x - shift))
+    z = np.where(shift < 0.0, -z, z)
+    tmpx = z + mu0
+
+    t1 = np.sum((tmpx-mu0)**2, axis=1)
+    t2 = s*np.sum((tmpx-mu1)**2, axis=1) + nx
+
+    y = z if rotation is None else np.matmul(z, rotation.T)
+    t = np.sum(np.cos(2.0*np.pi*y), axis=1)
+
+    return np.minimum(t1, t2) + 10.0*(nx-t)
+
+def non_cont_rastrigin(x, shift=None, rotation=None):
+    # a special case; we need the shift vector and rotation matrix
+    if shift is None:
+        shift = np.zeros(x.shape[1])
+
+    d = x - shift
+    x = np.where(np.abs(d) > 0.5, shift + np.floor(2*d+0.5)/2, x)
+
+    z = 0.0512 * (x - shift)
+    z = z if rotation is None else np.matmul(z, rotation.T)
+
+    return np.sum(z*z - 10.0*np.cos(2.0*np.pi*z) + 10.0, axis=1)
+
+def levy(x):
+    # Note: the function definitions state to scale by 5.12/100, but the code
+    # doesn't do this, and the example graph in the definitions correspond to
+    # the version without scaling
+    # x = 0.0512 * x
+    w = 1.0 + 0.25*(x - 1.0)
+
+    term1 = (np.sin(np.pi*w[:, 0]))**2
+    term3 = ((w[:, -1] - 1)**2) * (1 + ((np.sin(2*np.pi*w[:, -1]))**2))
+
+    wi = w[:, :-1]
+    sm = np.sum(((wi-1)**2) * (1 + 10*((np.sin(np.pi*wi+1))**2)), axis=1)
+
+    return term1 + sm + term3
+
+def modified_schwefel(x):
+    nx = x.shape[1]
+    x = 10.0 * x # scale to search range
+    z = x + 420.9687462275036
+    below = z < -500
+    above = z > 500
+    # values outside [-500, 500] are folded back and penalized
+    zm = np.where(below, np.mod(np.abs(z), 500) - 500, z)
+    zm = np.where(above, 500 - np.mod(z, 500), zm)
+    t = z - np.clip(z, -500, 500)
+    penalty = np.where(below | above, t*t / (10000*nx), 0.0)
+    sm = np.sum(zm * np.sin(np.sqrt(np.abs(zm))) - penalty, axis=1)
+    return 418.9829*nx - sm
+
+def high_conditioned_elliptic(x):
+    nx = x.shape[1]
+    factor = 6 / (nx - 1)
+    return np.sum(x*x * 10**(np.arange(nx)*factor), axis=1)
+
+def discus(x):
+    return 1e+6*x[:, 0]*x[:, 0] + np.sum(x[:, 1:]*x[:, 1:], axis=1)
+
+def ackley(x):
+    inx = 1/x.shape[1]
+    smsq = np.sum(x*x, axis=1)
+    smcs = np.sum(np.cos((2*np.pi)*x), axis=1)
+    return -20*np.exp(-0.2*np.sqrt(inx*smsq)) - np.exp(inx*smcs) + 20 + np.e
+
+def weierstrass(x):
+    x = 0.005 * x
+    kcs = np.cos(2*(x[:, :, np.newaxis]+0.5)*_WEIERSTRASS_BK)
+    sm = np.sum(np.matmul(kcs, _WEIERSTRASS_AK), axis=1)
+    return sm - x.shape[1]*_WEIERSTRASS_OFFSET
+
+def griewank(x):
+    x = 6.0 * x
+    factor = 1/4000
+    cs = np.cos(x / _indices(x.shape[1]))
+    return np.sum(factor*x*x, axis=1) - np.prod(cs, axis=1) + 1
+
+def katsuura(x):
+    x = 0.05 * x
+    nx = x.shape[1]
+    pw = 10/(nx**1.2)
+    tjx = x[:, :, np.newaxis]*_KATSUURA_TJ
+    tsm = np.sum(np.abs(tjx - np.round(tjx)) / _KATSUURA_TJ, axis=2)
+    prd = np.prod((1 + _indices(nx)*tsm)**pw, axis=1)
+    df = 10/(nx*nx)
+    return df*prd - df
+
+def happy_cat(x):
+    x = (0.05 * x) - 1
+    nx = x.shape[1]
+    sm = np.sum(x, axis=1)
+    smsq = np.sum(x*x, axis=1)
+    return (np.abs(smsq - nx))**0.25 + (0.5*smsq + sm)/nx + 0.5
+
+def h_g_bat(x):
+    x = (0.05 * x) - 1
+    nx = x.shape[1]
+    sm = np.sum(x, axis=1)
+    smsq = np.sum(x*x, axis=1)
+    return (np.abs(smsq*smsq - sm*sm))**0.5 + (0.5*smsq + sm)/nx + 0.5
+
+def expanded_griewanks_plus_rosenbrock(x):
+    x = (0.05 * x) + 1
+    nx = x.shape[1]
+
+    tmp1 = x[:, :-1]*x[:, :-1] - x[:, 1:]
+    tmp2 = x[:, :-1] - 1.0
+    temp = 100*tmp1*tmp1 + tmp2*tmp2
+    sm = np.sum((temp*temp)/4000.0 - np.cos(temp) + 1, axis=1)
+
+    # Note: the reference implementation adds the wrap-around term inside the
+    # loop, i.e. once per coordinate pair; kept for consistency
+    tmp1 = x[:, -1]*x[:, -1] - x[:, 0]
+    tmp2 = x[:, -1] - 1
+    temp = 100.0*tmp1*tmp1 + tmp2*tmp2
+    return sm + (nx-1)*((temp*temp)/4000.0 - np.cos(temp) + 1.0)
+
+def schaffers_f7(x):
+    nx = x.shape[1]
+    # Note: the function definitions state to scale by 0.5/100, but the code
+    # doesn't do this, and the example graph in the definitions correspond to
+    # the version without scaling
+    # x = 0.005 * x
+    si = (x[:, :-1]*x[:, :-1] + x[:, 1:]*x[:, 1:])**0.5
+    tmp = np.sin(50.0*(si**0.2))
+    # Note: the original code has this error here (tmp shouldn't be squared)
+    # that I'm keeping for consistency.
+    sm = np.sum((si**0.5) * (tmp*tmp + 1), axis=1)
+    return (sm*sm) / (nx*nx - 2*nx + 1)
+
+all_functions = [
+    bent_cigar,
+    sum_diff_pow,
+    zakharov,
+    rosenbrock,
+    rastrigin,
+    expanded_schaffers_f6,
+    lunacek_bi_rastrigin,
+    non_cont_rastrigin,
+    levy,
+    modified_schwefel,
+    high_conditioned_elliptic,
+    discus,
+    ackley,
+    weierstrass,
+    griewank,
+    katsuura,
+    happy_cat,
+    h_g_bat,
+    expanded_griewanks_plus_rosenbrock,
+    schaffers_f7
+]
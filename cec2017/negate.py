@@ -1,3 +1,4 @@
+from functools import partial
 from hints.aliases import ObjectiveFunction
 
 
@@ -10,6 +11,10 @@ def negate(f: ObjectiveFunction) -> ObjectiveFunction:
 
     :param f: function which will be negated
 
-    :return: Negated function f
+    :return: Negated function f, which can be pickled if f can be
     """
-    return lambda x: -f(x)
+    return partial(_negated, f)
+
+
+def _negated(f: ObjectiveFunction, x):
+    return -f(x)
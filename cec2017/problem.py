@@ -0,0 +1,102 @@
+# cec2017.problem
+# Benchmark functions bound to a single dimension, with all transformation
+# data resolved once instead of on every call
+
+import numpy as np
+from . import batch
+from . import transforms
+from . import simple
+from . import hybrid
+from . import composition
+
+class Problem:
+    """
+    CEC2017 function f1 to f30 bound to a single dimension.
+
+    The rotations, shifts, shuffles, partitions and composition constants are
+    resolved once on construction and stored as read-only contiguous arrays.
+    Problems are created with make_problem. Pickled problems hold only the
+    function number, the dimension and the optional transformations, the
+    rest is resolved again when unpickling (e.g. in worker processes).
+    """
+
+    def __init__(self, fid, dimension, evaluate, transforms=None):
+        self.fid = fid
+        self.dimension = dimension
+        self.__evaluate = evaluate
+        self.__transforms = transforms if transforms is not None else {}
+
+    def __call__(self, x):
+        """
+        Evaluates a single vector or a population matrix (M x D).
+
+        Returns:
+            The value for a single vector or a vector of M values.
+        """
+        x, single = batch.as_population(x)
+        return batch.unwrap(self.evaluate(x), single)
+
+    def evaluate(self, population):
+        """
+        Evaluates a population matrix (M x D) holding one individual per row.
+
+        Returns:
+            (numpy.array): Values of the individuals (M).
+        """
+        if population.shape[1] != self.dimension:
+            raise ValueError(f'expected dimension {self.dimension}, got {population.shape[1]}')
+        return self.__evaluate(population)
+
+    def __reduce__(self):
+        return _restore_problem, (self.fid, self.dimension, self.__transforms)
+
+    def __repr__(self):
+        return f'Problem(f{self.fid}, dimension={self.dimension})'
+
+def make_problem(fid, dimension, **kwargs):
+    """
+    Creates the problem of the function f<fid> in the given dimension.
+
+    Args:
+        fid (int): Number of the function, 1 to 30.
+        dimension (int): Dimension of the problem, 2, 10, 20, 30, 50 or 100.
+        kwargs: Optional transformations overriding the official ones, named
+            like the arguments of the function (e.g. rotation and shift for
+            f1, rotations, shifts and shuffles for f29).
+
+    Returns:
+        (Problem): The problem.
+    """
+    if 1 <= fid <= 10:
+        evaluate = simple._compile(fid - 1, dimension, **kwargs)
+    elif 11 <= fid <= 20:
+        evaluate = hybrid._compile(fid - 11, dimension, **kwargs)
+    elif 21 <= fid <= 30:
+        evaluate = composition._compile(fid - 21, dimension, **kwargs)
+    else:
+        raise ValueError(f'invalid function number: {fid}')
+    # Copies of the transformations are kept for pickling, so later changes of the originals do not affect them.
+    transforms = {key: np.array(value) for key, value in kwargs.items() if value is not None}
+    return Problem(fid, dimension, evaluate, transforms)
+
+def has_data(fid, dimension):
+    """
+    Checks whether the benchmark data of the function f<fid> exists in the given dimension.
+
+    The data is not loaded, e.g. f11 to f20 have no shuffles in dimensions 2 and 20.
+
+    Args:
+        fid (int): Number of the function.
+        dimension (int): Dimension of the problem.
+
+    Returns:
+        (bool): Whether make_problem can create the problem with the official transformations.
+    """
+    if 1 <= fid <= 20:
+        return dimension in transforms.rotations and (fid <= 10 or dimension in transforms.shuffles)
+    if 21 <= fid <= 30:
+        return dimension in transforms.rotations_cf and (fid <= 28 or dimension in transforms.shuffles_cf)
+    return False
+
+def _restore_problem(fid, dimension, transforms):
+    return make_problem(fid, dimension, **transforms)
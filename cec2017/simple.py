@@ -1,37 +1,87 @@
 # cec2017.simple
 # Author: Duncan Tilley
 # Simple function definitions, f1 to f10
+# Every function accepts a single vector or a population matrix (M x D) holding
+# one individual per row, in which case a vector of M values is returned.
 
-from . import basic
+from . import batch
+from . import kernels
 from . import transforms
 
-import numpy as np
+import functools
+
+# Basic function and optimum value of f1 to f10
+_definitions = [
+    (kernels.bent_cigar, 100.0),
+    (kernels.sum_diff_pow, 200.0),
+    (kernels.zakharov, 300.0),
+    (kernels.rosenbrock, 400.0),
+    (kernels.rastrigin, 500.0),
+    (kernels.schaffers_f7, 600.0),
+    (kernels.lunacek_bi_rastrigin, 700.0),
+    (kernels.non_cont_rastrigin, 800.0),
+    (kernels.levy, 900.0),
+    (kernels.modified_schwefel, 1000.0)
+]
 
-def f1(x, rotation=None, shift=None):
+def _compile(k, nx, rotation=None, shift=None):
     """
-    Shifted and Rotated Bent Cigar Function
+    Binds the transformations and constants of the function f(k+1) for the
+    given dimension, so they are resolved only once.
 
     Args:
-        x (numpy.numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        k (int): Index of the function (0 for f1).
+        nx (int): Dimension of the function.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
+
+    Returns:
+        (function): Function evaluating a population matrix (M x nx).
     """
-    nx = len(x)
+    if rotation is None and shift is None:
+        return _compile_official(k, nx)
     if rotation is None:
-        rotation = transforms.rotations[nx][0]
+        rotation = transforms.rotations[nx][k]
     if shift is None:
-        shift = transforms.shifts[0][:nx]
-    x_transformed = np.matmul(rotation, x - shift)
-    return basic.bent_cigar(x_transformed) + 100.0
+        shift = transforms.shifts[k][:nx]
+    rotation = batch.frozen(rotation)
+    shift = batch.frozen(shift)
+    kernel, optimum = _definitions[k]
+
+    if kernel in (kernels.lunacek_bi_rastrigin, kernels.non_cont_rastrigin):
+        # pass the shift and rotation directly to the function
+        return lambda x: kernel(x, shift, rotation) + optimum
+    return lambda x: kernel(batch.shift_rotate(x, shift, rotation)) + optimum
+
+@functools.lru_cache(maxsize=None)
+def _compile_official(k, nx):
+    # the official data is bound only once per dimension
+    return _compile(k, nx, transforms.rotations[nx][k], transforms.shifts[k][:nx])
+
+def f1(x, rotation=None, shift=None):
+    """
+    Shifted and Rotated Bent Cigar Function
+
+    Args:
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
+        rotation (matrix): Optional rotation matrix. If None (default), the
+            official matrix from the benchmark suite will be used.
+        shift (numpy.array): Optional shift vector. If None (default), the official
+            vector from the benchmark suite will be used.
+    """
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(0, x.shape[1], rotation, shift)(x), single)
 
 def f2(x, rotation=None, shift=None):
     """
     (Deprecated) Shifted and Rotated Sum of Different Power Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
@@ -41,165 +91,128 @@ def f2(x, rotation=None, shift=None):
         f2.warned = True
         print('WARNING: f2 has been deprecated from the CEC 2017 benchmark suite')
 
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][1]
-    if shift is None:
-        shift = transforms.shifts[1][:nx]
-    x_transformed = np.matmul(rotation, x - shift)
-    return basic.sum_diff_pow(x_transformed) + 200.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(1, x.shape[1], rotation, shift)(x), single)
 
 def f3(x, rotation=None, shift=None):
     """
     Shifted and Rotated Zakharov Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][2]
-    if shift is None:
-        shift = transforms.shifts[2][:nx]
-    x_transformed = np.matmul(rotation, x - shift)
-    return basic.zakharov(x_transformed) + 300.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(2, x.shape[1], rotation, shift)(x), single)
 
 def f4(x, rotation=None, shift=None):
     """
     Shifted and Rotated Rosenbrock’s Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][3]
-    if shift is None:
-        shift = transforms.shifts[3][:nx]
-    x_transformed = np.matmul(rotation, (x - shift))
-    return basic.rosenbrock(x_transformed) + 400.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(3, x.shape[1], rotation, shift)(x), single)
 
 def f5(x, rotation=None, shift=None):
     """
     Shifted and Rotated Rastrigin's Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][4]
-    if shift is None:
-        shift = transforms.shifts[4][:nx]
-    x_transformed = np.matmul(rotation, (x - shift))
-    return basic.rastrigin(x_transformed) + 500.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(4, x.shape[1], rotation, shift)(x), single)
 
 def f6(x, rotation=None, shift=None):
     """
     Shifted and Rotated Schaffer’s F7 Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][5]
-    if shift is None:
-        shift = transforms.shifts[5][:nx]
-    x_transformed = np.matmul(rotation, (x - shift))
-    return basic.schaffers_f7(x_transformed) + 600.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(5, x.shape[1], rotation, shift)(x), single)
 
 def f7(x, rotation=None, shift=None):
     """
     Shifted and Rotated Lunacek Bi-Rastrigin’s Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][6]
-    if shift is None:
-        shift = transforms.shifts[6][:nx]
-    # pass the shift and rotation directly to the function
-    return basic.lunacek_bi_rastrigin(x, shift, rotation) + 700.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(6, x.shape[1], rotation, shift)(x), single)
 
 def f8(x, rotation=None, shift=None):
     """
     Shifted and Rotated Non-Continuous Rastrigin’s Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][7]
-    if shift is None:
-        shift = transforms.shifts[7][:nx]
-    # pass the shift and rotation directly to the function
-    return basic.non_cont_rastrigin(x, shift, rotation) + 800.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(7, x.shape[1], rotation, shift)(x), single)
 
 def f9(x, rotation=None, shift=None):
     """
     Shifted and Rotated Levy Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][8]
-    if shift is None:
-        shift = transforms.shifts[8][:nx]
-    x_transformed = np.matmul(rotation, (x - shift))
-    return basic.levy(x_transformed) + 900.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(8, x.shape[1], rotation, shift)(x), single)
 
 def f10(x, rotation=None, shift=None):
     """
     Shifted and Rotated Schwefel’s Function
 
     Args:
-        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100.
+        x (numpy.array): Input vector of dimension 2, 10, 20, 30, 50 or 100,
+            or a matrix (M x D) of M such vectors stored as rows.
         rotation (matrix): Optional rotation matrix. If None (default), the
             official matrix from the benchmark suite will be used.
         shift (numpy.array): Optional shift vector. If None (default), the official
             vector from the benchmark suite will be used.
     """
-    nx = len(x)
-    if rotation is None:
-        rotation = transforms.rotations[nx][9]
-    if shift is None:
-        shift = transforms.shifts[9][:nx]
-    x_transformed = np.matmul(rotation, (x - shift))
-    return basic.modified_schwefel(x_transformed) + 1000.0
+    x, single = batch.as_population(x)
+    return batch.unwrap(_compile(9, x.shape[1], rotation, shift)(x), single)
 
 all_functions = [
     f1,
@@ -3,58 +3,154 @@
 # Contains rotation, shift and shuffle data loaded from data.pkl.
 # Note that these correspond to the many .txt files provided along with the
 # original implementation and should be used for final benchmark results.
+#
+# The data is kept as one .npy file per array in the data directory, created
+# from data.pkl on first use (or with python -m cec2017.transforms). Arrays are
+# memory-mapped lazily when first accessed, so importing this module is cheap
+# and processes using the same dimension share the pages.
+
+from collections.abc import Mapping
 
 import numpy as np
 import pickle
 import os
 
-with open(os.path.join(os.path.dirname(__file__), 'data.pkl'), 'rb') as _pkl_file:
-    _pkl = pickle.load(_pkl_file)
+_PKL_PATH = os.path.join(os.path.dirname(__file__), 'data.pkl')
+_DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+# Used only when the data directory cannot be created
+_pkl = None
+
+def convert_pickle(pkl_path=_PKL_PATH, data_dir=_DATA_DIR):
+    """
+    Converts the pickled data into .npy files which can be memory-mapped.
+
+    Args:
+        pkl_path (str): Path to the pickled dictionary of arrays.
+        data_dir (str): Directory where the .npy files will be stored.
+    """
+    with open(pkl_path, 'rb') as pkl_file:
+        pkl = pickle.load(pkl_file)
+    os.makedirs(data_dir, exist_ok=True)
+    for name, array in pkl.items():
+        path = os.path.join(data_dir, name + '.npy')
+        # write to a temporary file first, so that concurrent processes never
+        # map a partially written file
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as npy_file:
+            np.save(npy_file, np.ascontiguousarray(array), allow_pickle=False)
+        os.replace(tmp_path, path)
+
+def load(name, data_dir=_DATA_DIR):
+    """
+    Loads a single array of the benchmark data as a read-only memory map.
+
+    Args:
+        name (str): Name of the array, e.g. M_D10 or shift.
+        data_dir (str): Directory containing the .npy files.
+
+    Returns:
+        (numpy.array): The read-only array.
+    """
+    global _pkl
+    path = os.path.join(data_dir, name + '.npy')
+    if not os.path.exists(path):
+        try:
+            convert_pickle(data_dir=data_dir)
+        except OSError:
+            # read-only installation, fall back to keeping data.pkl in memory
+            if _pkl is None:
+                with open(_PKL_PATH, 'rb') as pkl_file:
+                    _pkl = pickle.load(pkl_file)
+            array = _pkl[name].view()
+            array.flags.writeable = False
+            return array
+    return np.load(path, mmap_mode='r')
+
+class LazyArrays(Mapping):
+    """
+    Mapping from dimension to the array of that dimension, loaded on first
+    access.
+    """
+
+    def __init__(self, names, loader=load):
+        self.__names = names
+        self.__loader = loader
+        self.__arrays = {}
+
+    def __getitem__(self, nx):
+        array = self.__arrays.get(nx)
+        if array is None:
+            array = self.__loader(self.__names[nx])
+            self.__arrays[nx] = array
+        return array
+
+    def __iter__(self):
+        return iter(self.__names)
+
+    def __len__(self):
+        return len(self.__names)
 
 # Each has shape (20, N, N) containing an N-dimensional rotation matrix
 # for functions f1 to f20
-rotations = {
-    2: _pkl['M_D2'],
-    10: _pkl['M_D10'],
-    20: _pkl['M_D20'],
-    30: _pkl['M_D30'],
-    50: _pkl['M_D50'],
-    100: _pkl['M_D100']
-}
+rotations = LazyArrays({
+    2: 'M_D2',
+    10: 'M_D10',
+    20: 'M_D20',
+    30: 'M_D30',
+    50: 'M_D50',
+    100: 'M_D100'
+})
 
 # Each has shape (10, 10, N, N) containing 10 N-dimensional rotation matrices
 # for functions f21 to f30
-rotations_cf = {
-    2: _pkl['M_cf_d2'],
-    10: _pkl['M_cf_D10'],
-    20: _pkl['M_cf_D20'],
-    30: _pkl['M_cf_D30'],
-    50: _pkl['M_cf_D50'],
-    100: _pkl['M_cf_D100']
-}
+rotations_cf = LazyArrays({
+    2: 'M_cf_d2',
+    10: 'M_cf_D10',
+    20: 'M_cf_D20',
+    30: 'M_cf_D30',
+    50: 'M_cf_D50',
+    100: 'M_cf_D100'
+})
 
 # Shape (20, 100)
 # Contains 100-dimension shift vectors for functions f1 to f20
-shifts = _pkl['shift']
+# shifts (loaded on first access)
 
 # Shape (10, 10, 100)
 # Contains 10 100-dimension shift vectors for functions f21 to f30
-shifts_cf = _pkl['shift_cf']
+# shifts_cf (loaded on first access)
+
+_lazy_attributes = {
+    'shifts': 'shift',
+    'shifts_cf': 'shift_cf'
+}
+
+def __getattr__(name):
+    if name not in _lazy_attributes:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    array = load(_lazy_attributes[name])
+    # later accesses do not go through this function
+    globals()[name] = array
+    return array
 
 # Each has shape (10, N) containing N-dimensional permutations for functions f11
 # to f20 (note: the original were 1-indexed, these are 0-indexed)
-shuffles = {
-    10: _pkl['shuffle_D10'],
-    30: _pkl['shuffle_D30'],
-    50: _pkl['shuffle_D50'],
-    100: _pkl['shuffle_D100']
-}
+shuffles = LazyArrays({
+    10: 'shuffle_D10',
+    30: 'shuffle_D30',
+    50: 'shuffle_D50',
+    100: 'shuffle_D100'
+})
 
 # Each has shape (2, 10, N) containing 10 N-dimensional permutations for
 # functions f29 and f30 (note: the original were 1-indexed, these are 0-indexed)
-shuffles_cf = {
-    10: _pkl['shuffle_cf_D10'],
-    30: _pkl['shuffle_cf_D30'],
-    50: _pkl['shuffle_cf_D50'],
-    100: _pkl['shuffle_cf_D100']
-}
+shuffles_cf = LazyArrays({
+    10: 'shuffle_cf_D10',
+    30: 'shuffle_cf_D30',
+    50: 'shuffle_cf_D50',
+    100: 'shuffle_cf_D100'
+})
+
+if __name__ == '__main__':
+    convert_pickle()
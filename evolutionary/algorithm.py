@@ -1,7 +1,11 @@
-import random
+import os
+import pickle
 import numpy as np
 from logger.regular import Logger
 from evolutionary.strategies import Strategy
+from evolutionary.evaluators import Evaluator, SerialEvaluator, CountingEvaluator, CachingEvaluator
+from evolutionary.termination import TerminationCriterion, RunState
+from population.array import PopulationArray
 from hints.aliases import *
 
 
@@ -13,6 +17,9 @@ class EvolutionaryAlgorithm:
     information visit this Wikipedia page [1].
 
     [1]: https://en.wikipedia.org/wiki/Genetic_algorithm
+
+    The run lasts for the iterations count, unless any of the termination
+    criteria is met earlier.
     """
 
     def __init__(self,
@@ -24,17 +31,32 @@ class EvolutionaryAlgorithm:
                  iterations: int = 500,
                  population_size: int = 100,
                  logger: type(Logger) | None = None,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 tournament_size: int = 2,
+                 evaluator: Evaluator | None = None,
+                 rng: np.random.Generator | int | None = None,
+                 termination: list[TerminationCriterion] | None = None,
+                 cache_size: int | None = None):
         # Default values should be changed after algorithm tuning.
         self.__obj_fun = objective_function
         self.__strategy = strategy
         self.__mutation_strength = mutation_strength
         self.__crossover_probability = crossover_probability
         self.__elite_size = elite_size
+        self.__tournament_size = tournament_size
         self.__iterations = iterations
         self.__population_size = population_size
         self.__logger = logger
         self.__verbose = verbose
+        self.__evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.__rng = np.random.default_rng(rng)
+        self.__termination = termination if termination is not None else []
+        self.__cache_size = cache_size
+        self.__counting_evaluator = CountingEvaluator(self.__evaluator)
+        self.__cache = None
+        self.__iterations_done = 0
+        self.__checkpoint_path = None
+        self.__checkpoint_interval = 0
         self.__best_individual_with_score = None
 
     def set_strategy(self, strategy: type(Strategy) | None) -> None:
@@ -55,48 +77,195 @@ class EvolutionaryAlgorithm:
         """
         self.__obj_fun = objective_function
 
-    def run(self, init_population: Population) -> EvaluatedIndividual:
+    def set_rng(self, rng: np.random.Generator | int | None) -> None:
+        """
+        Sets the new random generator (or seed of the generator) used by the algorithm and its strategy.
+        """
+        self.__rng = np.random.default_rng(rng)
+
+    def set_evaluator(self, evaluator: Evaluator) -> None:
+        """
+        Sets the new evaluator used by the algorithm and its strategy.
+        """
+        self.__evaluator = evaluator
+
+    def set_termination(self, termination: list[TerminationCriterion]) -> None:
+        """
+        Sets the new termination criteria, the run stops as soon as any of them is met.
+        """
+        self.__termination = termination
+
+    def set_cache_size(self, cache_size: int | None) -> None:
+        """
+        Sets the size of the cache of the objective function values, None disables caching.
+
+        Values of the copies of recently evaluated individuals are taken from the
+        cache instead of evaluating them again. The cache is cleared with every run.
+        """
+        self.__cache_size = cache_size
+
+    def get_cache_statistics(self) -> tuple[int, int]:
+        """
+        Returns the numbers of cache hits and misses of the last run, zeros if caching is disabled.
+        """
+        if self.__cache is None:
+            return 0, 0
+        return self.__cache.get_hits(), self.__cache.get_misses()
+
+    def get_evaluations(self) -> int:
+        """
+        Returns the number of objective function evaluations of the last run, including evaluations of the strategy.
+
+        Values taken from the cache are not counted.
+        """
+        return self.__counting_evaluator.get_evaluations()
+
+    def get_population_size(self) -> int:
+        """
+        Returns the size of the population, the initial population has to be of this size.
+        """
+        return self.__population_size
+
+    def get_iterations(self) -> int:
+        """
+        Returns the number of iterations performed in the last run.
+        """
+        return self.__iterations_done
+
+    def set_checkpointing(self, checkpoint_path: str | None, checkpoint_interval: int = 50) -> None:
+        """
+        Sets periodic storing of the algorithm state into the checkpoint file.
+
+        The checkpoint holds the population, the best individual, the iteration index,
+        the logged data, the state of the random generator, the evaluation counter, the
+        cached objective function values and the state of the strategy, so the run continued
+        with resume method gives exactly the same results as the uninterrupted one.
+
+        :param checkpoint_path: path to the checkpoint file, None disables checkpointing
+        :param checkpoint_interval: number of iterations between subsequent checkpoints
+        """
+        if checkpoint_path is not None and checkpoint_interval < 1:
+            raise RuntimeError(f'invalid checkpoint interval: {checkpoint_interval}')
+        self.__checkpoint_path = checkpoint_path
+        self.__checkpoint_interval = checkpoint_interval
+
+    def run(self, init_population: Population | Genomes) -> EvaluatedIndividual:
         """
         Perform the EvolutionaryAlgorithm execution.
 
         IMPORTANT: Initial population size must match the evolutionary algorithm
         population size parameter.
 
-        :param init_population: initial population for the start-up
+        :param init_population: initial population for the start-up, list of individuals or matrix
+                                holding an individual in every row
         :return: the best achieved individual with evaluation
         """
         self.__clean_up()
         self.__ensure_objective_function()
         self.__prepare_strategy()
+        if self.__strategy is not None:
+            self.__strategy.clean_up()
         self.__ensure_legit_size(init_population)
+        for criterion in self.__termination:
+            criterion.start()
         # Initial evaluation for algorithm start-up.
-        old_eval_population = self.__evaluate_population(init_population)
+        old_population = self.__evaluate_population(np.asarray(init_population, dtype=np.float64))
+        return self.__run_iterations(old_population, 0)
+
+    def resume(self, checkpoint_path: str) -> EvaluatedIndividual:
+        """
+        Continues the EvolutionaryAlgorithm execution from the checkpoint.
 
-        for i in range(self.__iterations):
+        The algorithm has to be configured the same way as the one which stored the checkpoint.
+
+        :param checkpoint_path: path to the checkpoint file stored during the interrupted run
+        :return: the best achieved individual with evaluation
+        """
+        with open(checkpoint_path, 'rb') as checkpoint_file:
+            checkpoint = pickle.load(checkpoint_file)
+        self.__clean_up()
+        self.__ensure_objective_function()
+        self.__prepare_strategy()
+        self.__counting_evaluator.set_evaluations(checkpoint['evaluations'])
+        self.__termination = checkpoint['termination']
+        for criterion in self.__termination:
+            criterion.resume()
+        if self.__cache is not None and checkpoint['cache'] is not None:
+            self.__cache.set_state(checkpoint['cache'])
+        if self.__strategy is not None and checkpoint['strategy'] is not None:
+            self.__strategy.set_state(checkpoint['strategy'])
+        self.__best_individual_with_score = checkpoint['best_individual_with_score']
+        if self.__logger is not None:
+            self.__logger.set_state(checkpoint['log'])
+        self.__rng.bit_generator.state = checkpoint['rng_state']
+        old_population = PopulationArray(checkpoint['genomes'], checkpoint['fitness'])
+        return self.__run_iterations(old_population, checkpoint['iteration'])
+
+    def __run_iterations(self, old_population: PopulationArray, first_iteration: int) -> EvaluatedIndividual:
+        for i in range(first_iteration, self.__iterations):
             # Strategy is applied as the first step of the algorithm.
             if self.__strategy is not None:
-                old_eval_population = self.__strategy.modify_evaluated_population(old_eval_population)
+                old_population = self.__strategy.modify_population(old_population)
             # Regular genetic algorithm steps follow.
-            new_eval_population = self.__generate_new_evaluated_population(old_eval_population)
+            new_population = self.__generate_new_population(old_population)
             # Since we use elite succession we can select best individual this way.
-            self.__pick_best_individual(new_eval_population)
+            self.__pick_best_individual(new_population)
             # Logs storing for further algorithm analysis.
             if self.__logger is not None:
-                self.__logger.generate_new_log_entry(new_eval_population)
+                self.__logger.generate_new_log_entry(new_population)
             if self.__verbose:
                 print(f'Iteration {i + 1} finished')
             # New population becomes the old one for next iteration.
-            old_eval_population = new_eval_population
+            old_population = new_population
+            self.__iterations_done = i + 1
+            if self.__checkpoint_path is not None and (i + 1) % self.__checkpoint_interval == 0:
+                self.__store_checkpoint(old_population, i + 1)
+            if self.__should_terminate(old_population):
+                break
 
         return self.__best_individual_with_score
 
+    def __should_terminate(self, population: PopulationArray) -> bool:
+        state = RunState(
+            self.__iterations_done,
+            self.__counting_evaluator.get_evaluations(),
+            self.__best_individual_with_score[1],
+            population.genomes.shape[1]
+        )
+        return any(criterion.is_met(state) for criterion in self.__termination)
+
+    def __store_checkpoint(self, population: PopulationArray, iteration: int) -> None:
+        checkpoint = {
+            'iteration': iteration,
+            'genomes': population.genomes,
+            'fitness': population.fitness,
+            'best_individual_with_score': self.__best_individual_with_score,
+            'log': self.__logger.get_state() if self.__logger is not None else None,
+            'rng_state': self.__rng.bit_generator.state,
+            'evaluations': self.__counting_evaluator.get_evaluations(),
+            'termination': self.__termination,
+            'cache': self.__cache.get_state() if self.__cache is not None else None,
+            'strategy': self.__strategy.get_state() if self.__strategy is not None else None
+        }
+        # Writing to a temporary file first, so that interruption never leaves a partial checkpoint.
+        tmp_path = f'{self.__checkpoint_path}.tmp'
+        with open(tmp_path, 'wb') as checkpoint_file:
+            pickle.dump(checkpoint, checkpoint_file)
+        os.replace(tmp_path, self.__checkpoint_path)
+
     def __ensure_legit_size(self, population):
         if len(population) != self.__population_size:
             raise RuntimeError('invalid initial population size')
 
     def __clean_up(self) -> None:
         self.__best_individual_with_score = None
-        self.__logger.clean_up()
+        self.__iterations_done = 0
+        self.__counting_evaluator = CountingEvaluator(self.__evaluator)
+        self.__cache = CachingEvaluator(self.__counting_evaluator, self.__cache_size) \
+            if self.__cache_size is not None \
+            else None
+        if self.__logger is not None:
+            self.__logger.clean_up()
 
     def __ensure_objective_function(self) -> None:
         if self.__obj_fun is None:
@@ -105,52 +274,53 @@ class EvolutionaryAlgorithm:
     def __prepare_strategy(self):
         if self.__strategy is not None:
             self.__strategy.set_objective_function(self.__obj_fun)
+            self.__strategy.set_evaluator(self.__population_evaluator())
+            self.__strategy.set_rng(self.__rng)
 
-    def __generate_new_evaluated_population(self, old_eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
+    def __generate_new_population(self, old_population: PopulationArray) -> PopulationArray:
         # Basically genetic algorithm steps.
-        selected_individuals = self.__tournament_selection(old_eval_population)
-        crossed_individuals = self.__crossover_population(selected_individuals)
-        mutated_population = self.__mutate_population(crossed_individuals)
-        new_eval_population = self.__evaluate_population(mutated_population)
-        return self.__make_succession(old_eval_population, new_eval_population)
-
-    def __evaluate_population(self, population: Population) -> EvaluatedPopulation:
-        return [(i, self.__obj_fun(i)) for i in population]
-
-    def __tournament_selection(self, evaluated_population: EvaluatedPopulation) -> Population:
-        reproduced_individuals = []
-        for _ in range(self.__population_size):
-            tournament_members = random.choices(evaluated_population, k=2)
-            tournament_winner = tournament_members[0][0] \
-                if tournament_members[0][1] > tournament_members[1][1] \
-                else tournament_members[1][0]
-            reproduced_individuals.append(tournament_winner)
-
-        return reproduced_individuals
-
-    def __crossover_population(self, population: Population) -> Population:
-        result_individuals = []
-        for _ in range(self.__population_size):
-            eta = random.uniform(0, 1)
-            weight = random.uniform(0, 1)
-            fathers = random.choices(population, k=2)
-            if eta < self.__crossover_probability:
-                result_individuals.append(fathers[0] * weight + fathers[1] * (1 - weight))
-            else:
-                result_individuals.append(fathers[0])
-
-        return result_individuals
-
-    def __mutate_population(self, population: Population) -> Population:
-        return [i + (np.random.standard_normal(len(i))) * self.__mutation_strength for i in population]
+        selected_genomes = self.__tournament_selection(old_population)
+        crossed_genomes = self.__crossover_population(selected_genomes)
+        mutated_genomes = self.__mutate_population(crossed_genomes)
+        new_population = self.__evaluate_population(mutated_genomes)
+        return self.__make_succession(old_population, new_population)
+
+    def __evaluate_population(self, genomes: Genomes) -> PopulationArray:
+        return PopulationArray(genomes, self.__population_evaluator().evaluate(self.__obj_fun, genomes))
+
+    def __population_evaluator(self) -> Evaluator:
+        # Cache wraps the counter, so only the actual evaluations are counted.
+        return self.__cache if self.__cache is not None else self.__counting_evaluator
+
+    def __tournament_selection(self, population: PopulationArray) -> Genomes:
+        # Every row holds indices of the single tournament members.
+        members = self.__rng.integers(len(population), size=(self.__population_size, self.__tournament_size))
+        winners = np.take_along_axis(
+            members,
+            np.argmax(population.fitness[members], axis=1)[:, np.newaxis],
+            axis=1
+        )
+        return population.genomes[winners[:, 0]]
+
+    def __crossover_population(self, genomes: Genomes) -> Genomes:
+        eta = self.__rng.uniform(0, 1, self.__population_size)
+        weight = self.__rng.uniform(0, 1, (self.__population_size, 1))
+        fathers = self.__rng.integers(len(genomes), size=(2, self.__population_size))
+        first_fathers, second_fathers = genomes[fathers[0]], genomes[fathers[1]]
+        crossed = first_fathers * weight + second_fathers * (1 - weight)
+        # Individuals which are not crossed are copies of the first father.
+        return np.where((eta < self.__crossover_probability)[:, np.newaxis], crossed, first_fathers)
+
+    def __mutate_population(self, genomes: Genomes) -> Genomes:
+        return genomes + self.__rng.standard_normal(genomes.shape) * self.__mutation_strength
 
     def __make_succession(self,
-                          old_eval_population: EvaluatedPopulation,
-                          new_eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
-        old_eval_population.sort(reverse=True, key=lambda i: i[1])
-        new_eval_population.sort(reverse=True, key=lambda i: i[1])
-        return old_eval_population[:self.__elite_size] + \
-            new_eval_population[:self.__population_size - self.__elite_size]
-
-    def __pick_best_individual(self, evaluated_population: EvaluatedPopulation) -> None:
-        self.__best_individual_with_score = max(evaluated_population, key=lambda i: i[1])
+                          old_population: PopulationArray,
+                          new_population: PopulationArray) -> PopulationArray:
+        return PopulationArray.concatenate([
+            old_population.take(old_population.best_indices(self.__elite_size)),
+            new_population.take(new_population.best_indices(self.__population_size - self.__elite_size))
+        ])
+
+    def __pick_best_individual(self, population: PopulationArray) -> None:
+        self.__best_individual_with_score = population.best()
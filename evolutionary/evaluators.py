@@ -0,0 +1,306 @@
+import os
+import numpy as np
+from collections import OrderedDict
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from hints.aliases import *
+
+
+class Evaluator(ABC):
+    """
+    Class computing objective function values of the whole population.
+
+    Evaluators are used by the EvolutionaryAlgorithm and the strategies,
+    so that the way of evaluation (serial or parallel) is independent of
+    the algorithm itself. Evaluators holding worker pools should be closed
+    after use, either with close method or by using them as context managers.
+    """
+
+    @abstractmethod
+    def evaluate(self, obj_func: ObjectiveFunction, genomes: Genomes) -> Fitness:
+        """
+        Evaluates every individual of the population.
+
+        :param obj_func: objective function to use
+        :param genomes: matrix holding a single individual in every row
+        :return: objective function values of the individuals
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Releases resources held by the evaluator.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SerialEvaluator(Evaluator):
+    """
+    Evaluator calling the objective function for every individual in the current thread.
+    """
+
+    def evaluate(self, obj_func: ObjectiveFunction, genomes: Genomes) -> Fitness:
+        return _evaluate_rows(obj_func, genomes)
+
+
+class BatchEvaluator(Evaluator):
+    """
+    Evaluator calling the objective function once with the whole population.
+
+    The objective function has to accept the matrix holding a single individual
+    in every row and return the vector of their values, e.g. the CEC2017 problem
+    created with make_problem (also when negated).
+    """
+
+    def evaluate(self, obj_func: ObjectiveFunction, genomes: Genomes) -> Fitness:
+        genomes = np.ascontiguousarray(genomes, dtype=np.float64)
+        if len(genomes) == 0:
+            return np.empty(0)
+        fitness = np.asarray(obj_func(genomes), dtype=np.float64)
+        if fitness.shape != (len(genomes),):
+            raise RuntimeError(f'invalid shape of objective function values: {fitness.shape}')
+        return fitness
+
+
+class CountingEvaluator(Evaluator):
+    """
+    Evaluator counting the objective function evaluations performed by another evaluator.
+
+    Closing the CountingEvaluator does not close the wrapped evaluator.
+    """
+
+    def __init__(self, evaluator: Evaluator):
+        """
+        :param evaluator: evaluator performing the evaluations
+        """
+        self.__evaluator = evaluator
+        self.__evaluations = 0
+
+    def evaluate(self, obj_func: ObjectiveFunction, genomes: Genomes) -> Fitness:
+        self.__evaluations += len(genomes)
+        return self.__evaluator.evaluate(obj_func, genomes)
+
+    def get_evaluations(self) -> int:
+        """
+        Returns the number of individuals evaluated so far.
+        """
+        return self.__evaluations
+
+    def set_evaluations(self, evaluations: int) -> None:
+        """
+        Sets the number of individuals evaluated so far, e.g. when the run is resumed.
+        """
+        self.__evaluations = evaluations
+
+
+class CachingEvaluator(Evaluator):
+    """
+    Evaluator remembering objective function values of the recently evaluated individuals.
+
+    Individuals are identified by the bytes of their genomes, so only exact
+    copies (e.g. not crossed and not mutated individuals) are found in the cache.
+    When the cache is full, the least recently used individual is evicted.
+    The objective function has to be deterministic. Changing the objective
+    function clears the cache, the first objective function after restoring
+    the state with set_state is assumed to be the one of the stored state.
+
+    Closing the CachingEvaluator does not close the wrapped evaluator.
+    """
+
+    def __init__(self, evaluator: Evaluator | None = None, max_size: int = 100000):
+        """
+        :param evaluator: evaluator performing the evaluations of individuals missing in the cache
+        :param max_size: maximal number of individuals stored in the cache
+        """
+        if max_size < 1:
+            raise RuntimeError(f'invalid cache size: {max_size}')
+        self.__evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.__max_size = max_size
+        self.__cache = OrderedDict()
+        self.__obj_func = None
+        self.__hits = 0
+        self.__misses = 0
+
+    def evaluate(self, obj_func: ObjectiveFunction, genomes: Genomes) -> Fitness:
+        if self.__obj_func is not None and obj_func is not self.__obj_func:
+            self.__cache.clear()
+        self.__obj_func = obj_func
+        genomes = np.ascontiguousarray(genomes, dtype=np.float64)
+        fitness = np.empty(len(genomes))
+        # Rows of the individuals missing in the cache, copies within the population are evaluated once.
+        missing = {}
+        for i, individual in enumerate(genomes):
+            key = individual.tobytes()
+            value = self.__cache.get(key)
+            if value is not None:
+                self.__cache.move_to_end(key)
+                fitness[i] = value
+            else:
+                missing.setdefault(key, []).append(i)
+        if missing:
+            values = self.__evaluator.evaluate(obj_func, genomes[[rows[0] for rows in missing.values()]])
+            for (key, rows), value in zip(missing.items(), values):
+                fitness[rows] = value
+                self.__cache[key] = value
+            while len(self.__cache) > self.__max_size:
+                self.__cache.popitem(last=False)
+        self.__misses += len(missing)
+        self.__hits += len(genomes) - len(missing)
+        return fitness
+
+    def get_hits(self) -> int:
+        """
+        Returns the number of individuals whose values were taken from the cache.
+        """
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Returns the number of individuals evaluated by the wrapped evaluator.
+        """
+        return self.__misses
+
+    def get_state(self) -> dict:
+        """
+        Returns the picklable state of the cache, i.e. the cached values in the order of use and the counters.
+        """
+        return {'entries': list(self.__cache.items()), 'hits': self.__hits, 'misses': self.__misses}
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restores the state returned by get_state, e.g. when the run is resumed.
+        """
+        self.__cache = OrderedDict(state['entries'])
+        self.__hits = state['hits']
+        self.__misses = state['misses']
+        self.__obj_func = None
+
+    def clear(self) -> None:
+        """
+        Removes all individuals from the cache and resets the counters.
+        """
+        self.__cache.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+
+class _PoolEvaluator(Evaluator):
+    """
+    Base class of the evaluators splitting the population into chunks evaluated by the worker pool.
+    """
+
+    def __init__(self, max_workers: int | None = None, chunk_size: int | None = None):
+        """
+        :param max_workers: number of workers, number of CPUs by default
+        :param chunk_size: number of individuals evaluated by a single task,
+                           by default the population is split evenly between the workers
+        """
+        self.__max_workers = max_workers or os.cpu_count() or 1
+        self.__chunk_size = chunk_size
+        self.__executor = None
+
+    def evaluate(self, obj_func: ObjectiveFunction, genomes: Genomes) -> Fitness:
+        genomes = np.ascontiguousarray(genomes, dtype=np.float64)
+        if len(genomes) == 0:
+            return np.empty(0)
+        if self.__executor is None:
+            self.__executor = self._make_executor(self.__max_workers)
+        return self._evaluate_chunks(self.__executor, obj_func, genomes, self.__chunks(len(genomes)))
+
+    def close(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __chunks(self, size: int) -> list[tuple[int, int]]:
+        chunk_size = self.__chunk_size or -(-size // self.__max_workers)
+        return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+    @abstractmethod
+    def _make_executor(self, max_workers: int) -> Executor:
+        pass
+
+    @abstractmethod
+    def _evaluate_chunks(self,
+                         executor: Executor,
+                         obj_func: ObjectiveFunction,
+                         genomes: Genomes,
+                         chunks: list[tuple[int, int]]) -> Fitness:
+        pass
+
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    """
+    Evaluator using the pool of threads.
+
+    Suitable for objective functions which release the GIL,
+    e.g. spending most of the time in NumPy routines or external programs.
+    """
+
+    def _make_executor(self, max_workers: int) -> Executor:
+        return ThreadPoolExecutor(max_workers)
+
+    def _evaluate_chunks(self,
+                         executor: Executor,
+                         obj_func: ObjectiveFunction,
+                         genomes: Genomes,
+                         chunks: list[tuple[int, int]]) -> Fitness:
+        results = executor.map(lambda chunk: _evaluate_rows(obj_func, genomes[chunk[0]:chunk[1]]), chunks)
+        return np.concatenate(list(results))
+
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    """
+    Evaluator using the pool of processes.
+
+    The genomes are copied once into the shared memory block, and the workers
+    read their chunks from it, so the individuals are not pickled one by one.
+    The objective function is pickled once per chunk, so it has to be defined
+    at the module level (lambdas and local functions can not be used).
+    """
+
+    def _make_executor(self, max_workers: int) -> Executor:
+        return ProcessPoolExecutor(max_workers)
+
+    def _evaluate_chunks(self,
+                         executor: Executor,
+                         obj_func: ObjectiveFunction,
+                         genomes: Genomes,
+                         chunks: list[tuple[int, int]]) -> Fitness:
+        block = shared_memory.SharedMemory(create=True, size=genomes.nbytes)
+        try:
+            np.ndarray(genomes.shape, dtype=np.float64, buffer=block.buf)[:] = genomes
+            futures = [
+                executor.submit(_evaluate_shared_rows, obj_func, block.name, genomes.shape, start, stop)
+                for start, stop in chunks
+            ]
+            return np.concatenate([future.result() for future in futures])
+        finally:
+            block.close()
+            block.unlink()
+
+
+def _evaluate_rows(obj_func: ObjectiveFunction, genomes: Genomes) -> Fitness:
+    return np.fromiter((obj_func(i) for i in genomes), dtype=np.float64, count=len(genomes))
+
+
+def _evaluate_shared_rows(obj_func: ObjectiveFunction,
+                          block_name: str,
+                          shape: tuple[int, int],
+                          start: int,
+                          stop: int) -> Fitness:
+    # Executed in the worker process.
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        # Copying the rows, so that the objective function can not keep references to the shared memory.
+        genomes = np.ndarray(shape, dtype=np.float64, buffer=block.buf)[start:stop].copy()
+    finally:
+        block.close()
+    return _evaluate_rows(obj_func, genomes)
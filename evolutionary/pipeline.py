@@ -0,0 +1,168 @@
+import time
+import numpy as np
+from population.array import PopulationArray
+from evolutionary.strategies import Strategy
+from evolutionary.evaluators import Evaluator, SerialEvaluator, CountingEvaluator
+from hints.aliases import *
+
+
+class StrategyPipeline(Strategy):
+    """
+    Class applying multiple strategies one after another in every iteration of the EvolutionaryAlgorithm.
+
+    Every stage of the pipeline is instrumented, for every iteration the statistics store:
+        - evaluations: number of objective function evaluations of the stage
+        - time: wall time of the stage in seconds
+        - produced: number of individuals produced by the stage, i.e. not present in its input
+        - improvement_rate: fraction of produced individuals better than the replaced ones,
+                            produced and replaced individuals are paired by their rank
+        - survival_rate: fraction of produced individuals present in the population of the next
+                         iteration, i.e. surviving the succession, NaN until it is known
+
+    Individuals are identified by the bytes of their genomes. Statistics are
+    cleaned with every run of the algorithm and stored in the algorithm checkpoints.
+    """
+    statistics = ('evaluations', 'time', 'produced', 'improvement_rate', 'survival_rate')
+
+    def __init__(self, strategies: list[Strategy], names: list[str] | None = None):
+        """
+        :param strategies: strategies applied in the given order
+        :param names: names of the stages used as keys of the statistics, class names by default
+        """
+        names = names if names is not None else [type(strategy).__name__ for strategy in strategies]
+        if len(names) != len(strategies) or len(set(names)) != len(names):
+            raise RuntimeError('stage names must be unique and match the strategies')
+        self.__strategies = strategies
+        self.__names = names
+        self.__counters = []
+        self.__evaluator = None
+        self.__statistics = {}
+        self.__produced = []
+        self.set_evaluator(SerialEvaluator())
+        self.clean_up()
+
+    def modify_evaluated_population(self, eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
+        population = PopulationArray.from_evaluated_population(eval_population)
+        return self.modify_population(population).to_evaluated_population()
+
+    def modify_population(self, population: PopulationArray) -> PopulationArray:
+        self.__update_survival(population)
+        self.__produced = []
+        for name, strategy, counter in zip(self.__names, self.__strategies, self.__counters):
+            evaluations = counter.get_evaluations()
+            start = time.perf_counter()
+            modified = strategy.modify_population(population)
+            elapsed = time.perf_counter() - start
+            produced, improvement_rate = StrategyPipeline.__compare(population, modified)
+            statistics = self.__statistics[name]
+            statistics['evaluations'].append(counter.get_evaluations() - evaluations)
+            statistics['time'].append(elapsed)
+            statistics['produced'].append(len(produced))
+            statistics['improvement_rate'].append(improvement_rate)
+            statistics['survival_rate'].append(np.nan)
+            self.__produced.append(produced)
+            population = modified
+        return population
+
+    def set_objective_function(self, obj_func: ObjectiveFunction) -> None:
+        for strategy in self.__strategies:
+            strategy.set_objective_function(obj_func)
+
+    def set_evaluator(self, evaluator: Evaluator) -> None:
+        self.__evaluator = evaluator
+        self.__counters = [CountingEvaluator(evaluator) for _ in self.__strategies]
+        for strategy, counter in zip(self.__strategies, self.__counters):
+            strategy.set_evaluator(counter)
+
+    def get_evaluator(self) -> Evaluator:
+        return self.__evaluator
+
+    def set_rng(self, rng: np.random.Generator | int | None) -> None:
+        # Stages share the single generator, so the pipeline is reproducible as a whole.
+        rng = np.random.default_rng(rng)
+        super().set_rng(rng)
+        for strategy in self.__strategies:
+            strategy.set_rng(rng)
+
+    def clean_up(self) -> None:
+        self.__statistics = {name: {key: [] for key in StrategyPipeline.statistics} for name in self.__names}
+        self.__produced = []
+        for strategy in self.__strategies:
+            strategy.clean_up()
+
+    def get_state(self) -> dict:
+        return {
+            'statistics': self.get_statistics(),
+            'produced': [list(produced) for produced in self.__produced],
+            'stages': [strategy.get_state() for strategy in self.__strategies]
+        }
+
+    def set_state(self, state: dict) -> None:
+        self.__statistics = {name: {key: list(values) for key, values in data.items()}
+                             for name, data in state['statistics'].items()}
+        self.__produced = [list(produced) for produced in state['produced']]
+        for strategy, stage_state in zip(self.__strategies, state['stages']):
+            strategy.set_state(stage_state)
+
+    def get_statistics(self) -> dict[str, dict[str, list]]:
+        """
+        Returns the statistics of every stage, lists hold values of the subsequent iterations.
+        """
+        return {name: {key: list(values) for key, values in data.items()} for name, data in self.__statistics.items()}
+
+    def get_summary(self) -> dict[str, dict[str, float]]:
+        """
+        Returns the statistics of every stage summarized over the iterations of the run.
+
+        Evaluations, time and produced individuals are summed, rates are averaged
+        over the iterations weighted by the number of produced individuals.
+        """
+        summary = {}
+        for name, data in self.__statistics.items():
+            produced = np.array(data['produced'])
+            summary[name] = {
+                'evaluations': float(np.sum(data['evaluations'])),
+                'time': float(np.sum(data['time'])),
+                'produced': float(np.sum(produced)),
+                'improvement_rate': StrategyPipeline.__weighted_rate(data['improvement_rate'], produced),
+                'survival_rate': StrategyPipeline.__weighted_rate(data['survival_rate'], produced),
+            }
+        return summary
+
+    def __update_survival(self, population: PopulationArray) -> None:
+        # Population of the next iteration shows which individuals produced previously survived.
+        if not self.__produced:
+            return
+        survivors = set(StrategyPipeline.__keys(population.genomes))
+        for name, produced in zip(self.__names, self.__produced):
+            if len(produced):
+                survived = sum(key in survivors for key in produced)
+                self.__statistics[name]['survival_rate'][-1] = survived / len(produced)
+
+    @staticmethod
+    def __compare(population: PopulationArray, modified: PopulationArray) -> tuple[list[bytes], float]:
+        original_keys = StrategyPipeline.__keys(population.genomes)
+        modified_keys = StrategyPipeline.__keys(modified.genomes)
+        original_set, modified_set = set(original_keys), set(modified_keys)
+        produced = [i for i, key in enumerate(modified_keys) if key not in original_set]
+        replaced = [i for i, key in enumerate(original_keys) if key not in modified_set]
+        if not produced:
+            return [], np.nan
+        # Best produced individual is compared with the best replaced one and so on.
+        produced_fitness = np.sort(modified.fitness[produced])[::-1]
+        replaced_fitness = np.sort(population.fitness[replaced])[::-1]
+        length = min(len(produced_fitness), len(replaced_fitness))
+        improved = np.sum(produced_fitness[:length] > replaced_fitness[:length])
+        return [modified_keys[i] for i in produced], improved / len(produced)
+
+    @staticmethod
+    def __keys(genomes: Genomes) -> list[bytes]:
+        return [row.tobytes() for row in np.ascontiguousarray(genomes)]
+
+    @staticmethod
+    def __weighted_rate(rates: list[float], produced: np.ndarray) -> float:
+        rates = np.array(rates, dtype=np.float64)
+        known = ~np.isnan(rates)
+        if not np.any(known):
+            return np.nan
+        return float(np.average(rates[known], weights=produced[known]))
@@ -0,0 +1,243 @@
+import numpy as np
+from abc import abstractmethod
+from collections import deque
+from population.array import PopulationArray
+from evolutionary.strategies import Strategy
+from evolutionary.evaluators import Evaluator
+from hints.aliases import *
+
+
+class ScheduledStrategy(Strategy):
+    """
+    Class applying the wrapped strategy only in some iterations of the EvolutionaryAlgorithm.
+
+    In the remaining iterations the population is returned unchanged, so the
+    evaluations of the strategy are spent only when the schedule allows it.
+    The schedule is restarted with every run of the algorithm and stored
+    in the algorithm checkpoints along with the state of the wrapped strategy.
+    """
+
+    def __init__(self, strategy: Strategy):
+        """
+        :param strategy: strategy which is applied accordingly to the schedule
+        """
+        self.__strategy = strategy
+        self.__applications = 0
+
+    def modify_evaluated_population(self, eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
+        population = PopulationArray.from_evaluated_population(eval_population)
+        return self.modify_population(population).to_evaluated_population()
+
+    def modify_population(self, population: PopulationArray) -> PopulationArray:
+        if not self._should_apply(population):
+            return population
+        self.__applications += 1
+        modified = self.__strategy.modify_population(population)
+        self._applied(population, modified)
+        return modified
+
+    def set_objective_function(self, obj_func: ObjectiveFunction) -> None:
+        self.__strategy.set_objective_function(obj_func)
+
+    def set_evaluator(self, evaluator: Evaluator) -> None:
+        self.__strategy.set_evaluator(evaluator)
+
+    def get_evaluator(self) -> Evaluator:
+        return self.__strategy.get_evaluator()
+
+    def set_rng(self, rng: np.random.Generator | int | None) -> None:
+        self.__strategy.set_rng(rng)
+
+    def get_rng(self) -> np.random.Generator:
+        return self.__strategy.get_rng()
+
+    def clean_up(self) -> None:
+        self.__applications = 0
+        self.__strategy.clean_up()
+
+    def get_state(self) -> dict:
+        return {'applications': self.__applications, 'strategy': self.__strategy.get_state()}
+
+    def set_state(self, state: dict) -> None:
+        self.__applications = state['applications']
+        self.__strategy.set_state(state['strategy'])
+
+    def get_strategy(self) -> Strategy:
+        """
+        Returns the wrapped strategy.
+        """
+        return self.__strategy
+
+    def get_applications(self) -> int:
+        """
+        Returns the number of iterations of the current run in which the strategy was applied.
+        """
+        return self.__applications
+
+    @abstractmethod
+    def _should_apply(self, population: PopulationArray) -> bool:
+        """
+        Decides whether the strategy is applied in the current iteration.
+
+        :param population: population which would be modified
+        """
+        pass
+
+    def _applied(self, population: PopulationArray, modified: PopulationArray) -> None:
+        """
+        Called after the strategy was applied.
+
+        :param population: population before the modification
+        :param modified: population after the modification
+        """
+        pass
+
+
+class PeriodicStrategy(ScheduledStrategy):
+    """
+    Applies the wrapped strategy every period-th iteration, starting with the first one.
+    """
+
+    def __init__(self, strategy: Strategy, period: int):
+        """
+        :param strategy: strategy which is applied accordingly to the schedule
+        :param period: number of iterations between subsequent applications
+        """
+        if period < 1:
+            raise RuntimeError(f'invalid period: {period}')
+        super().__init__(strategy)
+        self.__period = period
+        self.__iteration = 0
+
+    def clean_up(self) -> None:
+        super().clean_up()
+        self.__iteration = 0
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), 'iteration': self.__iteration}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self.__iteration = state['iteration']
+
+    def _should_apply(self, population: PopulationArray) -> bool:
+        iteration = self.__iteration
+        self.__iteration += 1
+        return iteration % self.__period == 0
+
+
+class StagnationTriggeredStrategy(ScheduledStrategy):
+    """
+    Applies the wrapped strategy only when the best value does not improve for the number of iterations.
+
+    The strategy is applied in every iteration as long as the stagnation lasts.
+    """
+
+    def __init__(self, strategy: Strategy, iterations: int, min_improvement: float = 0.0):
+        """
+        :param strategy: strategy which is applied accordingly to the schedule
+        :param iterations: number of iterations without improvement triggering the strategy
+        :param min_improvement: improvement smaller or equal to this one is treated as no improvement
+        """
+        super().__init__(strategy)
+        self.__iterations = iterations
+        self.__min_improvement = min_improvement
+        self.__best_value = None
+        self.__stagnation = 0
+
+    def clean_up(self) -> None:
+        super().clean_up()
+        self.__best_value = None
+        self.__stagnation = 0
+
+    def get_state(self) -> dict:
+        return {**super().get_state(), 'best_value': self.__best_value, 'stagnation': self.__stagnation}
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self.__best_value = state['best_value']
+        self.__stagnation = state['stagnation']
+
+    def _should_apply(self, population: PopulationArray) -> bool:
+        best_value = population.fitness.max()
+        if self.__best_value is None or best_value - self.__best_value > self.__min_improvement:
+            self.__best_value = best_value
+            self.__stagnation = 0
+        else:
+            self.__stagnation += 1
+        return self.__stagnation >= self.__iterations
+
+
+class AdaptiveStrategy(ScheduledStrategy):
+    """
+    Applies the wrapped strategy with the period adapted to its success rate.
+
+    The application is successful when it increases the mean value of the
+    population. The success rate is computed over the recent applications,
+    when it exceeds the target rate the period is halved, otherwise it is
+    doubled, in the spirit of the 1/5 success rule of evolution strategies.
+    """
+
+    def __init__(self,
+                 strategy: Strategy,
+                 target_rate: float = 0.2,
+                 window: int = 5,
+                 max_period: int = 32):
+        """
+        :param strategy: strategy which is applied accordingly to the schedule
+        :param target_rate: success rate above which the strategy is applied more often
+        :param window: number of the recent applications used for the success rate
+        :param max_period: maximal number of iterations between subsequent applications
+        """
+        if window < 1 or max_period < 1:
+            raise RuntimeError(f'invalid window {window} or maximal period {max_period}')
+        super().__init__(strategy)
+        self.__target_rate = target_rate
+        self.__window = window
+        self.__max_period = max_period
+        self.__successes = deque(maxlen=window)
+        self.__period = 1
+        self.__countdown = 0
+
+    def clean_up(self) -> None:
+        super().clean_up()
+        self.__successes.clear()
+        self.__period = 1
+        self.__countdown = 0
+
+    def get_state(self) -> dict:
+        return {
+            **super().get_state(),
+            'successes': list(self.__successes),
+            'period': self.__period,
+            'countdown': self.__countdown
+        }
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self.__successes = deque(state['successes'], maxlen=self.__window)
+        self.__period = state['period']
+        self.__countdown = state['countdown']
+
+    def get_period(self) -> int:
+        """
+        Returns the current number of iterations between subsequent applications.
+        """
+        return self.__period
+
+    def _should_apply(self, population: PopulationArray) -> bool:
+        if self.__countdown > 0:
+            self.__countdown -= 1
+            return False
+        return True
+
+    def _applied(self, population: PopulationArray, modified: PopulationArray) -> None:
+        self.__successes.append(modified.fitness.mean() > population.fitness.mean())
+        # Period is adapted once the window is filled, so a single failure does not suppress the strategy.
+        if len(self.__successes) == self.__window:
+            if np.mean(self.__successes) > self.__target_rate:
+                self.__period = max(1, self.__period // 2)
+            else:
+                self.__period = min(self.__max_period, self.__period * 2)
+            self.__successes.clear()
+        self.__countdown = self.__period - 1
@@ -1,11 +1,14 @@
-import random
-
 import numpy as np
 from abc import ABC, abstractmethod
+from population.array import PopulationArray
+from evolutionary.evaluators import Evaluator, SerialEvaluator
 from hints.aliases import *
 
 
 class Strategy(ABC):
+    __evaluator: Evaluator = SerialEvaluator()
+    __rng: np.random.Generator | None = None
+
     @abstractmethod
     def modify_evaluated_population(self, eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
         """
@@ -19,6 +22,21 @@ class Strategy(ABC):
         """
         pass
 
+    def modify_population(self, population: PopulationArray) -> PopulationArray:
+        """
+        Modify array-backed evaluated population by this strategy.
+
+        This method is used by the EvolutionaryAlgorithm. The default implementation
+        converts the population into the list and uses modify_evaluated_population,
+        strategies may override it in order to work on arrays directly.
+
+        :param population: evaluated population which will be modified
+        :return: new evaluated population
+        """
+        return PopulationArray.from_evaluated_population(
+            self.modify_evaluated_population(population.to_evaluated_population())
+        )
+
     @abstractmethod
     def set_objective_function(self, obj_func: ObjectiveFunction) -> None:
         """
@@ -28,6 +46,56 @@ class Strategy(ABC):
         """
         pass
 
+    def set_evaluator(self, evaluator: Evaluator) -> None:
+        """
+        Sets evaluator which will be used by strategy, SerialEvaluator is used by default.
+
+        :param evaluator: evaluator to use
+        """
+        self.__evaluator = evaluator
+
+    def get_evaluator(self) -> Evaluator:
+        return self.__evaluator
+
+    def set_rng(self, rng: np.random.Generator | int | None) -> None:
+        """
+        Sets random generator (or seed of the generator) which will be used by strategy.
+
+        EvolutionaryAlgorithm shares its own generator with the strategy, so that
+        the whole run is reproducible. Unseeded generator is used by default.
+
+        :param rng: random generator or seed to use
+        """
+        self.__rng = np.random.default_rng(rng)
+
+    def get_rng(self) -> np.random.Generator:
+        if self.__rng is None:
+            self.__rng = np.random.default_rng()
+        return self.__rng
+
+    def clean_up(self) -> None:
+        """
+        Cleans the strategy internals after previous run, called by the EvolutionaryAlgorithm.
+        """
+        pass
+
+    def get_state(self) -> dict:
+        """
+        Returns the picklable state of the strategy changing during the run.
+
+        The state is stored in the checkpoints of the EvolutionaryAlgorithm,
+        so that the resumed run gives the same results as the uninterrupted one.
+        """
+        return {}
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restores the state returned by get_state, e.g. when the run is resumed.
+
+        :param state: state returned by get_state
+        """
+        pass
+
 
 class MutationStrategy(Strategy):
 
@@ -37,94 +105,140 @@ class MutationStrategy(Strategy):
         self.__obj_func = None
 
     def modify_evaluated_population(self, eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
+        population = PopulationArray.from_evaluated_population(eval_population)
+        return self.modify_population(population).to_evaluated_population()
+
+    def modify_population(self, population: PopulationArray) -> PopulationArray:
         self.__ensure_objective_function()
         # Continue if the objective function is set.
-        weakest_individuals = self.__select_weakest_individuals(eval_population)
-        mutated_weakest_individuals = self.__mutate(weakest_individuals)
+        weakest, others = self.__split_weakest_individuals(population)
+        mutated_weakest_genomes = self.__mutate(weakest.genomes)
         # Returning population with modified versions of the weakest individuals.
-        return self.__evaluate_population(mutated_weakest_individuals) + eval_population[self.__threshold:]
+        return PopulationArray.concatenate([self.__evaluate_population(mutated_weakest_genomes), others])
 
     def set_objective_function(self, obj_func: ObjectiveFunction) -> None:
         self.__obj_func = obj_func
 
-    def __mutate(self, weakest_individuals: Population) -> Population:
-        return [i + (np.random.standard_normal(len(i))) * self.__mutation_strength for i in weakest_individuals]
+    def __mutate(self, weakest_genomes: Genomes) -> Genomes:
+        return weakest_genomes + self.get_rng().standard_normal(weakest_genomes.shape) * self.__mutation_strength
 
-    def __select_weakest_individuals(self, eval_population: EvaluatedPopulation) -> Population:
-        self.__sort_population(eval_population)
+    def __split_weakest_individuals(self, population: PopulationArray) -> tuple[PopulationArray, PopulationArray]:
         # Selecting the threshold amount of the weakest individuals.
-        return [i[0] for i in eval_population[:self.__threshold]]
+        weakest, others = population.split_weakest(self.__threshold)
+        return population.take(weakest), population.take(others)
 
-    def __evaluate_population(self, population: Population) -> EvaluatedPopulation:
-        return [(i, self.__obj_func(i)) for i in population]
+    def __evaluate_population(self, genomes: Genomes) -> PopulationArray:
+        return PopulationArray(genomes, self.get_evaluator().evaluate(self.__obj_func, genomes))
 
     def __ensure_objective_function(self):
         if self.__obj_func is None:
             raise RuntimeError('objective function is not set for MutationStrategy')
 
-    @staticmethod
-    def __sort_population(eval_population: EvaluatedPopulation) -> None:
-        eval_population.sort(key=lambda i: i[1])
-
 
 class AverageMirroringStrategy(Strategy):
 
-    def __init__(self, mirroring_strength: float = 5.0, threshold: int = 20):
+    def __init__(self, mirroring_strength: float = 5.0, threshold: int = 20, speculative: bool = False):
+        """
+        Every weakest individual is mirrored towards the average of the weakest individuals,
+        and if this does not improve it, in the opposite direction.
+
+        :param mirroring_strength: maximal length of the mirroring relative to the distance to the average
+        :param threshold: number of the weakest individuals which are mirrored
+        :param speculative: whether to evaluate both mirrorings of all individuals with a single evaluator
+                            call, which costs 2 * threshold evaluations. By default, the first mirrorings
+                            are evaluated as one batch and the opposite mirrorings of the individuals not
+                            improved by them as the second one. Selected individuals are the same in both modes.
+        """
         self.__mirroring_strength = mirroring_strength
         self.__threshold = threshold
+        self.__speculative = speculative
+        self.__fallback_evaluations = 0
         self.__obj_func = None
 
     def modify_evaluated_population(self, eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
+        population = PopulationArray.from_evaluated_population(eval_population)
+        return self.modify_population(population).to_evaluated_population()
+
+    def modify_population(self, population: PopulationArray) -> PopulationArray:
         self.__ensure_objective_function()
         # Continue if the objective function is set.
-        weakest_eval_individuals = self.__select_evaluated_weakest_individuals(eval_population)
-        avg_individual = self.__average_individual(weakest_eval_individuals)
-        mirrored_eval_individuals = self.__mirror_individuals_and_evaluate(weakest_eval_individuals, avg_individual)
+        weakest, others = self.__split_weakest_individuals(population)
+        avg_individual = self.__average_individual(weakest)
+        mirrored = self.__mirror_individuals_and_evaluate(weakest, avg_individual)
         # Returning population with modified versions of the weakest individuals.
-        return mirrored_eval_individuals + eval_population[self.__threshold:]
+        return PopulationArray.concatenate([mirrored, others])
 
     def set_objective_function(self, obj_func: ObjectiveFunction) -> None:
         self.__obj_func = obj_func
 
-    def __select_evaluated_weakest_individuals(self, eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
-        self.__sort_population(eval_population)
+    def get_fallback_evaluations(self) -> int:
+        """
+        Returns the number of evaluations of the mirrorings opposite to the average individual in the current run.
+
+        These are the evaluations spent in addition to the single evaluation per weakest individual.
+        """
+        return self.__fallback_evaluations
+
+    def reset_fallback_evaluations(self) -> None:
+        """
+        Resets the number of evaluations of the mirrorings opposite to the average individual.
+        """
+        self.__fallback_evaluations = 0
+
+    def clean_up(self) -> None:
+        self.reset_fallback_evaluations()
+
+    def get_state(self) -> dict:
+        return {'fallback_evaluations': self.__fallback_evaluations}
+
+    def set_state(self, state: dict) -> None:
+        self.__fallback_evaluations = state['fallback_evaluations']
+
+    def __split_weakest_individuals(self, population: PopulationArray) -> tuple[PopulationArray, PopulationArray]:
         # Selecting the threshold amount of the weakest individuals.
-        return eval_population[:self.__threshold]
+        weakest, others = population.split_weakest(self.__threshold)
+        return population.take(weakest), population.take(others)
 
     def __mirror_individuals_and_evaluate(self,
-                                          eval_population: EvaluatedPopulation,
-                                          avg_individual: Individual) -> EvaluatedPopulation:
-        return [
-            self.__mirror_single_individual_and_evaluate(i, avg_individual) for i in eval_population
-        ]
+                                          population: PopulationArray,
+                                          avg_individual: Individual) -> PopulationArray:
+        genomes = population.genomes
+        mirroring_vectors = avg_individual - genomes
+        # Rows hold mirroring strengths towards and opposite to the average individual.
+        eta = self.get_rng().uniform(0, 1, (2, len(population), 1)) * self.__mirroring_strength
+        first_mirroring = genomes + eta[0] * mirroring_vectors
+        second_mirroring = genomes - eta[1] * mirroring_vectors
+        if self.__speculative:
+            # Both mirrorings of all individuals are evaluated with a single evaluator call.
+            values = self.get_evaluator().evaluate(
+                self.__obj_func, np.concatenate([first_mirroring, second_mirroring])
+            )
+            first_mirror_val, second_mirroring_val = values[:len(population)], values[len(population):]
+            first_better = first_mirror_val > population.fitness
+            self.__fallback_evaluations += len(population)
+        else:
+            first_mirror_val = self.get_evaluator().evaluate(self.__obj_func, first_mirroring)
+            first_better = first_mirror_val > population.fitness
+            # Opposite mirrorings of the individuals improved by the first one are never selected.
+            second_mirroring_val = np.full(len(population), -np.inf)
+            failed = np.flatnonzero(~first_better)
+            second_mirroring_val[failed] = self.get_evaluator().evaluate(self.__obj_func, second_mirroring[failed])
+            self.__fallback_evaluations += len(failed)
+        # Mirroring opposite to the average is used only if the first one failed.
+        second_better = ~first_better & (second_mirroring_val > population.fitness)
+        # If we failed with mirroring, original individual is kept.
+        return PopulationArray(
+            np.where(
+                first_better[:, np.newaxis],
+                first_mirroring,
+                np.where(second_better[:, np.newaxis], second_mirroring, genomes)
+            ),
+            np.where(first_better, first_mirror_val, np.where(second_better, second_mirroring_val, population.fitness))
+        )
 
     @staticmethod
-    def __average_individual(eval_population: EvaluatedPopulation) -> Individual:
-        return np.average([i[0] for i in eval_population], axis=0)
-
-    def __mirror_single_individual_and_evaluate(self,
-                                                eval_individual: EvaluatedIndividual,
-                                                avg_individual: Individual) -> EvaluatedIndividual:
-        individual, individual_val = eval_individual
-        mirroring_vector = avg_individual - individual
-        # Initial mirroring performed towards average individual.
-        eta = random.uniform(0, 1) * self.__mirroring_strength
-        first_mirroring = individual + eta * mirroring_vector
-        first_mirror_val = self.__obj_func(first_mirroring)
-        if first_mirror_val > individual_val:
-            return first_mirroring, first_mirror_val
-        # Attempt to find better individual by switching mirroring direction.
-        eta = random.uniform(0, 1) * self.__mirroring_strength
-        second_mirroring = individual - eta * mirroring_vector
-        second_mirroring_val = self.__obj_func(second_mirroring)
-        if second_mirroring_val > individual_val:
-            return second_mirroring, second_mirroring_val
-        # If we failed with mirroring, return original individual.
-        return eval_individual
-
-    @staticmethod
-    def __sort_population(eval_population: EvaluatedPopulation) -> None:
-        eval_population.sort(key=lambda i: i[1])
+    def __average_individual(population: PopulationArray) -> Individual:
+        return np.average(population.genomes, axis=0)
 
     def __ensure_objective_function(self):
         if self.__obj_func is None:
@@ -140,38 +254,38 @@ class DifferentialEvolutionStrategy(Strategy):
         self.__obj_func = None
 
     def modify_evaluated_population(self, eval_population: EvaluatedPopulation) -> EvaluatedPopulation:
+        population = PopulationArray.from_evaluated_population(eval_population)
+        return self.modify_population(population).to_evaluated_population()
+
+    def modify_population(self, population: PopulationArray) -> PopulationArray:
         self.__ensure_objective_function()
         # Continue if the objective function is set.
-        weakest_individuals, best_individual = self.__select_weakest_and_best_individuals(eval_population)
-        altered_individuals = self.__alter_weakest_individuals(weakest_individuals, best_individual)
+        weakest, others, best_individual = self.__split_weakest_and_best_individuals(population)
+        altered_genomes = self.__alter_weakest_individuals(weakest.genomes, best_individual)
         # Returning population with modified versions of the weakest individuals.
-        return self.__evaluate_population(altered_individuals) + eval_population[self.__threshold:]
+        return PopulationArray.concatenate([self.__evaluate_population(altered_genomes), others])
 
-    def __select_weakest_and_best_individuals(self,
-                                              eval_population: EvaluatedPopulation) -> tuple[Population, Individual]:
-        self.__sort_population(eval_population)
+    def __split_weakest_and_best_individuals(
+            self,
+            population: PopulationArray) -> tuple[PopulationArray, PopulationArray, Individual]:
         # Selecting the threshold amount of the weakest individuals.
-        return [i[0] for i in eval_population[:self.__threshold]], eval_population[-1][0]
-
-    def __alter_weakest_individuals(self, weakest_individuals: Population, best: Individual) -> Population:
-        return [
-            self.__alter_individual(i, random.choices(weakest_individuals, k=1)[0], best) for i in weakest_individuals
-        ]
-
-    def __alter_individual(self, individual: Individual, other: Individual, best: Individual) -> Individual:
-        to_best_vec = (best - individual) * self.__best_strength * random.uniform(0, 1)
-        to_other_vec = (other - individual) * self.__other_strength * random.uniform(0, 1)
-        return individual + to_best_vec + to_other_vec
+        weakest, others = population.split_weakest(self.__threshold)
+        return population.take(weakest), population.take(others), population.best()[0]
+
+    def __alter_weakest_individuals(self, weakest_genomes: Genomes, best: Individual) -> Genomes:
+        rng = self.get_rng()
+        # Every weakest individual is moved towards the best one and towards a random weakest one.
+        others = weakest_genomes[rng.integers(len(weakest_genomes), size=len(weakest_genomes))]
+        eta = rng.uniform(0, 1, (2, len(weakest_genomes), 1))
+        to_best_vec = (best - weakest_genomes) * self.__best_strength * eta[0]
+        to_other_vec = (others - weakest_genomes) * self.__other_strength * eta[1]
+        return weakest_genomes + to_best_vec + to_other_vec
 
     def set_objective_function(self, obj_func: ObjectiveFunction) -> None:
         self.__obj_func = obj_func
 
-    def __evaluate_population(self, population: Population) -> EvaluatedPopulation:
-        return [(i, self.__obj_func(i)) for i in population]
-
-    @staticmethod
-    def __sort_population(eval_population: EvaluatedPopulation) -> None:
-        eval_population.sort(key=lambda i: i[1])
+    def __evaluate_population(self, genomes: Genomes) -> PopulationArray:
+        return PopulationArray(genomes, self.get_evaluator().evaluate(self.__obj_func, genomes))
 
     def __ensure_objective_function(self):
         if self.__obj_func is None:
@@ -0,0 +1,169 @@
+import time
+from abc import ABC, abstractmethod
+
+
+class RunState:
+    """
+    Class describing the state of the EvolutionaryAlgorithm run after the iteration.
+
+    Attributes:
+        - iteration: number of the finished iterations
+        - evaluations: number of the objective function evaluations performed so far,
+                       including the evaluations of the strategy
+        - best_value: value of the best individual found so far
+        - dimension: dimension of the individuals
+    """
+
+    def __init__(self, iteration: int, evaluations: int, best_value: float, dimension: int):
+        self.iteration = iteration
+        self.evaluations = evaluations
+        self.best_value = best_value
+        self.dimension = dimension
+
+
+class TerminationCriterion(ABC):
+    """
+    Class deciding whether the EvolutionaryAlgorithm run should be stopped.
+
+    The criterion is checked after every iteration, the run stops as soon
+    as any of the algorithm criteria is met. Regardless of the criteria the
+    run is stopped after the algorithm iterations count.
+    """
+
+    def start(self) -> None:
+        """
+        Prepares the criterion for the new run.
+        """
+        pass
+
+    def resume(self) -> None:
+        """
+        Prepares the criterion restored from the checkpoint for continuing the run.
+        """
+        pass
+
+    @abstractmethod
+    def is_met(self, state: RunState) -> bool:
+        """
+        Checks the criterion after the iteration.
+
+        :param state: state of the run
+        :return: whether the run should be stopped
+        """
+        pass
+
+
+class MaxEvaluations(TerminationCriterion):
+    """
+    Stops the run when the budget of objective function evaluations is spent.
+
+    The budget is checked after the iteration, so the last iteration may
+    exceed it by the number of evaluations of a single iteration.
+    """
+
+    def __init__(self, max_evaluations: int | None = None, per_dimension: int = 10000):
+        """
+        :param max_evaluations: budget of the evaluations, if None it is proportional to the dimension
+        :param per_dimension: budget per dimension of the individuals, 10000 is the CEC2017 standard
+        """
+        self.__max_evaluations = max_evaluations
+        self.__per_dimension = per_dimension
+
+    def is_met(self, state: RunState) -> bool:
+        max_evaluations = self.__max_evaluations \
+            if self.__max_evaluations is not None \
+            else self.__per_dimension * state.dimension
+        return state.evaluations >= max_evaluations
+
+
+class TargetValue(TerminationCriterion):
+    """
+    Stops the run when the best value reaches the target.
+
+    Since the algorithm maximizes the objective function, the target is reached
+    when the best value is greater or equal to the target minus the tolerance.
+    """
+
+    def __init__(self, target: float, tolerance: float = 0.0):
+        """
+        :param target: target value of the objective function
+        :param tolerance: accepted difference between the best and the target value
+        """
+        self.__target = target
+        self.__tolerance = tolerance
+
+    @staticmethod
+    def cec2017(function_id: int, tolerance: float = 1e-8) -> 'TargetValue':
+        """
+        Creates the criterion for the negated CEC2017 function, which optimum is 100 times its number.
+        """
+        return TargetValue(-100.0 * function_id, tolerance)
+
+    def is_met(self, state: RunState) -> bool:
+        return state.best_value >= self.__target - self.__tolerance
+
+
+class Stagnation(TerminationCriterion):
+    """
+    Stops the run when the best value does not improve for the number of iterations.
+    """
+
+    def __init__(self, iterations: int, min_improvement: float = 0.0):
+        """
+        :param iterations: number of iterations without improvement
+        :param min_improvement: improvement smaller or equal to this one is treated as no improvement
+        """
+        self.__iterations = iterations
+        self.__min_improvement = min_improvement
+        self.__best_value = None
+        self.__last_improvement = 0
+
+    def start(self) -> None:
+        self.__best_value = None
+        self.__last_improvement = 0
+
+    def is_met(self, state: RunState) -> bool:
+        if self.__best_value is None or state.best_value - self.__best_value > self.__min_improvement:
+            self.__best_value = state.best_value
+            self.__last_improvement = state.iteration
+        return state.iteration - self.__last_improvement >= self.__iterations
+
+
+class WallClock(TerminationCriterion):
+    """
+    Stops the run when the time limit is exceeded.
+
+    The time is measured from the start of the run. The checkpoint stores
+    the time elapsed so far and the resumed run continues measuring it,
+    so the time of the interruption is not counted.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        :param seconds: time limit of the run
+        """
+        self.__seconds = seconds
+        self.__elapsed = 0.0
+        self.__start = None
+
+    def start(self) -> None:
+        self.__elapsed = 0.0
+        self.__start = time.time()
+
+    def resume(self) -> None:
+        self.__start = time.time()
+
+    def is_met(self, state: RunState) -> bool:
+        return self.__elapsed_time() >= self.__seconds
+
+    def __getstate__(self) -> dict:
+        # Absolute start time is meaningless after the interruption, the elapsed time is stored instead.
+        state = self.__dict__.copy()
+        state['_WallClock__elapsed'] = self.__elapsed_time()
+        state['_WallClock__start'] = None
+        return state
+
+    def __elapsed_time(self) -> float:
+        if self.__start is None:
+            return self.__elapsed
+        return self.__elapsed + time.time() - self.__start
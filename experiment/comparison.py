@@ -29,7 +29,9 @@ class ExperimentComparison:
                  generator: GeneratePopulationFunction,
                  obj_function: ObjectiveFunction,
                  duration: int = 20,
-                 verbose: bool = True):
+                 verbose: bool = True,
+                 workers: int = 1,
+                 seed: int | None = None):
         """
         Constructs the Experiment Comparison object.
 
@@ -39,6 +41,8 @@ class ExperimentComparison:
         :param obj_function: Objective function for the Experiment.
         :param duration: Duration of the single Experiment.
         :param verbose: Whether to give verbose feedback.
+        :param workers: Number of processes conducting the runs of a single Experiment.
+        :param seed: Seed of every Experiment, None for a random one.
         """
         self.__algorithms = algorithms
         self.__algorithm_names = algorithm_names
@@ -46,6 +50,8 @@ class ExperimentComparison:
         self.__obj_fun = obj_function
         self.__duration = duration
         self.__verbose = verbose
+        self.__workers = workers
+        self.__seed = seed
 
     def conduct(self) -> None:
         """
@@ -64,7 +70,9 @@ class ExperimentComparison:
                 duration=self.__duration,
                 verbose=False,
                 show_plots=False,
-                log_file_path=None
+                log_file_path=None,
+                workers=self.__workers,
+                seed=self.__seed
             )
             experiment.conduct()
             experiment_results.append(
@@ -1,4 +1,12 @@
+import os
+import shutil
+import inspect
+import tempfile
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from logger.regular import Logger
 from logger.averaging import AveragingLogger
+from logger.sink import ColumnarLogSink
 from evolutionary.algorithm import *
 
 
@@ -9,6 +17,10 @@ class Experiment:
     Experiment consist of multiple EvolutionaryAlgorithm execution
     on provided objective function.
     Eventually the averaged results of all runs will be presented.
+
+    Runs may be conducted in parallel by the pool of processes. In such case
+    the algorithm, the generator and the objective function are sent to the
+    worker processes, so they have to be picklable (defined at the module level).
     """
 
     def __init__(self,
@@ -18,17 +30,28 @@ class Experiment:
                  duration: int = 20,
                  verbose: bool = True,
                  show_plots: bool = True,
-                 log_file_path: str | None = None):
+                 log_file_path: str | None = None,
+                 log_dir: str | None = None,
+                 online_averaging: bool = False,
+                 workers: int = 1,
+                 seed: int | None = None):
         """
         Initializes the Experiment object.
 
         :param algorithm: Algorithm which wille be used during the experiment.
-        :param generator: Generator of the initial population for the algorithm.
+        :param generator: Generator of the initial population for the algorithm. If it takes an argument, it gets
+                          the random generator of the run, generators without arguments are called as they are.
         :param objective_function: Objective function for the algorithm.
         :param duration: Duration of the experiment (how many times' algorithm will be run).
         :param show_plots: Whether to show the plots or not after finish.
         :param verbose: If provide verbose feedback during experiment conduction.
         :param log_file_path: Path to the file where logs will be stored. If None no log will be stored.
+        :param log_dir: Directory where logs of every run will be appended by the ColumnarLogSink.
+                        If None no binary log will be stored.
+        :param online_averaging: Whether to fold runs into running statistics instead of keeping them in memory.
+        :param workers: Number of processes conducting the runs, 1 for running them in the current process.
+        :param seed: Seed of the experiment. Every run gets its own random generator derived from it, so
+                     results do not depend on the number of workers. If None, a random seed is used.
         """
         self.__algorithm = algorithm
         self.__population_generator = generator
@@ -37,7 +60,11 @@ class Experiment:
         self.__verbose = verbose
         self.__show_plots = show_plots
         self.__log_file_path = log_file_path
-        self.__avg_logger = AveragingLogger()
+        self.__workers = workers
+        self.__seed = seed
+        self.__log_dir = log_dir
+        self.__log_sink = ColumnarLogSink(log_dir) if log_dir is not None else None
+        self.__avg_logger = AveragingLogger(sink=self.__log_sink, online=online_averaging)
 
     def conduct(self) -> None:
         """
@@ -46,22 +73,13 @@ class Experiment:
 
         self.__avg_logger.clean_up()
 
-        for i in range(self.__duration):
-
-            if self.__verbose:
-                print(f'Experiment iteration {i + 1} started')
-
-            self.__avg_logger.logging_for_new_run()
-            self.__algorithm.set_logger(
-                self.__avg_logger.get_logging_logger()
-            )
-            self.__algorithm.set_objective_function(
-                self.__objective_function
-            )
-            self.__algorithm.run(
-                self.__population_generator()
-            )
+        if self.__workers > 1:
+            self.__conduct_parallel()
+        else:
+            self.__conduct_serial()
 
+        if self.__log_sink is not None:
+            self.__log_sink.flush()
         if self.__show_plots:
             self.__avg_logger.show_log_plots()
         if self.__log_file_path:
@@ -72,3 +90,86 @@ class Experiment:
         Returns averaged results from the experiment gathered by the averaging logger.
         """
         return self.__avg_logger.get_logger_data()
+
+    def __conduct_serial(self) -> None:
+        for i, run_seed in enumerate(self.__run_seeds()):
+
+            if self.__verbose:
+                print(f'Experiment iteration {i + 1} started')
+
+            # Entries are streamed to the sink while the run progresses.
+            self.__avg_logger.add_run_logger(
+                _conduct_run(
+                    self.__algorithm,
+                    self.__population_generator,
+                    self.__objective_function,
+                    self.__avg_logger.get_options(),
+                    run_seed,
+                    self.__log_sink
+                ),
+                stored=True
+            )
+
+    def __conduct_parallel(self) -> None:
+        # Every run streams its entries to its own directory, merged into the sink in the order of runs.
+        runs_dir = tempfile.mkdtemp(prefix='runs-', dir=self.__log_dir) if self.__log_dir is not None else None
+        try:
+            with ProcessPoolExecutor(self.__workers) as executor:
+                futures = [
+                    executor.submit(
+                        _conduct_run,
+                        self.__algorithm,
+                        self.__population_generator,
+                        self.__objective_function,
+                        self.__avg_logger.get_options(),
+                        run_seed,
+                        ColumnarLogSink(os.path.join(runs_dir, f'run{i}')) if runs_dir is not None else None
+                    )
+                    for i, run_seed in enumerate(self.__run_seeds())
+                ]
+                # Loggers are merged in the order of runs, regardless of their completion order.
+                for i, future in enumerate(futures):
+                    logger = future.result()
+                    if runs_dir is not None:
+                        self.__log_sink.merge(os.path.join(runs_dir, f'run{i}'))
+                    self.__avg_logger.add_run_logger(logger, stored=True)
+                    if self.__verbose:
+                        print(f'Experiment iteration {i + 1} finished')
+        finally:
+            if runs_dir is not None:
+                shutil.rmtree(runs_dir)
+
+    def __run_seeds(self) -> list[np.random.SeedSequence]:
+        return np.random.SeedSequence(self.__seed).spawn(self.__duration)
+
+
+def _conduct_run(algorithm: EvolutionaryAlgorithm,
+                 generator: GeneratePopulationFunction,
+                 objective_function: ObjectiveFunction,
+                 logger_options: dict,
+                 run_seed: np.random.SeedSequence,
+                 sink: ColumnarLogSink | None = None) -> Logger:
+    # Executed in the current process or in the worker process.
+    rng = np.random.default_rng(run_seed)
+    logger = Logger(logger_options, sink)
+    algorithm.set_logger(logger)
+    algorithm.set_objective_function(objective_function)
+    algorithm.set_rng(rng)
+    algorithm.run(_generate_population(generator, rng))
+    if sink is not None:
+        sink.flush()
+    return logger
+
+
+def _generate_population(generator: GeneratePopulationFunction, rng: np.random.Generator) -> Population | Genomes:
+    # Generators without required parameters predate the seeded runs and draw their own random numbers.
+    try:
+        parameters = inspect.signature(generator).parameters.values()
+    except (TypeError, ValueError):
+        return generator(rng)
+    takes_rng = any(
+        p.kind == p.VAR_POSITIONAL or (p.default is p.empty and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD))
+        for p in parameters
+    )
+    return generator(rng) if takes_rng else generator()
+
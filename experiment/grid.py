@@ -0,0 +1,246 @@
+import os
+import json
+import functools
+import numpy as np
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from cec2017.problem import make_problem, has_data
+from cec2017.negate import negate
+from evolutionary.algorithm import *
+
+GridPopulationGenerator = Callable[[int, np.random.Generator], Population | Genomes]
+
+
+class ExperimentGrid:
+    """
+    Class conducting the benchmark campaign on the CEC2017 functions.
+
+    Every cell of the grid, i.e. (algorithm, function, dimension, repetition),
+    is an independent task conducted by the pool of processes. Results of the
+    cells are appended to the results file as soon as the cells finish, one
+    JSON object per line, so the campaign does not keep them in memory and
+    the partial results survive interruption.
+
+    Cells already present in the results file are skipped, so an interrupted
+    campaign is resumed by conducting it again with the same parameters. With
+    the checkpoint directory set, the cells also store checkpoints of their
+    algorithms and continue from them after interruption.
+
+    The grid may be split into shards conducted on separate machines, shard
+    i of n conducts every n-th cell starting with the i-th one. Cells are
+    seeded independently of the shards and the workers, so the results are
+    reproducible for a given seed.
+
+    Algorithms and the generator are sent to the worker processes, so they
+    have to be picklable. The objective functions are created in the worker
+    processes, algorithms maximize the negated CEC2017 functions.
+    """
+
+    def __init__(self,
+                 algorithms: list[type(EvolutionaryAlgorithm)],
+                 algorithm_names: list[str],
+                 function_ids: list[int],
+                 dimensions: list[int],
+                 results_path: str,
+                 repetitions: int = 51,
+                 generator: GridPopulationGenerator | None = None,
+                 workers: int | None = None,
+                 seed: int | None = None,
+                 shard: tuple[int, int] = (0, 1),
+                 logger_options: dict | None = None,
+                 checkpoint_dir: str | None = None,
+                 checkpoint_interval: int = 50,
+                 verbose: bool = True):
+        """
+        Constructs the ExperimentGrid object.
+
+        :param algorithms: Configured algorithms which will be compared.
+        :param algorithm_names: Names of the algorithms stored along with the results.
+        :param function_ids: Numbers of the CEC2017 functions, 1 to 30.
+        :param dimensions: Dimensions of the functions, 2, 10, 20, 30, 50 or 100.
+        :param results_path: Path to the file where results will be appended.
+        :param repetitions: Number of runs of every algorithm on every function and dimension.
+        :param generator: Generator of the initial population of given dimension taking the random
+                          generator of the cell, by default the population of the algorithm size
+                          uniformly distributed in the [-100, 100] hypercube.
+        :param workers: Number of processes conducting the cells, number of CPUs by default.
+        :param seed: Seed of the campaign, None for a random one.
+        :param shard: Index of the shard conducted by this object and the number of shards.
+        :param logger_options: Options of the Logger collecting data of every run.
+        :param checkpoint_dir: Directory for checkpoints of the cells in progress, None for no checkpoints.
+        :param checkpoint_interval: Number of iterations between subsequent checkpoints of the cell.
+        :param verbose: Whether to give verbose feedback.
+        """
+        if len(algorithms) != len(algorithm_names):
+            raise RuntimeError('algorithms and names lengths do not match')
+        if not 0 <= shard[0] < shard[1]:
+            raise RuntimeError(f'invalid shard: {shard}')
+        missing = [(f, d) for f in function_ids for d in dimensions if not has_data(f, d)]
+        if missing:
+            raise RuntimeError('no CEC2017 data for functions and dimensions: '
+                               + ', '.join(f'f{f} D={d}' for f, d in missing))
+        self.__algorithms = algorithms
+        self.__algorithm_names = algorithm_names
+        self.__function_ids = function_ids
+        self.__dimensions = dimensions
+        self.__results_path = results_path
+        self.__repetitions = repetitions
+        self.__generator = generator
+        self.__workers = workers
+        self.__entropy = np.random.SeedSequence(seed).entropy
+        self.__shard = shard
+        self.__logger_options = logger_options
+        self.__checkpoint_dir = checkpoint_dir
+        self.__checkpoint_interval = checkpoint_interval
+        self.__verbose = verbose
+        self.__failed_cells = []
+
+    def conduct(self) -> None:
+        """
+        Conducts every cell of the shard and appends their results to the results file.
+
+        Failure of a cell does not stop the campaign, failed cells are reported and
+        returned by get_failed_cells. They are conducted again with the next conduct call.
+        """
+        if self.__checkpoint_dir is not None:
+            os.makedirs(self.__checkpoint_dir, exist_ok=True)
+        cells = self.__cells(self.__finished_cells())
+        # Limiting the number of submitted tasks, so that the whole grid is not kept in memory.
+        max_pending = 2 * (self.__workers or os.cpu_count() or 1)
+        pending: dict[Future, tuple[str, int, int, int]] = {}
+        self.__failed_cells = []
+        with ProcessPoolExecutor(self.__workers) as executor, open(self.__results_path, 'a') as results_file:
+            while True:
+                for cell in cells:
+                    pending[executor.submit(_conduct_cell, *cell)] = cell[1:5]
+                    if len(pending) >= max_pending:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        self.__failed_cells.append((key, repr(error)))
+                        name, function_id, dimension, repetition = key
+                        print(f'Failed {name} on f{function_id} D={dimension} run {repetition + 1}: {error!r}')
+                        continue
+                    results_file.write(json.dumps(result) + '\n')
+                    results_file.flush()
+                    if self.__verbose:
+                        print(f'Finished {result["algorithm"]} on f{result["function"]} '
+                              f'D={result["dimension"]} run {result["repetition"] + 1}')
+
+    def get_failed_cells(self) -> list[tuple[tuple[str, int, int, int], str]]:
+        """
+        Returns the keys (algorithm name, function, dimension, repetition) of the cells
+        which failed during the last conduct call, along with their errors.
+        """
+        return list(self.__failed_cells)
+
+    @staticmethod
+    def load_results(results_path: str) -> list[dict]:
+        """
+        Loads results of the cells from the results file.
+
+        :param results_path: path to the results file
+        :return: list of dictionaries describing the cells and holding their logs
+        """
+        with open(results_path) as results_file:
+            return [json.loads(line) for line in results_file if line.strip()]
+
+    def __finished_cells(self) -> set[tuple[str, int, int, int]]:
+        if not os.path.exists(self.__results_path):
+            return set()
+        self.__drop_partial_result()
+        return {_cell_key(result) for result in ExperimentGrid.load_results(self.__results_path)}
+
+    def __drop_partial_result(self) -> None:
+        # Interruption while writing may leave the last line incomplete.
+        with open(self.__results_path, 'rb+') as results_file:
+            content = results_file.read()
+            if content and not content.endswith(b'\n'):
+                results_file.truncate(content.rfind(b'\n') + 1)
+
+    def __cells(self, finished_cells: set[tuple[str, int, int, int]]) -> Iterator[tuple]:
+        index = 0
+        for algorithm_idx, (algorithm, name) in enumerate(zip(self.__algorithms, self.__algorithm_names)):
+            generator = self.__generator if self.__generator is not None \
+                else functools.partial(uniform_population, algorithm.get_population_size())
+            for function_id in self.__function_ids:
+                for dimension in self.__dimensions:
+                    for repetition in range(self.__repetitions):
+                        key = (name, function_id, dimension, repetition)
+                        if index % self.__shard[1] == self.__shard[0] and key not in finished_cells:
+                            run_seed = np.random.SeedSequence(
+                                self.__entropy,
+                                spawn_key=(algorithm_idx, function_id, dimension, repetition)
+                            )
+                            yield (algorithm, name, function_id, dimension, repetition,
+                                   generator, self.__logger_options, run_seed,
+                                   self.__checkpoint_path(key), self.__checkpoint_interval)
+                        index += 1
+
+    def __checkpoint_path(self, key: tuple[str, int, int, int]) -> str | None:
+        if self.__checkpoint_dir is None:
+            return None
+        name, function_id, dimension, repetition = key
+        file_name = f'{name}_f{function_id}_D{dimension}_r{repetition}.pkl'.replace(os.sep, '_').replace(' ', '_')
+        return os.path.join(self.__checkpoint_dir, file_name)
+
+
+def uniform_population(population_size: int, dimension: int, rng: np.random.Generator) -> Genomes:
+    """
+    Generates the population uniformly distributed in the CEC2017 search space [-100, 100]^D.
+    """
+    return rng.uniform(-100, 100, (population_size, dimension))
+
+
+@functools.lru_cache(maxsize=None)
+def _objective_function(function_id: int, dimension: int) -> ObjectiveFunction:
+    # Problems are created once per worker process.
+    return negate(make_problem(function_id, dimension))
+
+
+def _conduct_cell(algorithm: EvolutionaryAlgorithm,
+                  name: str,
+                  function_id: int,
+                  dimension: int,
+                  repetition: int,
+                  generator: GridPopulationGenerator,
+                  logger_options: dict | None,
+                  run_seed: np.random.SeedSequence,
+                  checkpoint_path: str | None,
+                  checkpoint_interval: int) -> dict:
+    # Executed in the worker process.
+    rng = np.random.default_rng(run_seed)
+    logger = Logger(logger_options)
+    algorithm.set_logger(logger)
+    algorithm.set_rng(rng)
+    algorithm.set_objective_function(_objective_function(function_id, dimension))
+    algorithm.set_checkpointing(checkpoint_path, checkpoint_interval)
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        _, best_value = algorithm.resume(checkpoint_path)
+    else:
+        _, best_value = algorithm.run(generator(dimension, rng))
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        # The result is stored in the results file, so the checkpoint is not needed anymore.
+        os.remove(checkpoint_path)
+    return {
+        'algorithm': name,
+        'function': function_id,
+        'dimension': dimension,
+        'repetition': repetition,
+        'best_value': float(best_value),
+        # Distance to the known optimum of the CEC2017 function, which is 100 times its number.
+        'error': float(-best_value - 100 * function_id),
+        'iterations': algorithm.get_iterations(),
+        'evaluations': algorithm.get_evaluations(),
+        'log': {key: [float(v) for v in values] for key, values in logger.get_logger_data().items()}
+    }
+
+
+def _cell_key(result: dict) -> tuple[str, int, int, int]:
+    return result['algorithm'], result['function'], result['dimension'], result['repetition']
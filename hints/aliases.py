@@ -1,3 +1,4 @@
+import numpy as np
 from nptyping import NDArray, Shape, Float
 from collections.abc import Callable
 
@@ -6,5 +7,7 @@ Individual = NDArray[Shape['1, *'], Float]
 EvaluatedIndividual = tuple[Individual, float]
 Population = list[Individual]
 EvaluatedPopulation = list[EvaluatedIndividual]
+Genomes = NDArray[Shape['*, *'], Float]
+Fitness = NDArray[Shape['*'], Float]
 ObjectiveFunction = Callable[[Individual], float]
-GeneratePopulationFunction = Callable[[], Population]
+GeneratePopulationFunction = Callable[[np.random.Generator], Population | Genomes] | Callable[[], Population | Genomes]
@@ -1,6 +1,7 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from logger.regular import Logger
+from logger.regular import Logger, plot_statistics
+from logger.sink import ColumnarLogSink
+from logger.online import OnlineStatistics, P2Quantile
 from hints.aliases import EvaluatedPopulation
 
 
@@ -13,49 +14,93 @@ class AveragingLogger:
 
     It is possible to show data in graphical form as plots or
     dump it directly into file for further analysis.
+
+    In the online mode finished runs are folded into per iteration running
+    mean and variance (and optionally quantile estimates) and discarded, so
+    the memory does not grow with the number of runs and querying averaged
+    data does not recompute it from all runs.
     """
-    default_options = {
-        'v_max': True,
-        'v_min': True,
-        'v_avg': True,
-    }
+    default_options = Logger.default_options
 
-    def __init__(self, options: dict | None = None):
+    def __init__(self,
+                 options: dict | None = None,
+                 sink: ColumnarLogSink | None = None,
+                 online: bool = False,
+                 quantiles: list[float] | None = None):
         """
         Constructor of the AveragingLogger object.
 
         Construction is based on the passed dictionary of options.
         This options will be applied to every single run stored in
-        the AveragingLogger.
+        the AveragingLogger. Runs are also written to the sink, if it
+        is given.
 
-        Available options are:
+        Available options are the options of the Logger:
             - v_max: whether to store current best individual (True/False)
             - v_min: whether to store current worst individual (True/False)
             - v_avg: whether to store current average of individuals (True/False)
+            - v_std: whether to store current standard deviation of individuals (True/False)
+            - v_median: whether to store current median of individuals (True/False)
+            - d_centroid: whether to store mean distance of individuals to their centroid (True/False)
+            - d_std: whether to store standard deviation of genomes averaged over dimensions (True/False)
+            - d_pairwise: whether to store mean distance between pairs of individuals, estimated
+                          with pairwise_samples random pairs in bigger populations (True/False)
+            - pairwise_samples: number of pairs sampled for d_pairwise (int)
+            - decimation: store entries of every decimation-th iteration only, starting with the first (int)
 
         :param options: dictionary containing options used for data collection.
+        :param sink: sink where the entries of every run are written, None for keeping them only in memory.
+        :param online: whether to fold finished runs into running statistics instead of storing them.
+                       Averaged data gets also std_ keys, single runs are not available.
+        :param quantiles: quantiles estimated in the online mode, e.g. [0.5] adds q0.5_ keys to averaged data.
         """
+        if quantiles and not online:
+            raise RuntimeError('quantiles are available only in the online mode')
         self.__options = {**AveragingLogger.default_options, **options} \
             if options is not None \
             else AveragingLogger.default_options
+        self.__sink = sink
+        self.__online = online
+        self.__quantiles = quantiles or []
         self.__loggers = [
-            Logger(self.__options)
+            Logger(self.__options, self.__sink)
         ]
+        self.__reset_statistics()
 
     def clean_up(self) -> None:
         """
         Cleans the AveragingLogger internals after previous runs.
         """
         self.__loggers = []
+        self.__reset_statistics()
 
     def logging_for_new_run(self) -> None:
         """
         Sets AveragingLogger to collect data for the new run.
         """
+        self.__fold_finished_runs()
         self.__loggers.append(
-            Logger(self.__options)
+            Logger(self.__options, self.__sink)
         )
 
+    def add_run_logger(self, logger: Logger, stored: bool = False) -> None:
+        """
+        Adds the Logger holding data of the run conducted elsewhere, e.g. in another process.
+
+        :param logger: Logger of the finished run, created with the same options as the AveragingLogger
+        :param stored: whether the entries of the run were already written to the sink while it progressed
+        """
+        self.__loggers.append(logger)
+        if self.__sink is not None and not stored:
+            logger.store_in_sink(self.__sink)
+        self.__fold_finished_runs()
+
+    def get_options(self) -> dict:
+        """
+        Returns options applied to every single run.
+        """
+        return self.__options
+
     def get_logging_logger(self) -> type(Logger):
         """
         Returns the RegularLogger which is not collecting the information.
@@ -84,31 +129,21 @@ class AveragingLogger:
 
         :param i: index of the run which plots will be show. When passed -1 the averaging option will be used.
         """
-        if i < -1 or i >= len(self.__loggers):
-            raise RuntimeError(f'invalid i value: {i}')
+        self.__ensure_legit_index(i)
         if i > -1:
             self.__loggers[i].show_log_plots()
             return
         # Show averaged plots.
-        loggers_data = [logger.get_logger_data() for logger in self.__loggers]
+        data = self.__averaged_data()
         # Start to present the averaging version of the plots
-        plt.figure(figsize=(14, 7), layout='constrained')
-
-        if self.__options['v_max']:
-            avg_max = np.mean(a=[data['v_max'] for data in loggers_data], axis=0)
-            plt.plot([i for i in range(1, len(avg_max) + 1)], avg_max, label='max')
-        if self.__options['v_min']:
-            avg_min = np.mean(a=[data['v_min'] for data in loggers_data], axis=0)
-            plt.plot([i for i in range(1, len(avg_min) + 1)], avg_min, label='min')
-        if self.__options['v_avg']:
-            avg_avg = np.mean(a=[data['v_avg'] for data in loggers_data], axis=0)
-            plt.plot([i for i in range(1, len(avg_avg) + 1)], avg_avg, label='avg')
-
-        plt.xlabel('Iteration')
-        plt.ylabel('Objective function value')
-        plt.title(f'Average algorithm results of {len(self.__loggers)} runs')
-        plt.legend()
-        plt.show()
+        decimation = self.__options['decimation']
+        plot_statistics(
+            {
+                key: ([1 + i * decimation for i in range(len(data[f'avg_{key}']))], data[f'avg_{key}'])
+                for key in Logger.statistics if f'avg_{key}' in data
+            },
+            f'Average algorithm results of {self.__runs_count()} runs'
+        )
 
     def store_log(self, file_path: str, i: int = -1) -> None:
         """
@@ -117,24 +152,14 @@ class AveragingLogger:
         :param file_path: path to the file where logs will be stored.
         :param i: index of the logger which data will be stored, if -1 the averaging will be performed.
         """
-        if i < -1 or i >= len(self.__loggers):
-            raise RuntimeError(f'invalid i value {i}')
+        self.__ensure_legit_index(i)
         if i > -1:
             self.__loggers[i].store_log(file_path)
             return
         # Store averaged logs.
         with open(file_path, 'w') as file:
-            loggers_data = [logger.get_logger_data() for logger in self.__loggers]
-            # Store data accordingly to options.
-            if self.__options['v_max']:
-                avg_max = np.mean(a=[data['v_max'] for data in loggers_data], axis=0)
-                file.write(f'avg_v_max: {avg_max}\n')
-            if self.__options['v_min']:
-                avg_min = np.mean(a=[data['v_min'] for data in loggers_data], axis=0)
-                file.write(f'avg_v_min: {avg_min}\n')
-            if self.__options['v_avg']:
-                avg_avg = np.mean(a=[data['v_avg'] for data in loggers_data], axis=0)
-                file.write(f'avg_v_avg: {avg_avg}\n')
+            for key, values in self.__averaged_data().items():
+                file.write(f'{key}: {values}\n')
 
     def get_logger_data(self, i: int = -1) -> dict:
         """
@@ -147,19 +172,62 @@ class AveragingLogger:
         :return: dictionary containing data from single run or averaged data. Keys will
                 differ between single run data and averaged data.
         """
-        if i < -1 or i >= len(self.__loggers):
-            raise RuntimeError(f'invalid i value {i}')
+        self.__ensure_legit_index(i)
         if i > -1:
             return self.__loggers[i].get_logger_data()
         # Return the averaged data.
+        return self.__averaged_data()
+
+    def __ensure_legit_index(self, i: int) -> None:
+        if self.__online and i != -1:
+            raise RuntimeError('single runs are not stored in the online mode')
+        if i < -1 or i >= len(self.__loggers):
+            raise RuntimeError(f'invalid i value {i}')
+
+    def __averaged_data(self) -> dict:
         data = {}
+        if self.__online:
+            # Querying the data finishes the run in progress.
+            self.__fold_finished_runs(include_current=True)
+            for key, statistics in self.__statistics.items():
+                data[f'avg_{key}'] = statistics.mean()
+            for key, statistics in self.__statistics.items():
+                data[f'std_{key}'] = statistics.std()
+            for key, estimators in self.__quantile_estimators.items():
+                for p, estimator in zip(self.__quantiles, estimators):
+                    data[f'q{p:g}_{key}'] = estimator.quantile()
+            return data
         loggers_data = [logger.get_logger_data() for logger in self.__loggers]
-        # Get data accordingly to options.
-        if self.__options['v_max']:
-            data['avg_v_max'] = np.mean(a=[data['v_max'] for data in loggers_data], axis=0)
-        if self.__options['v_min']:
-            data['avg_v_min'] = np.mean(a=[data['v_min'] for data in loggers_data], axis=0)
-        if self.__options['v_avg']:
-            data['avg_v_avg'] = np.mean(a=[data['v_avg'] for data in loggers_data], axis=0)
-
+        # Get data accordingly to options, runs stopped early are averaged over iterations they reached.
+        for key in Logger.statistics:
+            if self.__options[key]:
+                runs = [data[key] for data in loggers_data]
+                padded = np.full((len(runs), max(map(len, runs), default=0)), np.nan)
+                for row, values in zip(padded, runs):
+                    row[:len(values)] = values
+                data[f'avg_{key}'] = np.nanmean(padded, axis=0)
         return data
+
+    def __reset_statistics(self) -> None:
+        self.__folded_runs = 0
+        self.__statistics = {}
+        self.__quantile_estimators = {}
+
+    def __fold_finished_runs(self, include_current: bool = False) -> None:
+        if not self.__online:
+            return
+        finished = self.__loggers if include_current else self.__loggers[:-1]
+        # The last logger may still be used by the algorithm, unless it was added finished.
+        for logger in finished:
+            for key, values in logger.get_logger_data().items():
+                if key not in self.__statistics:
+                    self.__statistics[key] = OnlineStatistics()
+                    self.__quantile_estimators[key] = [P2Quantile(p) for p in self.__quantiles]
+                self.__statistics[key].add(values)
+                for estimator in self.__quantile_estimators[key]:
+                    estimator.add(values)
+            self.__folded_runs += 1
+        self.__loggers = [] if include_current else self.__loggers[-1:]
+
+    def __runs_count(self) -> int:
+        return self.__folded_runs + len(self.__loggers)
@@ -0,0 +1,151 @@
+import numpy as np
+
+
+class OnlineStatistics:
+    """
+    Class accumulating per iteration mean and variance of the series with Welford's algorithm.
+
+    Every added series holds a single value per iteration, e.g. the best
+    value of every iteration of a single run. Memory used is proportional
+    to the number of iterations and does not depend on the number of series.
+    Series may have different lengths, every iteration is averaged over
+    series reaching it.
+    """
+
+    def __init__(self):
+        self.__count = np.zeros(0)
+        self.__mean = np.zeros(0)
+        self.__m2 = np.zeros(0)
+
+    def add(self, series) -> None:
+        """
+        Adds the series to the statistics.
+
+        :param series: values of the subsequent iterations
+        """
+        series = np.asarray(series, dtype=np.float64)
+        length = len(series)
+        self.__count, self.__mean, self.__m2 = _grow([self.__count, self.__mean, self.__m2], length)
+        count = self.__count[:length]
+        count += 1
+        delta = series - self.__mean[:length]
+        self.__mean[:length] += delta / count
+        self.__m2[:length] += delta * (series - self.__mean[:length])
+
+    def count(self) -> np.ndarray:
+        """
+        Returns the number of series reaching every iteration.
+        """
+        return self.__count.copy()
+
+    def mean(self) -> np.ndarray:
+        """
+        Returns the mean of every iteration.
+        """
+        return self.__mean.copy()
+
+    def std(self) -> np.ndarray:
+        """
+        Returns the (population) standard deviation of every iteration.
+        """
+        return np.sqrt(self.__m2 / np.maximum(self.__count, 1))
+
+
+class P2Quantile:
+    """
+    Class estimating the per iteration quantile of the series with the P-square algorithm [1].
+
+    The estimator keeps 5 markers per iteration, so its memory does not depend
+    on the number of series. All iterations are updated at once with NumPy.
+    Quantile of the iteration reached by less than 5 series is exact.
+
+    [1]: R. Jain, I. Chlamtac, The P2 algorithm for dynamic calculation of quantiles
+         and histograms without storing observations, Communications of the ACM, 1985
+    """
+
+    def __init__(self, p: float):
+        """
+        :param p: quantile to estimate, between 0 and 1
+        """
+        if not 0 <= p <= 1:
+            raise RuntimeError(f'invalid quantile: {p}')
+        self.__p = p
+        self.__increments = np.array([0, p / 2, p, (1 + p) / 2, 1])[:, np.newaxis]
+        # Heights, actual positions and desired positions of the markers, one column per iteration.
+        self.__heights = np.zeros((5, 0))
+        self.__positions = np.zeros((5, 0))
+        self.__desired = np.zeros((5, 0))
+        self.__count = np.zeros(0, dtype=np.int64)
+
+    def add(self, series) -> None:
+        """
+        Adds the series to the estimator.
+
+        :param series: values of the subsequent iterations
+        """
+        series = np.asarray(series, dtype=np.float64)
+        length = len(series)
+        self.__count, = _grow([self.__count], length)
+        self.__heights, self.__positions, self.__desired = _grow(
+            [self.__heights, self.__positions, self.__desired], length
+        )
+        count = self.__count[:length]
+        # Initial observations are stored as markers heights, sorted once there are 5 of them.
+        initial = np.flatnonzero(count < 5)
+        self.__heights[count[initial], initial] = series[initial]
+        filled = initial[count[initial] == 4]
+        self.__heights[:, filled] = np.sort(self.__heights[:, filled], axis=0)
+        self.__positions[:, filled] = np.arange(1, 6)[:, np.newaxis]
+        self.__desired[:, filled] = 1 + 4 * self.__increments
+        updated = np.flatnonzero(count >= 5)
+        if len(updated):
+            self.__update(updated, series[updated])
+        count += 1
+
+    def __update(self, columns: np.ndarray, x: np.ndarray) -> None:
+        q = self.__heights[:, columns]
+        n = self.__positions[:, columns]
+        # Extreme markers follow the minimum and maximum.
+        q[0] = np.minimum(q[0], x)
+        q[4] = np.maximum(q[4], x)
+        # Markers above the observation are moved by one position.
+        n += x < q
+        n[4] += x >= q[4]
+        self.__desired[:, columns] += self.__increments
+        nd = self.__desired[:, columns]
+        for i in range(1, 4):
+            d = nd[i] - n[i]
+            move = ((d >= 1) & (n[i + 1] - n[i] > 1)) | ((d <= -1) & (n[i - 1] - n[i] < -1))
+            d = np.where(move, np.sign(d), 0.0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                neighbour = np.where(d > 0, i + 1, i - 1)
+                q_neighbour = np.take_along_axis(q, neighbour[np.newaxis, :], axis=0)[0]
+                n_neighbour = np.take_along_axis(n, neighbour[np.newaxis, :], axis=0)[0]
+                linear = q[i] + d * (q_neighbour - q[i]) / (n_neighbour - n[i])
+            adjusted = np.where((q[i - 1] < parabolic) & (parabolic < q[i + 1]), parabolic, linear)
+            q[i] = np.where(move, adjusted, q[i])
+            n[i] += d
+        self.__heights[:, columns] = q
+        self.__positions[:, columns] = n
+
+    def quantile(self) -> np.ndarray:
+        """
+        Returns the estimated quantile of every iteration.
+        """
+        result = self.__heights[2].copy()
+        for column in np.flatnonzero(self.__count < 5):
+            result[column] = np.quantile(self.__heights[:self.__count[column], column], self.__p)
+        return result
+
+
+def _grow(arrays: list[np.ndarray], length: int) -> list[np.ndarray]:
+    # Pads the last axis of the arrays with zeros up to the given length.
+    return [
+        np.concatenate([a, np.zeros(a.shape[:-1] + (length - a.shape[-1],), dtype=a.dtype)], axis=-1)
+        if a.shape[-1] < length else a
+        for a in arrays
+    ]
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from hints.aliases import EvaluatedPopulation
+from logger.sink import ColumnarLogSink
+from population.array import PopulationArray
+from hints.aliases import EvaluatedPopulation, Fitness, Genomes
 
 
 class Logger:
@@ -17,50 +19,150 @@ class Logger:
         'v_max': True,
         'v_min': True,
         'v_avg': True,
+        'v_std': False,
+        'v_median': False,
+        'd_centroid': False,
+        'd_std': False,
+        'd_pairwise': False,
+        'pairwise_samples': 256,
+        'decimation': 1,
     }
+    # Statistics of the objective function values, in the order of storing and plotting.
+    fitness_statistics = ('v_max', 'v_min', 'v_avg', 'v_std', 'v_median')
+    # Statistics of the genomes diversity, in the order of storing and plotting.
+    diversity_statistics = ('d_centroid', 'd_std', 'd_pairwise')
+    statistics = fitness_statistics + diversity_statistics
 
-    def __init__(self, options: dict | None = None):
+    def __init__(self, options: dict | None = None, sink: ColumnarLogSink | None = None):
         """
         Constructor of the Logger object.
 
         Construction is based on the passed dictionary of options.
+        Every entry is also written to the sink, if it is given, so the logs
+        are stored while the run progresses. Every run gets a new run index.
 
         Available options are:
             - v_max: whether to store current best individual (True/False)
             - v_min: whether to store current worst individual (True/False)
             - v_avg: whether to store current average of individuals (True/False)
+            - v_std: whether to store current standard deviation of individuals (True/False)
+            - v_median: whether to store current median of individuals (True/False)
+            - d_centroid: whether to store mean distance of individuals to their centroid (True/False)
+            - d_std: whether to store standard deviation of genomes averaged over dimensions (True/False)
+            - d_pairwise: whether to store mean distance between pairs of individuals, estimated
+                          with pairwise_samples random pairs in bigger populations (True/False)
+            - pairwise_samples: number of pairs sampled for d_pairwise (int)
+            - decimation: store entries of every decimation-th iteration only, starting with the first (int)
 
         :param options: dictionary containing options used for data collection.
+        :param sink: sink where the entries are streamed, None for keeping them only in memory.
         """
-        self.__max = []
-        self.__min = []
-        self.__avg = []
         self.__options = {**Logger.default_options, **options} \
             if options is not None \
             else Logger.default_options
+        if self.__options['decimation'] < 1:
+            raise RuntimeError(f'invalid decimation: {self.__options["decimation"]}')
+        self.__data = {key: [] for key in Logger.statistics if self.__options[key]}
+        self.__iterations = 0
+        self.__sink = sink
+        self.__run = None
+        # Sampling of pairs does not use the generator of the algorithm, so logging does not affect the run.
+        self.__rng = np.random.default_rng(0)
 
     def clean_up(self) -> None:
         """
         Cleans the Logger internals after previous run.
         """
-        self.__max = []
-        self.__min = []
-        self.__avg = []
+        self.__data = {key: [] for key in self.__data}
+        self.__iterations = 0
+        self.__run = None
+        self.__rng = np.random.default_rng(0)
 
-    def generate_new_log_entry(self, eval_population: EvaluatedPopulation) -> None:
+    def generate_new_log_entry(self, eval_population: EvaluatedPopulation | PopulationArray | Fitness) -> None:
         """
         Generates new entry for each of collecting logging information.
 
         This method should be used only by the EvolutionaryAlgorithm class.
 
-        :param eval_population: EvaluatedPopulation of current iteration for which the logs will be generated
+        :param eval_population: EvaluatedPopulation, PopulationArray or objective function values
+                                of current iteration for which the logs will be generated, diversity
+                                statistics require genomes of the individuals
         """
+        iteration = self.__iterations
+        self.__iterations += 1
+        if iteration % self.__options['decimation'] != 0:
+            return
+        fitness = Logger.__fitness(eval_population)
+        entry = {}
         if self.__options['v_max']:
-            self.__max.append(max(eval_population, key=lambda i: i[1])[1])
+            entry['v_max'] = fitness.max()
         if self.__options['v_min']:
-            self.__min.append(min(eval_population, key=lambda i: i[1])[1])
-        if self.__options['v_avg']:
-            self.__avg.append(np.mean([i[1] for i in eval_population]))
+            entry['v_min'] = fitness.min()
+        if self.__options['v_avg'] or self.__options['v_std']:
+            mean = fitness.mean()
+            if self.__options['v_avg']:
+                entry['v_avg'] = mean
+            if self.__options['v_std']:
+                deviation = fitness - mean
+                entry['v_std'] = np.sqrt(np.dot(deviation, deviation) / len(fitness))
+        if self.__options['v_median']:
+            entry['v_median'] = np.median(fitness)
+        if any(self.__options[key] for key in Logger.diversity_statistics):
+            entry.update(self.__diversity(Logger.__genomes(eval_population)))
+        for key, value in entry.items():
+            self.__data[key].append(float(value))
+        if self.__sink is not None:
+            if self.__run is None:
+                self.__run = self.__sink.new_run()
+            self.__sink.write(self.__run, iteration, entry)
+
+    def set_logger_data(self, data: dict, iterations: int | None = None) -> None:
+        """
+        Replaces data stored in logger, e.g. with data returned by get_logger_data before interruption.
+
+        :param data: data returned by get_logger_data
+        :param iterations: number of iterations logged so far, by default derived from the number of entries
+        """
+        self.__data = {key: list(data.get(key, [])) for key in self.__data}
+        if iterations is None:
+            iterations = self.__entries_count() * self.__options['decimation']
+        self.__iterations = iterations
+
+    def get_state(self) -> dict:
+        """
+        Returns the logged data together with the state of the pair sampling, stored in the algorithm checkpoints.
+        """
+        return {
+            'data': self.get_logger_data(),
+            'iterations': self.__iterations,
+            'rng_state': self.__rng.bit_generator.state
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restores the state returned by get_state, so the resumed run logs the same entries as the uninterrupted one.
+
+        :param state: state returned by get_state
+        """
+        self.set_logger_data(state['data'], state['iterations'])
+        self.__rng.bit_generator.state = state['rng_state']
+
+    def get_logged_iterations(self) -> list[int]:
+        """
+        Returns the 1-based numbers of the iterations having entries.
+        """
+        decimation = self.__options['decimation']
+        return [1 + i * decimation for i in range(self.__entries_count())]
+
+    def store_in_sink(self, sink: ColumnarLogSink) -> None:
+        """
+        Writes all entries stored in logger to the sink as the new run.
+
+        :param sink: sink where the entries will be written
+        """
+        run = sink.new_run()
+        for i, iteration in enumerate(self.get_logged_iterations()):
+            sink.write(run, iteration - 1, {key: values[i] for key, values in self.__data.items()})
 
     def show_log_plots(self) -> None:
         """
@@ -68,20 +170,11 @@ class Logger:
 
         Plots are shown accordingly to options passed in the constructor.
         """
-        plt.figure(figsize=(14, 7), layout='constrained')
-
-        if self.__options['v_max']:
-            plt.plot([i for i in range(1, len(self.__max) + 1)], self.__max, label='max')
-        if self.__options['v_min']:
-            plt.plot([i for i in range(1, len(self.__min) + 1)], self.__min, label='min')
-        if self.__options['v_avg']:
-            plt.plot([i for i in range(1, len(self.__avg) + 1)], self.__avg, label='avg')
-
-        plt.xlabel('Iteration')
-        plt.ylabel('Objective function value')
-        plt.title('Algorithm results of the single run')
-        plt.legend()
-        plt.show()
+        iterations = self.get_logged_iterations()
+        plot_statistics(
+            {key: (iterations, values) for key, values in self.__data.items()},
+            'Algorithm results of the single run'
+        )
 
     def store_log(self, file_path: str) -> None:
         """
@@ -90,23 +183,83 @@ class Logger:
         :param file_path: path to the file where logs will be stored.
         """
         with open(file_path, 'w') as file:
-            if self.__options['v_max']:
-                file.write(f'v_max: {self.__max}\n')
-            if self.__options['v_min']:
-                file.write(f'v_min: {self.__min}\n')
-            if self.__options['v_avg']:
-                file.write(f'v_avg: {self.__avg}\n')
+            for key, values in self.__data.items():
+                file.write(f'{key}: {values}\n')
 
     def get_logger_data(self) -> dict:
         """
         Returns data stored in logger with respect to options.
         """
-        data = {}
-        if self.__options['v_max']:
-            data['v_max'] = self.__max
-        if self.__options['v_min']:
-            data['v_min'] = self.__min
-        if self.__options['v_avg']:
-            data['v_avg'] = self.__avg
+        return dict(self.__data)
+
+    def __diversity(self, genomes: Genomes) -> dict:
+        entry = {}
+        if self.__options['d_centroid'] or self.__options['d_std']:
+            deviation = genomes - genomes.mean(axis=0)
+            if self.__options['d_centroid']:
+                entry['d_centroid'] = np.mean(np.sqrt(np.einsum('ij,ij->i', deviation, deviation)))
+            if self.__options['d_std']:
+                entry['d_std'] = np.mean(np.sqrt(np.einsum('ij,ij->j', deviation, deviation) / len(genomes)))
+        if self.__options['d_pairwise']:
+            entry['d_pairwise'] = self.__pairwise_distance(genomes)
+        return entry
+
+    def __pairwise_distance(self, genomes: Genomes) -> float:
+        size = len(genomes)
+        if size < 2:
+            return 0.0
+        samples = self.__options['pairwise_samples']
+        if size * (size - 1) // 2 <= samples:
+            # Small population, every pair is used.
+            first, second = np.triu_indices(size, k=1)
+        else:
+            first = self.__rng.integers(size, size=samples)
+            # Offset drawn from [1, size) guarantees distinct individuals.
+            second = (first + self.__rng.integers(1, size, size=samples)) % size
+        difference = genomes[first] - genomes[second]
+        return np.mean(np.sqrt(np.einsum('ij,ij->i', difference, difference)))
+
+    @staticmethod
+    def __genomes(eval_population: EvaluatedPopulation | PopulationArray | Fitness) -> Genomes:
+        if isinstance(eval_population, PopulationArray):
+            return eval_population.genomes
+        if isinstance(eval_population, np.ndarray):
+            raise RuntimeError('diversity statistics require genomes of the individuals')
+        return np.array([i[0] for i in eval_population], dtype=np.float64, ndmin=2)
 
-        return data
+    @staticmethod
+    def __fitness(eval_population: EvaluatedPopulation | PopulationArray | Fitness) -> Fitness:
+        if isinstance(eval_population, PopulationArray):
+            return eval_population.fitness
+        if isinstance(eval_population, np.ndarray):
+            return eval_population
+        return np.fromiter((i[1] for i in eval_population), dtype=np.float64, count=len(eval_population))
+
+    def __entries_count(self) -> int:
+        return max((len(values) for values in self.__data.values()), default=0)
+
+
+def plot_statistics(data: dict[str, tuple[list[int], list[float]]], title: str) -> None:
+    """
+    Shows the plots of the logged statistics.
+
+    Objective function statistics and diversity statistics are shown in separate figures.
+
+    :param data: dictionary mapping names of the statistics to their iterations and values
+    :param title: title of the objective function figure
+    """
+    for statistics, y_label, figure_title in (
+            (Logger.fitness_statistics, 'Objective function value', title),
+            (Logger.diversity_statistics, 'Population diversity', f'{title}: diversity')):
+        shown = [key for key in statistics if key in data]
+        if not shown:
+            continue
+        plt.figure(figsize=(14, 7), layout='constrained')
+        for key in shown:
+            iterations, values = data[key]
+            plt.plot(iterations, values, label=key[2:])
+        plt.xlabel('Iteration')
+        plt.ylabel(y_label)
+        plt.title(figure_title)
+        plt.legend()
+        plt.show()
@@ -0,0 +1,172 @@
+import os
+import json
+import numpy as np
+
+
+class ColumnarLogSink:
+    """
+    Class appending log entries to the binary columnar files.
+
+    Every column is stored in a separate file of raw little endian values,
+    run and iteration columns as int64 and statistics as float64. Entries
+    are buffered and appended to the files in chunks, so the logs of a long
+    run are stored as it progresses and never kept in memory as a whole.
+    The names of the statistics are stored in columns.json file.
+
+    The directory may hold logs of many runs, e.g. the whole campaign,
+    and is loaded as arrays with the load method. A single directory
+    should be written by a single process at a time.
+    """
+
+    index_columns = {
+        'run': np.dtype('<i8'),
+        'iteration': np.dtype('<i8'),
+    }
+    value_dtype = np.dtype('<f8')
+    columns_file_name = 'columns.json'
+
+    def __init__(self, directory: str, chunk_size: int = 1024):
+        """
+        Constructs the ColumnarLogSink object.
+
+        Entries are appended to the logs already stored in the directory.
+
+        :param directory: directory where the column files are stored
+        :param chunk_size: number of entries buffered before appending them to the files
+        """
+        self.__directory = directory
+        self.__chunk_size = chunk_size
+        self.__columns = ColumnarLogSink.__read_columns(directory)
+        self.__buffer = []
+        self.__next_run = 0
+        os.makedirs(directory, exist_ok=True)
+        run_path = ColumnarLogSink.__column_path(directory, 'run')
+        if os.path.exists(run_path):
+            runs = np.fromfile(run_path, dtype=ColumnarLogSink.index_columns['run'])
+            self.__next_run = int(runs.max()) + 1 if len(runs) else 0
+
+    def new_run(self) -> int:
+        """
+        Returns the index of the new run, distinct from the runs already stored.
+        """
+        run = self.__next_run
+        self.__next_run += 1
+        return run
+
+    def write(self, run: int, iteration: int, entry: dict[str, float]) -> None:
+        """
+        Appends the log entry of the single iteration.
+
+        :param run: index of the run, obtained with new_run method
+        :param iteration: index of the iteration within the run
+        :param entry: values of the statistics, every entry has to hold the same statistics
+        """
+        if self.__columns is None:
+            self.__columns = sorted(entry)
+            with open(os.path.join(self.__directory, ColumnarLogSink.columns_file_name), 'w') as columns_file:
+                json.dump(self.__columns, columns_file)
+        elif len(entry) != len(self.__columns) or any(c not in entry for c in self.__columns):
+            raise RuntimeError(f'log entry does not match columns: {self.__columns}')
+        self.__buffer.append((run, iteration, *(entry[c] for c in self.__columns)))
+        if len(self.__buffer) >= self.__chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Appends the buffered entries to the files.
+        """
+        if not self.__buffer:
+            return
+        rows = np.array(self.__buffer, dtype=np.float64)
+        run_column, iteration_column = ColumnarLogSink.index_columns
+        self.__append(run_column, rows[:, 0].astype(ColumnarLogSink.index_columns[run_column]))
+        self.__append(iteration_column, rows[:, 1].astype(ColumnarLogSink.index_columns[iteration_column]))
+        for i, column in enumerate(self.__columns):
+            self.__append(column, rows[:, i + 2].astype(ColumnarLogSink.value_dtype))
+        self.__buffer = []
+
+    def merge(self, directory: str) -> None:
+        """
+        Appends logs stored in another directory, e.g. written by another process.
+
+        Every merged run gets a new run index, in the order of the original indices.
+
+        :param directory: directory where the column files are stored
+        """
+        if ColumnarLogSink.__read_columns(directory) is None:
+            return
+        data = ColumnarLogSink.load(directory)
+        runs, run_idx = np.unique(data['run'], return_inverse=True)
+        new_runs = [self.new_run() for _ in runs]
+        statistics = [c for c in data if c not in ColumnarLogSink.index_columns]
+        for i, iteration in enumerate(data['iteration']):
+            self.write(new_runs[run_idx[i]], int(iteration), {c: float(data[c][i]) for c in statistics})
+
+    def close(self) -> None:
+        """
+        Appends the buffered entries to the files, the sink may still be used afterwards.
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self):
+        # Buffered entries are appended first, so that they are not written again by the copy of the sink.
+        self.flush()
+        return self.__dict__
+
+    def __append(self, column: str, values: np.ndarray) -> None:
+        with open(ColumnarLogSink.__column_path(self.__directory, column), 'ab') as column_file:
+            values.tofile(column_file)
+
+    @staticmethod
+    def load(directory: str) -> dict[str, np.ndarray]:
+        """
+        Loads logs stored in the directory.
+
+        :param directory: directory where the column files are stored
+        :return: dictionary mapping names of the columns (run, iteration and the statistics)
+                 to the arrays holding a single value per entry
+        """
+        columns = ColumnarLogSink.__read_columns(directory)
+        if columns is None:
+            raise RuntimeError(f'no logs in directory: {directory}')
+        dtypes = {**ColumnarLogSink.index_columns, **{c: ColumnarLogSink.value_dtype for c in columns}}
+        data = {}
+        for column, dtype in dtypes.items():
+            path = ColumnarLogSink.__column_path(directory, column)
+            data[column] = np.fromfile(path, dtype=dtype) if os.path.exists(path) else np.empty(0, dtype)
+        # Interruption while appending a chunk may leave columns of different lengths.
+        length = min(len(values) for values in data.values())
+        return {column: values[:length] for column, values in data.items()}
+
+    @staticmethod
+    def to_runs_matrix(data: dict[str, np.ndarray], column: str) -> np.ndarray:
+        """
+        Arranges the loaded column into the matrix holding a single run in every row.
+
+        :param data: logs returned by the load method
+        :param column: name of the statistic
+        :return: (runs, iterations) matrix, iterations missing in shorter runs are NaN
+        """
+        runs, run_idx = np.unique(data['run'], return_inverse=True)
+        iterations = data['iteration']
+        matrix = np.full((len(runs), int(iterations.max()) + 1 if len(iterations) else 0), np.nan)
+        matrix[run_idx, iterations] = data[column]
+        return matrix
+
+    @staticmethod
+    def __read_columns(directory: str) -> list[str] | None:
+        path = os.path.join(directory, ColumnarLogSink.columns_file_name)
+        if not os.path.exists(path):
+            return None
+        with open(path) as columns_file:
+            return json.load(columns_file)
+
+    @staticmethod
+    def __column_path(directory: str, column: str) -> str:
+        return os.path.join(directory, column + '.bin')
@@ -1,16 +1,47 @@
 from population.generator import PopulationGenerator
 from evolutionary.algorithm import EvolutionaryAlgorithm
 from evolutionary.strategies import *
+from evolutionary.evaluators import BatchEvaluator
 from experiment.comparison import ExperimentComparison
+from experiment.grid import ExperimentGrid
 from cec2017.functions import f10
 from cec2017.negate import negate
+import sys
 
 
-def generator():
-    return PopulationGenerator.generate_population_uniform_distribution(0, 10, 2, 100)
+def generator(rng):
+    return PopulationGenerator.generate_population_uniform_distribution(0, 10, 2, 100, rng)
 
 
-if __name__ == '__main__':
+def campaign():
+    # Example of the usage of ExperimentGrid class, every strategy on every CEC2017 function
+    # except the deprecated f2. Results are appended to the campaign.jsonl file.
+    # CEC2017 problems evaluate the whole population at once.
+    algorithms = [
+        EvolutionaryAlgorithm(strategy=None, evaluator=BatchEvaluator()),
+        EvolutionaryAlgorithm(strategy=MutationStrategy(), evaluator=BatchEvaluator()),
+        EvolutionaryAlgorithm(strategy=AverageMirroringStrategy(), evaluator=BatchEvaluator()),
+        EvolutionaryAlgorithm(strategy=DifferentialEvolutionStrategy(), evaluator=BatchEvaluator())
+    ]
+    algorithm_names = [
+        'No strategy',
+        'Mutation',
+        'Mirroring',
+        'Differential'
+    ]
+    grid = ExperimentGrid(
+        algorithms,
+        algorithm_names,
+        function_ids=[1] + list(range(3, 31)),
+        dimensions=[10, 30, 50, 100],
+        results_path='campaign.jsonl',
+        repetitions=51,
+        seed=0
+    )
+    grid.conduct()
+
+
+def comparison():
     # Example of the usage of ExperimentComparison class.
     strategy0 = None
     strategy1 = MutationStrategy()
@@ -47,3 +78,10 @@ if __name__ == '__main__':
 
     experiment_comparison.conduct()
 
+
+if __name__ == '__main__':
+    # Run with the campaign argument in order to conduct the whole benchmark campaign.
+    if sys.argv[1:] == ['campaign']:
+        campaign()
+    else:
+        comparison()
@@ -0,0 +1,114 @@
+import numpy as np
+from hints.aliases import *
+
+
+class PopulationArray:
+    """
+    Class representing the evaluated population stored in arrays.
+
+    Genomes of the individuals are kept as rows of a single contiguous
+    (population_size, D) float64 matrix and their objective function
+    values as a (population_size,) vector. This way operations on the
+    whole population take a few NumPy calls instead of a Python loop.
+
+    Iterating over the PopulationArray yields (individual, value) pairs,
+    the same as iterating over the EvaluatedPopulation list.
+    """
+
+    def __init__(self, genomes: Genomes, fitness: Fitness):
+        """
+        Constructs the PopulationArray object.
+
+        :param genomes: matrix holding a single individual in every row
+        :param fitness: objective function values of the individuals
+        """
+        self.__genomes = np.ascontiguousarray(genomes, dtype=np.float64)
+        self.__fitness = np.ascontiguousarray(fitness, dtype=np.float64)
+        if self.__genomes.ndim != 2 or self.__fitness.shape != (self.__genomes.shape[0],):
+            raise RuntimeError('genomes and fitness shapes do not match')
+
+    @staticmethod
+    def from_evaluated_population(eval_population: EvaluatedPopulation) -> 'PopulationArray':
+        """
+        Creates the PopulationArray from the list of evaluated individuals.
+
+        :param eval_population: evaluated population which will be converted
+        :return: PopulationArray holding the same individuals in the same order
+        """
+        genomes = np.array([i[0] for i in eval_population], dtype=np.float64, ndmin=2)
+        fitness = np.array([i[1] for i in eval_population], dtype=np.float64)
+        return PopulationArray(genomes, fitness)
+
+    @staticmethod
+    def concatenate(populations: list['PopulationArray']) -> 'PopulationArray':
+        """
+        Joins the populations into a single one, preserving their order.
+        """
+        return PopulationArray(
+            np.concatenate([p.genomes for p in populations]),
+            np.concatenate([p.fitness for p in populations])
+        )
+
+    @property
+    def genomes(self) -> Genomes:
+        return self.__genomes
+
+    @property
+    def fitness(self) -> Fitness:
+        return self.__fitness
+
+    def to_evaluated_population(self) -> EvaluatedPopulation:
+        """
+        Converts the PopulationArray into the list of evaluated individuals.
+        """
+        return [(genome.copy(), float(value)) for genome, value in self]
+
+    def take(self, indices) -> 'PopulationArray':
+        """
+        Returns the population consisting of the individuals with given indices.
+        """
+        return PopulationArray(self.__genomes[indices], self.__fitness[indices])
+
+    def best_indices(self, k: int) -> np.ndarray:
+        """
+        Returns indices of the k individuals with the highest objective function values.
+
+        Selection takes linear time since individuals are not sorted, indices
+        are returned in the population order.
+        """
+        return self.__select(-self.__fitness, k)[0]
+
+    def split_weakest(self, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Splits the population into k individuals with the lowest objective function
+        values and the remaining ones.
+
+        Selection takes linear time since individuals are not sorted, indices
+        are returned in the population order.
+
+        :return: indices of the weakest individuals and indices of the remaining ones
+        """
+        return self.__select(self.__fitness, k)
+
+    @staticmethod
+    def __select(values: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        k = max(0, min(k, len(values)))
+        selected = np.zeros(len(values), dtype=bool)
+        if 0 < k < len(values):
+            selected[np.argpartition(values, k - 1)[:k]] = True
+        else:
+            selected[:k] = True
+        return np.flatnonzero(selected), np.flatnonzero(~selected)
+
+    def best(self) -> EvaluatedIndividual:
+        """
+        Returns the individual with the highest objective function value.
+        """
+        i = int(np.argmax(self.__fitness))
+        return self.__genomes[i].copy(), float(self.__fitness[i])
+
+    def __len__(self) -> int:
+        return len(self.__fitness)
+
+    def __iter__(self):
+        return zip(self.__genomes, self.__fitness)
@@ -1,5 +1,6 @@
 import numpy as np
-from hints.aliases import Population
+from hints.aliases import Genomes, ObjectiveFunction
+from evolutionary.evaluators import Evaluator, SerialEvaluator
 
 
 class PopulationGenerator:
@@ -7,7 +8,8 @@ class PopulationGenerator:
     def generate_population_normal_distribution(loc: float | list[float],
                                                 scale: float | list[float],
                                                 individual_size: int,
-                                                population_size: int) -> Population:
+                                                population_size: int,
+                                                rng: np.random.Generator | int | None = None) -> Genomes:
         """
         Generates population with normal distribution.
 
@@ -15,16 +17,19 @@ class PopulationGenerator:
         :param scale: standard deviation (spread or “width”) of the distribution
         :param individual_size: size of the single individual which will be generated
         :param population_size: size of the whole population which will be generated
+        :param rng: random generator or its seed, unseeded generator is used if None
 
-        :return: Generated population
+        :return: Generated population, matrix holding a single individual in every row
         """
-        return [np.random.normal(loc, scale, individual_size) for _ in range(population_size)]
+        rng = np.random.default_rng(rng)
+        return rng.normal(loc, scale, (population_size, individual_size))
 
     @staticmethod
     def generate_population_uniform_distribution(low: float | list[float],
                                                  high: float | list[float],
                                                  individual_size: int,
-                                                 population_size: int) -> Population:
+                                                 population_size: int,
+                                                 rng: np.random.Generator | int | None = None) -> Genomes:
         """
         Generates population with uniform distribution.
 
@@ -32,7 +37,126 @@ class PopulationGenerator:
         :param high: upper bound of the uniform distribution
         :param individual_size: size of the single individual which will be generated
         :param population_size: size of the whole population which will be generated
+        :param rng: random generator or its seed, unseeded generator is used if None
 
-        :return: Generated population
+        :return: Generated population, matrix holding a single individual in every row
         """
-        return [np.random.uniform(low, high, individual_size) for _ in range(population_size)]
+        rng = np.random.default_rng(rng)
+        return rng.uniform(low, high, (population_size, individual_size))
+
+    @staticmethod
+    def generate_population_latin_hypercube(low: float | list[float],
+                                            high: float | list[float],
+                                            individual_size: int,
+                                            population_size: int,
+                                            rng: np.random.Generator | int | None = None) -> Genomes:
+        """
+        Generates population with Latin hypercube sampling.
+
+        Range of every coordinate is split into population_size equal intervals
+        and every interval holds exactly one individual.
+
+        :param low: lower bound of the search space, e.g. -100 for CEC2017
+        :param high: upper bound of the search space, e.g. 100 for CEC2017
+        :param individual_size: size of the single individual which will be generated
+        :param population_size: size of the whole population which will be generated
+        :param rng: random generator or its seed, unseeded generator is used if None
+
+        :return: Generated population, matrix holding a single individual in every row
+        """
+        rng = np.random.default_rng(rng)
+        # Every column holds the shuffled indices of the intervals.
+        intervals = rng.permuted(np.tile(np.arange(population_size)[:, np.newaxis], individual_size), axis=0)
+        unit = (intervals + rng.uniform(0, 1, (population_size, individual_size))) / population_size
+        return _scale(unit, low, high)
+
+    @staticmethod
+    def generate_population_halton(low: float | list[float],
+                                   high: float | list[float],
+                                   individual_size: int,
+                                   population_size: int,
+                                   rng: np.random.Generator | int | None = None) -> Genomes:
+        """
+        Generates population with the scrambled Halton sequence.
+
+        Coordinate i is the radical inverse of the individual index in the i-th prime base.
+        Digits are scrambled with a random permutation per coordinate, which removes
+        the correlation of the coordinates with big bases in high dimensions.
+
+        :param low: lower bound of the search space, e.g. -100 for CEC2017
+        :param high: upper bound of the search space, e.g. 100 for CEC2017
+        :param individual_size: size of the single individual which will be generated
+        :param population_size: size of the whole population which will be generated
+        :param rng: random generator or its seed, unseeded generator is used if None
+
+        :return: Generated population, matrix holding a single individual in every row
+        """
+        rng = np.random.default_rng(rng)
+        unit = np.empty((population_size, individual_size))
+        # Index 0 is skipped, since all of its digits are zeros.
+        indices = np.arange(1, population_size + 1)
+        for i, base in enumerate(_primes(individual_size)):
+            # Zero digit is kept, so that the trailing zeros do not change the value.
+            permutation = np.concatenate([[0], 1 + rng.permutation(base - 1)])
+            remaining = indices.copy()
+            value = np.zeros(population_size)
+            scale = 1.0
+            while np.any(remaining):
+                remaining, digits = np.divmod(remaining, base)
+                scale /= base
+                value += permutation[digits] * scale
+            unit[:, i] = value
+        return _scale(unit, low, high)
+
+    @staticmethod
+    def generate_population_opposition_based(low: float | list[float],
+                                             high: float | list[float],
+                                             individual_size: int,
+                                             population_size: int,
+                                             obj_func: ObjectiveFunction,
+                                             rng: np.random.Generator | int | None = None,
+                                             evaluator: Evaluator | None = None) -> Genomes:
+        """
+        Generates population with opposition-based initialisation [1].
+
+        Uniform population is extended with the opposite individuals low + high - x
+        and the population_size best of them (with respect to the maximized objective
+        function) are returned. Evaluations of the 2 * population_size individuals
+        are not counted by the EvolutionaryAlgorithm.
+
+        [1]: S. Rahnamayan, H. R. Tizhoosh, M. M. A. Salama, Opposition-Based
+             Differential Evolution, IEEE Transactions on Evolutionary Computation, 2008
+
+        :param low: lower bound of the search space, e.g. -100 for CEC2017
+        :param high: upper bound of the search space, e.g. 100 for CEC2017
+        :param individual_size: size of the single individual which will be generated
+        :param population_size: size of the whole population which will be generated
+        :param obj_func: objective function used for selecting the individuals
+        :param rng: random generator or its seed, unseeded generator is used if None
+        :param evaluator: evaluator of the individuals, SerialEvaluator by default
+
+        :return: Generated population, matrix holding a single individual in every row
+        """
+        evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        genomes = PopulationGenerator.generate_population_uniform_distribution(
+            low, high, individual_size, population_size, rng
+        )
+        genomes = np.concatenate([genomes, np.add(low, high) - genomes])
+        fitness = evaluator.evaluate(obj_func, genomes)
+        return genomes[np.argsort(-fitness, kind='stable')[:population_size]]
+
+
+def _scale(unit: Genomes, low: float | list[float], high: float | list[float]) -> Genomes:
+    # Maps the points of the unit hypercube into the search space.
+    low = np.asarray(low, dtype=np.float64)
+    return low + unit * (np.asarray(high, dtype=np.float64) - low)
+
+
+def _primes(count: int) -> list[int]:
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+
+from cec2017 import basic, kernels
+
+
+class TestKernels(unittest.TestCase):
+    dimensions = range(2, 101)
+    population_size = 5
+
+    def setUp(self):
+        self.rng = np.random.default_rng(42)
+
+    def assert_matches_reference(self, reference, kernel, *args):
+        for nx in self.dimensions:
+            x = self.rng.uniform(-100, 100, (self.population_size, nx))
+            # Reference implementations may modify their input.
+            expected = np.array([reference(row.copy(), *args) for row in x])
+            with self.subTest(kernel=kernel.__name__, nx=nx):
+                np.testing.assert_allclose(kernel(x, *args), expected, rtol=1e-10, atol=1e-10)
+
+    def test_kernels(self):
+        for reference, kernel in zip(basic.all_functions, kernels.all_functions):
+            self.assertEqual(reference.__name__, kernel.__name__)
+            self.assert_matches_reference(reference, kernel)
+
+    def test_kernels_with_shift_and_rotation(self):
+        for name in ['lunacek_bi_rastrigin', 'non_cont_rastrigin']:
+            reference, kernel = getattr(basic, name), getattr(kernels, name)
+            for nx in self.dimensions:
+                shift = self.rng.uniform(-80, 80, nx)
+                rotation, _ = np.linalg.qr(self.rng.standard_normal((nx, nx)))
+                x = self.rng.uniform(-100, 100, (self.population_size, nx))
+                expected = np.array([reference(row.copy(), shift, rotation) for row in x])
+                with self.subTest(kernel=name, nx=nx):
+                    np.testing.assert_allclose(kernel(x, shift, rotation), expected, rtol=1e-10, atol=1e-10)
+
+    def test_kernels_do_not_modify_input(self):
+        x = self.rng.uniform(-100, 100, (self.population_size, 10))
+        original = x.copy()
+        for kernel in kernels.all_functions:
+            kernel(x)
+        np.testing.assert_array_equal(x, original)
+
+
+if __name__ == '__main__':
+    unittest.main()
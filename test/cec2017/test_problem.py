@@ -0,0 +1,82 @@
+import pickle
+import unittest
+import numpy as np
+
+from cec2017.functions import all_functions, make_problem
+
+
+def random_rotation(rng, nx):
+    rotation, _ = np.linalg.qr(rng.standard_normal((nx, nx)))
+    return rotation
+
+
+def random_transforms(rng, fid, nx):
+    # Transformations named like the arguments of the function f<fid>.
+    if fid <= 10:
+        return {'rotation': random_rotation(rng, nx), 'shift': rng.uniform(-80, 80, nx)}
+    if fid <= 20:
+        return {
+            'rotation': random_rotation(rng, nx),
+            'shift': rng.uniform(-80, 80, nx),
+            'shuffle': rng.permutation(nx)
+        }
+    kwargs = {
+        'rotations': np.array([random_rotation(rng, nx) for _ in range(10)]),
+        'shifts': rng.uniform(-80, 80, (10, nx))
+    }
+    if fid >= 29:
+        kwargs['shuffles'] = np.array([rng.permutation(nx) for _ in range(10)])
+    return kwargs
+
+
+class TestProblem(unittest.TestCase):
+    nx = 10
+
+    def setUp(self):
+        self.rng = np.random.default_rng(42)
+
+    def test_problem_matches_function(self):
+        for fid, function in enumerate(all_functions, start=1):
+            if fid == 2:
+                # Deprecated function printing the warning.
+                continue
+            kwargs = random_transforms(self.rng, fid, self.nx)
+            problem = make_problem(fid, self.nx, **kwargs)
+            population = self.rng.uniform(-100, 100, (6, self.nx))
+            with self.subTest(fid=fid):
+                np.testing.assert_allclose(problem(population), function(population, **kwargs), rtol=1e-12)
+                np.testing.assert_allclose(problem.evaluate(population), problem(population), rtol=1e-12)
+                self.assertAlmostEqual(problem(population[0]), function(population[0], **kwargs))
+
+    def test_transforms_are_read_only(self):
+        kwargs = random_transforms(self.rng, 1, self.nx)
+        problem = make_problem(1, self.nx, **kwargs)
+        population = self.rng.uniform(-100, 100, (4, self.nx))
+        expected = problem(population)
+        # Modifying the original data does not affect the problem.
+        kwargs['shift'][:] = 0.0
+        np.testing.assert_array_equal(problem(population), expected)
+
+    def test_pickle(self):
+        population = self.rng.uniform(-100, 100, (4, self.nx))
+        # Simple, hybrid and composition function.
+        for fid in (5, 13, 29):
+            with self.subTest(fid=fid):
+                problem = make_problem(fid, self.nx, **random_transforms(self.rng, fid, self.nx))
+                restored = pickle.loads(pickle.dumps(problem))
+                self.assertEqual((problem.fid, problem.dimension), (restored.fid, restored.dimension))
+                np.testing.assert_array_equal(problem(population), restored(population))
+
+    def test_invalid_dimension(self):
+        problem = make_problem(1, self.nx, **random_transforms(self.rng, 1, self.nx))
+
+        with self.assertRaises(ValueError):
+            problem.evaluate(np.zeros((4, self.nx + 1)))
+
+    def test_invalid_function(self):
+        with self.assertRaises(ValueError):
+            make_problem(31, self.nx)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+
+from cec2017 import transforms
+
+
+class TestTransforms(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data = {
+            'M_D2': np.arange(20 * 2 * 2, dtype=np.float64).reshape((20, 2, 2)),
+            'shift': np.ones((20, 100))
+        }
+        self.pkl_path = os.path.join(self.tmp_dir.name, 'data.pkl')
+        self.data_dir = os.path.join(self.tmp_dir.name, 'data')
+        with open(self.pkl_path, 'wb') as pkl_file:
+            pickle.dump(self.data, pkl_file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_convert_and_load(self):
+        transforms.convert_pickle(self.pkl_path, self.data_dir)
+        for name, expected in self.data.items():
+            array = transforms.load(name, self.data_dir)
+            self.assertIsInstance(array, np.memmap)
+            self.assertFalse(array.flags.writeable)
+            np.testing.assert_array_equal(array, expected)
+
+    def test_lazy_arrays_load_on_first_access(self):
+        loaded = []
+
+        def loader(name):
+            loaded.append(name)
+            return self.data[name]
+
+        arrays = transforms.LazyArrays({2: 'M_D2', 10: 'M_D10'}, loader)
+        self.assertEqual([], loaded)
+        self.assertEqual([2, 10], list(arrays))
+        np.testing.assert_array_equal(arrays[2], self.data['M_D2'])
+        np.testing.assert_array_equal(arrays[2], self.data['M_D2'])
+        self.assertEqual(['M_D2'], loaded)
+
+    def test_lazy_arrays_unknown_dimension(self):
+        arrays = transforms.LazyArrays({2: 'M_D2'})
+
+        with self.assertRaises(KeyError):
+            _ = arrays[3]
+
+
+if __name__ == '__main__':
+    unittest.main()
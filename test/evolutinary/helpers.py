@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from collections.abc import Callable
+
+from evolutionary.algorithm import EvolutionaryAlgorithm
+from hints.aliases import Genomes
+
+
+def negated_sphere(individual):
+    return -float(np.sum(individual * individual))
+
+
+def assert_resume_matches(test_case: unittest.TestCase,
+                          make_algorithm: Callable[[int], EvolutionaryAlgorithm],
+                          init_population: Genomes,
+                          iterations: int = 6,
+                          checkpoint_iteration: int = 3) -> tuple[EvolutionaryAlgorithm, EvolutionaryAlgorithm]:
+    """
+    Checks that the run interrupted after the checkpoint and resumed from it matches the uninterrupted one.
+
+    The best individuals, their values and the evaluation counts of both runs have to be equal.
+
+    :param test_case: test case reporting the failures
+    :param make_algorithm: function creating the configured algorithm for the given number of iterations
+    :param init_population: initial population of the runs
+    :param iterations: number of iterations of the whole run
+    :param checkpoint_iteration: iteration after which the checkpoint is stored and the run is interrupted
+    :return: the resumed and the uninterrupted algorithms
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        checkpoint_path = os.path.join(tmp_dir, 'checkpoint.pkl')
+        interrupted = make_algorithm(checkpoint_iteration)
+        interrupted.set_checkpointing(checkpoint_path, checkpoint_iteration)
+        interrupted.set_rng(1)
+        interrupted.run(init_population)
+        # Resumed run has to restore the state of its random generator.
+        resumed = make_algorithm(iterations)
+        resumed.set_rng(2)
+        resumed_best, resumed_value = resumed.resume(checkpoint_path)
+    uninterrupted = make_algorithm(iterations)
+    uninterrupted.set_rng(1)
+    best, value = uninterrupted.run(init_population)
+    test_case.assertEqual(best.tolist(), resumed_best.tolist())
+    test_case.assertEqual(value, resumed_value)
+    test_case.assertEqual(uninterrupted.get_evaluations(), resumed.get_evaluations())
+    return resumed, uninterrupted
@@ -2,6 +2,10 @@ import unittest
 import numpy as np
 
 from evolutionary.algorithm import EvolutionaryAlgorithm
+from evolutionary.strategies import AverageMirroringStrategy
+from logger.regular import Logger
+from population.array import PopulationArray
+from test.evolutinary.helpers import negated_sphere, assert_resume_matches
 
 
 def stub_obj_func(_):
@@ -12,7 +16,7 @@ class TestEvolutionaryAlgorithm(unittest.TestCase):
     def test_mutation(self):
         mut_strength = 1.0
         algorithm = EvolutionaryAlgorithm(stub_obj_func, mutation_strength=mut_strength)
-        population = [np.array([0, 0]), np.array([1, 1]), np.array([2, 2]), np.array([3, 3])]
+        population = np.array([[0, 0], [1, 1], [2, 2], [3, 3]], dtype=np.float64)
         # noinspection PyUnresolvedReferences
         result_population = algorithm._EvolutionaryAlgorithm__mutate_population(population)
         for original, result in zip(population, result_population):
@@ -24,7 +28,7 @@ class TestEvolutionaryAlgorithm(unittest.TestCase):
     def test_crossover(self):
         crossover_probability = 1
         algorithm = EvolutionaryAlgorithm(stub_obj_func, crossover_probability=crossover_probability)
-        population = [np.array([0, 0]), np.array([1, 1]), np.array([2, 2]), np.array([3, 3])]
+        population = np.array([[0, 0], [1, 1], [2, 2], [3, 3]], dtype=np.float64)
         # noinspection PyUnresolvedReferences
         result_population = algorithm._EvolutionaryAlgorithm__crossover_population(population)
         for result in result_population:
@@ -32,37 +36,97 @@ class TestEvolutionaryAlgorithm(unittest.TestCase):
                 self.assertGreaterEqual(r_item, 0)
                 self.assertLessEqual(r_item, 3)
 
+    def test_tournament_selection(self):
+        population_size = 8
+        algorithm = EvolutionaryAlgorithm(stub_obj_func, population_size=population_size, tournament_size=50)
+        population = PopulationArray(np.array([[0, 0], [1, 1], [2, 2], [3, 3]]), np.array([1, 4, 2, 3]))
+        # noinspection PyUnresolvedReferences
+        result_population = algorithm._EvolutionaryAlgorithm__tournament_selection(population)
+        self.assertEqual((population_size, 2), result_population.shape)
+        # With such a big tournament the best individual wins with almost 100% chances.
+        for result in result_population:
+            self.assertEqual([1, 1], result.tolist())
+
     def test_succession(self):
         elite_size = 2
         population_size = 6
         algorithm = EvolutionaryAlgorithm(stub_obj_func, elite_size=elite_size, population_size=population_size)
-        old_eval_population = [
+        old_population = PopulationArray.from_evaluated_population([
             ([0], 12),
             ([1], 36),
             ([2], -12),
             ([3], -36),
             ([4], 48),
             ([5], 0),
-        ]
-        new_eval_population = [
+        ])
+        new_population = PopulationArray.from_evaluated_population([
             ([6], 100),
             ([7], 0),
             ([8], 0),
             ([9], 12),
             ([10], 32),
             ([11], 42),
-        ]
-        expected_result = [
-            ([4], 48),
+        ])
+        expected_elite = [
             ([1], 36),
+            ([4], 48),
+        ]
+        expected_others = [
             ([6], 100),
-            ([11], 42),
-            ([10], 32),
             ([9], 12),
+            ([10], 32),
+            ([11], 42),
         ]
         # noinspection PyUnresolvedReferences
-        result_population = algorithm._EvolutionaryAlgorithm__make_succession(old_eval_population, new_eval_population)
-        self.assertEqual(expected_result, result_population)
+        result_population = algorithm._EvolutionaryAlgorithm__make_succession(old_population, new_population)
+        result = [(g.tolist(), f) for g, f in result_population.to_evaluated_population()]
+        # Selected individuals are not sorted, only the elite has to come first.
+        self.assertCountEqual(expected_elite, result[:elite_size])
+        self.assertCountEqual(expected_others, result[elite_size:])
+
+    def test_checkpoint_resume(self):
+        def make_algorithm(iterations):
+            algorithm = EvolutionaryAlgorithm(
+                negated_sphere,
+                AverageMirroringStrategy(threshold=3),
+                iterations=iterations,
+                population_size=10
+            )
+            # Pairwise distance is estimated with the sampled pairs of individuals.
+            algorithm.set_logger(Logger({'d_pairwise': True, 'pairwise_samples': 20}))
+            return algorithm
+        init_population = np.random.uniform(-10, 10, (10, 2))
+        resumed, uninterrupted = assert_resume_matches(self, make_algorithm, init_population)
+        # noinspection PyUnresolvedReferences
+        self.assertEqual(uninterrupted._EvolutionaryAlgorithm__logger.get_logger_data(),
+                         resumed._EvolutionaryAlgorithm__logger.get_logger_data())
+
+    def test_checkpoint_resume_with_cache(self):
+        def make_algorithm(iterations):
+            return EvolutionaryAlgorithm(
+                negated_sphere, iterations=iterations, population_size=10,
+                mutation_strength=0.0, cache_size=100
+            )
+        init_population = np.random.uniform(-10, 10, (10, 2))
+        resumed, uninterrupted = assert_resume_matches(self, make_algorithm, init_population)
+        self.assertEqual(uninterrupted.get_cache_statistics(), resumed.get_cache_statistics())
+
+    def test_seeded_runs(self):
+        def run(seed):
+            algorithm = EvolutionaryAlgorithm(
+                negated_sphere,
+                AverageMirroringStrategy(threshold=3),
+                iterations=5,
+                population_size=10,
+                rng=seed
+            )
+            return algorithm.run(np.ones((10, 2)))
+        first_best, first_value = run(3)
+        second_best, second_value = run(3)
+        _, other_value = run(4)
+        self.assertEqual(first_best.tolist(), second_best.tolist())
+        self.assertEqual(first_value, second_value)
+        self.assertNotEqual(first_value, other_value)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,86 @@
+import unittest
+import numpy as np
+from evolutionary.evaluators import SerialEvaluator, BatchEvaluator, ThreadPoolEvaluator, ProcessPoolEvaluator, \
+    CachingEvaluator, CountingEvaluator
+from evolutionary.algorithm import EvolutionaryAlgorithm
+from cec2017.negate import negate
+
+
+def sphere(individual):
+    return float(np.sum(individual * individual))
+
+
+class TestEvaluators(unittest.TestCase):
+    def setUp(self):
+        self.genomes = np.random.uniform(-10, 10, (23, 3))
+        self.expected = np.sum(self.genomes * self.genomes, axis=1)
+
+    def test_serial_evaluator(self):
+        result = SerialEvaluator().evaluate(sphere, self.genomes)
+        self.assertTrue(np.allclose(self.expected, result))
+
+    def test_batch_evaluator(self):
+        def batch_sphere(genomes):
+            return np.sum(genomes * genomes, axis=1)
+        result = BatchEvaluator().evaluate(batch_sphere, self.genomes)
+        self.assertTrue(np.allclose(self.expected, result))
+        with self.assertRaises(RuntimeError):
+            BatchEvaluator().evaluate(sphere, self.genomes)
+
+    def test_thread_pool_evaluator(self):
+        with ThreadPoolEvaluator(max_workers=3, chunk_size=4) as evaluator:
+            result = evaluator.evaluate(sphere, self.genomes)
+        self.assertTrue(np.allclose(self.expected, result))
+
+    def test_process_pool_evaluator(self):
+        with ProcessPoolEvaluator(max_workers=2) as evaluator:
+            result = evaluator.evaluate(negate(sphere), self.genomes)
+            empty_result = evaluator.evaluate(sphere, np.empty((0, 3)))
+        self.assertTrue(np.allclose(-self.expected, result))
+        self.assertEqual((0,), empty_result.shape)
+
+    def test_algorithm_with_evaluator(self):
+        with ThreadPoolEvaluator(max_workers=2) as evaluator:
+            algorithm = EvolutionaryAlgorithm(negate(sphere), iterations=3, population_size=10, evaluator=evaluator)
+            best, best_value = algorithm.run(np.random.uniform(-10, 10, (10, 2)))
+        self.assertAlmostEqual(-sphere(best), best_value)
+
+    def test_caching_evaluator(self):
+        counter = CountingEvaluator(SerialEvaluator())
+        evaluator = CachingEvaluator(counter, max_size=30)
+        genomes = np.concatenate([self.genomes, self.genomes[:5]])
+        result = evaluator.evaluate(sphere, genomes)
+        self.assertTrue(np.allclose(np.concatenate([self.expected, self.expected[:5]]), result))
+        self.assertEqual(23, counter.get_evaluations())
+        self.assertEqual((5, 23), (evaluator.get_hits(), evaluator.get_misses()))
+        evaluator.evaluate(sphere, self.genomes[:10])
+        self.assertEqual(23, counter.get_evaluations())
+        # Least recently used individuals are evicted.
+        new_genomes = np.random.uniform(20, 30, (10, 3))
+        evaluator.evaluate(sphere, new_genomes)
+        evaluator.evaluate(sphere, self.genomes[:10])
+        self.assertEqual(33, counter.get_evaluations())
+        evaluator.evaluate(sphere, self.genomes[10:])
+        self.assertEqual(36, counter.get_evaluations())
+        # Other objective function does not use cached values.
+        evaluator.evaluate(negate(sphere), self.genomes[:10])
+        self.assertEqual(46, counter.get_evaluations())
+
+    def test_algorithm_with_cache(self):
+        population = np.random.uniform(-10, 10, (10, 2))
+        algorithm = EvolutionaryAlgorithm(
+            negate(sphere), iterations=5, population_size=10, mutation_strength=0.0, rng=0
+        )
+        expected = algorithm.run(population)
+        algorithm.set_cache_size(1000)
+        algorithm.set_rng(0)
+        result = algorithm.run(population)
+        self.assertTrue(np.array_equal(expected[0], result[0]))
+        hits, misses = algorithm.get_cache_statistics()
+        self.assertEqual(60, hits + misses)
+        self.assertGreater(hits, 0)
+        self.assertEqual(misses, algorithm.get_evaluations())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+
+from evolutionary.algorithm import EvolutionaryAlgorithm
+from evolutionary.strategies import MutationStrategy, AverageMirroringStrategy, DifferentialEvolutionStrategy
+from evolutionary.scheduling import PeriodicStrategy
+from evolutionary.pipeline import StrategyPipeline
+from population.array import PopulationArray
+from test.evolutinary.helpers import negated_sphere, assert_resume_matches
+
+
+class TestStrategyPipeline(unittest.TestCase):
+    def setUp(self):
+        self.genomes = np.random.default_rng(0).uniform(-5, 5, (20, 3))
+
+    def test_statistics(self):
+        pipeline = StrategyPipeline(
+            [AverageMirroringStrategy(threshold=4), DifferentialEvolutionStrategy(threshold=3)],
+            ['mirroring', 'differential']
+        )
+        algorithm = EvolutionaryAlgorithm(negated_sphere, pipeline, iterations=10, population_size=20, rng=0)
+        algorithm.run(self.genomes)
+        statistics = pipeline.get_statistics()
+        self.assertEqual({'mirroring', 'differential'}, set(statistics))
+        for data in statistics.values():
+            for key in StrategyPipeline.statistics:
+                self.assertEqual(10, len(data[key]))
+        self.assertEqual([3] * 10, statistics['differential']['evaluations'])
+        self.assertTrue(all(4 <= e <= 8 for e in statistics['mirroring']['evaluations']))
+        # Stage evaluations together with the algorithm ones make the total count.
+        stage_evaluations = sum(sum(data['evaluations']) for data in statistics.values())
+        self.assertEqual(20 * 11 + stage_evaluations, algorithm.get_evaluations())
+        # Mirroring keeps only the improved individuals.
+        rates = [r for r in statistics['mirroring']['improvement_rate'] if not np.isnan(r)]
+        self.assertTrue(all(r == 1.0 for r in rates))
+        # Survival of the last iteration is not known yet.
+        self.assertTrue(np.isnan(statistics['differential']['survival_rate'][-1]))
+        survival = statistics['differential']['survival_rate'][:-1]
+        self.assertTrue(all(0 <= r <= 1 for r in survival))
+        summary = pipeline.get_summary()
+        self.assertEqual(30.0, summary['differential']['produced'])
+        self.assertEqual(30.0, summary['differential']['evaluations'])
+        # Statistics are cleaned with the new run.
+        algorithm.run(self.genomes)
+        self.assertEqual(10, len(pipeline.get_statistics()['mirroring']['time']))
+
+    def test_survival(self):
+        pipeline = StrategyPipeline([MutationStrategy(threshold=2)])
+        pipeline.set_objective_function(negated_sphere)
+        pipeline.set_rng(0)
+        population = PopulationArray(self.genomes, np.array([negated_sphere(i) for i in self.genomes]))
+        modified = pipeline.modify_population(population)
+        # Next population holds one of the two mutated individuals only.
+        produced = np.flatnonzero([not any(np.array_equal(i, g) for g in self.genomes) for i in modified.genomes])
+        pipeline.modify_population(PopulationArray.concatenate([
+            modified.take(produced[:1]), population.take(np.arange(1, len(population)))
+        ]))
+        self.assertEqual(0.5, pipeline.get_statistics()['MutationStrategy']['survival_rate'][0])
+
+    def test_skipped_stage(self):
+        pipeline = StrategyPipeline([PeriodicStrategy(MutationStrategy(threshold=2), period=2)], ['periodic'])
+        pipeline.set_objective_function(negated_sphere)
+        population = PopulationArray(self.genomes, np.array([negated_sphere(i) for i in self.genomes]))
+        pipeline.modify_population(population)
+        pipeline.modify_population(population)
+        statistics = pipeline.get_statistics()['periodic']
+        self.assertEqual([2, 0], statistics['evaluations'])
+        self.assertEqual([2, 0], statistics['produced'])
+        self.assertTrue(np.isnan(statistics['improvement_rate'][1]))
+
+    def test_checkpoint_resume(self):
+        def make_algorithm(iterations):
+            pipeline = StrategyPipeline(
+                [PeriodicStrategy(AverageMirroringStrategy(threshold=4), 2),
+                 DifferentialEvolutionStrategy(threshold=3)],
+                ['mirroring', 'differential']
+            )
+            return EvolutionaryAlgorithm(negated_sphere, pipeline, iterations=iterations, population_size=20)
+
+        def statistics_without_time(algorithm):
+            # noinspection PyUnresolvedReferences
+            statistics = algorithm._EvolutionaryAlgorithm__strategy.get_statistics()
+            return {name: {key: values for key, values in data.items() if key != 'time'}
+                    for name, data in statistics.items()}
+
+        resumed, uninterrupted = assert_resume_matches(self, make_algorithm, self.genomes)
+        np.testing.assert_equal(statistics_without_time(uninterrupted), statistics_without_time(resumed))
+        self.assertEqual(6, len(statistics_without_time(resumed)['mirroring']['produced']))
+
+    def test_invalid_names(self):
+        with self.assertRaises(RuntimeError):
+            StrategyPipeline([MutationStrategy(), MutationStrategy()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+
+from evolutionary.algorithm import EvolutionaryAlgorithm
+from evolutionary.strategies import MutationStrategy, AverageMirroringStrategy
+from evolutionary.scheduling import PeriodicStrategy, StagnationTriggeredStrategy, AdaptiveStrategy
+from population.array import PopulationArray
+from test.evolutinary.helpers import negated_sphere, assert_resume_matches
+
+
+def constant(_):
+    return 1.0
+
+
+class TestScheduledStrategies(unittest.TestCase):
+    def setUp(self):
+        genomes = np.random.default_rng(0).uniform(-5, 5, (20, 3))
+        self.population = PopulationArray(genomes, np.array([negated_sphere(i) for i in genomes]))
+
+    def __prepared(self, strategy, obj_func=negated_sphere):
+        strategy.set_objective_function(obj_func)
+        strategy.set_rng(0)
+        return strategy
+
+    def test_periodic(self):
+        strategy = self.__prepared(PeriodicStrategy(MutationStrategy(threshold=5), period=3))
+        applied = [strategy.modify_population(self.population) is not self.population for _ in range(7)]
+        self.assertEqual([True, False, False, True, False, False, True], applied)
+        self.assertEqual(3, strategy.get_applications())
+        strategy.clean_up()
+        self.assertEqual(0, strategy.get_applications())
+        self.assertIsNot(self.population, strategy.modify_population(self.population))
+
+    def test_invalid_period(self):
+        with self.assertRaises(RuntimeError):
+            PeriodicStrategy(MutationStrategy(), period=0)
+
+    def test_stagnation_triggered(self):
+        strategy = self.__prepared(StagnationTriggeredStrategy(MutationStrategy(threshold=5), iterations=2))
+        applied = [strategy.modify_population(self.population) is not self.population for _ in range(4)]
+        self.assertEqual([False, False, True, True], applied)
+
+    def test_adaptive(self):
+        # Mirroring never worsens the individuals, so the period stays minimal.
+        strategy = self.__prepared(AdaptiveStrategy(AverageMirroringStrategy(threshold=5), window=2))
+        for _ in range(6):
+            strategy.modify_population(self.population)
+        self.assertEqual(1, strategy.get_period())
+        self.assertEqual(6, strategy.get_applications())
+        # Constant objective function never improves, so the strategy is applied less and less often.
+        strategy = self.__prepared(AdaptiveStrategy(MutationStrategy(threshold=5), window=2, max_period=4), constant)
+        population = PopulationArray(self.population.genomes, np.ones(len(self.population)))
+        for _ in range(20):
+            strategy.modify_population(population)
+        self.assertEqual(4, strategy.get_period())
+        self.assertLess(strategy.get_applications(), 10)
+
+    def test_algorithm_with_scheduled_strategy(self):
+        strategy = PeriodicStrategy(MutationStrategy(threshold=5), period=2)
+        algorithm = EvolutionaryAlgorithm(negated_sphere, strategy, iterations=10, population_size=20, rng=0)
+        algorithm.run(self.population.genomes)
+        self.assertEqual(5, strategy.get_applications())
+        self.assertEqual(20 * 11 + 5 * 5, algorithm.get_evaluations())
+        # Schedule is restarted with the new run.
+        algorithm.run(self.population.genomes)
+        self.assertEqual(5, strategy.get_applications())
+
+    def test_checkpoint_resume(self):
+        for make_strategy in (
+                lambda: PeriodicStrategy(MutationStrategy(threshold=3), 2),
+                lambda: StagnationTriggeredStrategy(MutationStrategy(threshold=3), 1, min_improvement=0.5),
+                lambda: AdaptiveStrategy(MutationStrategy(threshold=3), window=2)):
+            def make_algorithm(iterations):
+                return EvolutionaryAlgorithm(negated_sphere, make_strategy(), iterations=iterations, population_size=20)
+
+            with self.subTest(strategy=type(make_strategy()).__name__):
+                assert_resume_matches(self, make_algorithm, self.population.genomes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,35 @@
 import unittest
 import numpy as np
 from evolutionary.strategies import MutationStrategy, AverageMirroringStrategy, DifferentialEvolutionStrategy
+from evolutionary.evaluators import BatchEvaluator
+from population.array import PopulationArray
+from evolutionary.algorithm import EvolutionaryAlgorithm
+from test.evolutinary.helpers import negated_sphere
+
+
+class TestBatchedStrategies(unittest.TestCase):
+    def test_single_objective_call(self):
+        calls = []
+
+        def batch_sphere(genomes):
+            calls.append(len(genomes))
+            return -np.sum(genomes * genomes, axis=1)
+
+        genomes = np.random.default_rng(0).uniform(-5, 5, (30, 4))
+        population = PopulationArray(genomes, batch_sphere(genomes))
+        for strategy, expected_calls in (
+                (MutationStrategy(threshold=10), [10]),
+                (AverageMirroringStrategy(threshold=10, speculative=True), [20]),
+                (DifferentialEvolutionStrategy(threshold=10), [10])):
+            with self.subTest(strategy=type(strategy).__name__):
+                calls.clear()
+                strategy.set_objective_function(batch_sphere)
+                strategy.set_evaluator(BatchEvaluator())
+                strategy.set_rng(0)
+                result = strategy.modify_population(population)
+                self.assertEqual(expected_calls, calls)
+                self.assertEqual(genomes.shape, result.genomes.shape)
+                self.assertTrue(np.allclose(batch_sphere(result.genomes), result.fitness))
 
 
 class TestMutationStrategy(unittest.TestCase):
@@ -85,6 +114,49 @@ class TestAverageMirroringStrategy(unittest.TestCase):
         self.assertTrue((fourth == np.array([4, 4])).all())
         self.assertEqual(fourth_val, 4)
 
+    def test_speculative(self):
+        calls = []
+
+        def batch_sphere(genomes):
+            calls.append(len(genomes))
+            return -np.sum(genomes * genomes, axis=1)
+
+        genomes = np.random.default_rng(0).uniform(-5, 5, (30, 4))
+        population = PopulationArray(genomes, batch_sphere(genomes))
+        results = []
+        for speculative in (False, True):
+            calls.clear()
+            strategy = AverageMirroringStrategy(threshold=10, speculative=speculative)
+            strategy.set_objective_function(batch_sphere)
+            strategy.set_evaluator(BatchEvaluator())
+            strategy.set_rng(0)
+            results.append(strategy.modify_population(population))
+            self.assertEqual(sum(calls) - 10, strategy.get_fallback_evaluations())
+            if not speculative:
+                # Forward mirrors are evaluated first, opposite ones only for failed individuals.
+                self.assertEqual(10, calls[0])
+                self.assertLess(sum(calls), 20)
+        # Speculative mode evaluates both mirrors of all individuals at once.
+        self.assertEqual([20], calls)
+        # Selection does not depend on the mode.
+        self.assertTrue(np.array_equal(results[0].genomes, results[1].genomes))
+        self.assertTrue(np.array_equal(results[0].fitness, results[1].fitness))
+        strategy.reset_fallback_evaluations()
+        self.assertEqual(0, strategy.get_fallback_evaluations())
+
+    def test_fallback_evaluations_per_run(self):
+        strategy = AverageMirroringStrategy(threshold=5)
+        algorithm = EvolutionaryAlgorithm(negated_sphere, strategy, iterations=5, population_size=20)
+        init_population = np.random.default_rng(0).uniform(-5, 5, (20, 3))
+        fallback_evaluations = []
+        for _ in range(2):
+            algorithm.set_rng(0)
+            algorithm.run(init_population)
+            fallback_evaluations.append(strategy.get_fallback_evaluations())
+        self.assertGreater(fallback_evaluations[0], 0)
+        self.assertEqual(fallback_evaluations[0], fallback_evaluations[1])
+        self.assertEqual(20 * 6 + 5 * 5 + fallback_evaluations[1], algorithm.get_evaluations())
+
     def test_strategy_no_objective_function(self):
         eval_population = [
             (np.array([1]), 1),
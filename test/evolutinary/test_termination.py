@@ -0,0 +1,98 @@
+import time
+import pickle
+import unittest
+import numpy as np
+
+from evolutionary.algorithm import EvolutionaryAlgorithm
+from evolutionary.strategies import AverageMirroringStrategy
+from evolutionary.termination import MaxEvaluations, TargetValue, Stagnation, WallClock, RunState
+from test.evolutinary.helpers import negated_sphere, assert_resume_matches
+
+
+def constant(_):
+    return 1.0
+
+
+class TestTermination(unittest.TestCase):
+    def setUp(self):
+        self.population = np.random.default_rng(0).uniform(-5, 5, (20, 3))
+
+    def test_evaluations_counted(self):
+        algorithm = EvolutionaryAlgorithm(negated_sphere, iterations=10, population_size=20, rng=0)
+        algorithm.run(self.population)
+        self.assertEqual(algorithm.get_iterations(), 10)
+        # Initial population and every iteration offspring.
+        self.assertEqual(algorithm.get_evaluations(), 20 * 11)
+
+    def test_strategy_evaluations_counted(self):
+        algorithm = EvolutionaryAlgorithm(
+            negated_sphere, AverageMirroringStrategy(), iterations=10, population_size=20, rng=0
+        )
+        algorithm.run(self.population)
+        self.assertGreater(algorithm.get_evaluations(), 20 * 11)
+
+    def test_max_evaluations(self):
+        algorithm = EvolutionaryAlgorithm(
+            negated_sphere, iterations=100, population_size=20, rng=0,
+            termination=[MaxEvaluations(100)]
+        )
+        algorithm.run(self.population)
+        self.assertEqual(algorithm.get_iterations(), 4)
+        self.assertEqual(algorithm.get_evaluations(), 100)
+
+    def test_max_evaluations_per_dimension(self):
+        criterion = MaxEvaluations(per_dimension=10)
+        self.assertFalse(criterion.is_met(RunState(1, 29, 0.0, 3)))
+        self.assertTrue(criterion.is_met(RunState(1, 30, 0.0, 3)))
+
+    def test_target_value(self):
+        criterion = TargetValue.cec2017(3, tolerance=1e-8)
+        self.assertFalse(criterion.is_met(RunState(1, 10, -301.0, 10)))
+        self.assertTrue(criterion.is_met(RunState(1, 10, -300.0 - 1e-9, 10)))
+        algorithm = EvolutionaryAlgorithm(
+            negated_sphere, iterations=100, population_size=20, rng=0,
+            termination=[TargetValue(-1.0)]
+        )
+        _, best_value = algorithm.run(self.population)
+        self.assertGreaterEqual(best_value, -1.0)
+        self.assertLess(algorithm.get_iterations(), 100)
+
+    def test_stagnation(self):
+        algorithm = EvolutionaryAlgorithm(
+            constant, iterations=100, population_size=20, rng=0,
+            termination=[Stagnation(5)]
+        )
+        algorithm.run(self.population)
+        self.assertEqual(algorithm.get_iterations(), 6)
+        # Criterion is restarted with the new run.
+        algorithm.run(self.population)
+        self.assertEqual(algorithm.get_iterations(), 6)
+
+    def test_wall_clock(self):
+        algorithm = EvolutionaryAlgorithm(
+            negated_sphere, iterations=100, population_size=20, rng=0,
+            termination=[WallClock(0.0)]
+        )
+        algorithm.run(self.population)
+        self.assertEqual(algorithm.get_iterations(), 1)
+
+    def test_wall_clock_resume(self):
+        criterion = WallClock(0.1)
+        criterion.start()
+        restored = pickle.loads(pickle.dumps(criterion))
+        # Time between storing and resuming the run is not counted.
+        time.sleep(0.15)
+        restored.resume()
+        self.assertFalse(restored.is_met(RunState(1, 10, 0.0, 3)))
+        resumed, _ = assert_resume_matches(
+            self,
+            lambda iterations: EvolutionaryAlgorithm(
+                negated_sphere, iterations=iterations, population_size=20, termination=[WallClock(60.0)]
+            ),
+            self.population
+        )
+        self.assertEqual(6, resumed.get_iterations())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from logger.sink import ColumnarLogSink
+from experiment.experiment import Experiment, _conduct_run
+from evolutionary.algorithm import EvolutionaryAlgorithm
+from evolutionary.strategies import AverageMirroringStrategy
+from population.generator import PopulationGenerator
+from cec2017.negate import negate
+
+
+def sphere(individual):
+    return float(np.sum(individual * individual))
+
+
+def generator(rng):
+    return PopulationGenerator.generate_population_uniform_distribution(-10, 10, 2, 10, rng)
+
+
+def unseeded_generator():
+    return PopulationGenerator.generate_population_uniform_distribution(-10, 10, 2, 10)
+
+
+class TestExperiment(unittest.TestCase):
+    @staticmethod
+    def make_experiment(workers, seed, log_dir=None, population_generator=generator):
+        algorithm = EvolutionaryAlgorithm(
+            strategy=AverageMirroringStrategy(threshold=3),
+            iterations=5,
+            population_size=10
+        )
+        return Experiment(
+            algorithm,
+            population_generator,
+            negate(sphere),
+            duration=3,
+            verbose=False,
+            show_plots=False,
+            log_dir=log_dir,
+            workers=workers,
+            seed=seed
+        )
+
+    def test_parallel_results_match_serial(self):
+        serial = self.make_experiment(1, 42)
+        serial.conduct()
+        parallel = self.make_experiment(2, 42)
+        parallel.conduct()
+        for key, values in serial.results().items():
+            self.assertEqual(5, len(values))
+            self.assertTrue(np.array_equal(values, parallel.results()[key]))
+
+    def test_seed_reproducibility(self):
+        first = self.make_experiment(1, 7)
+        first.conduct()
+        second = self.make_experiment(1, 7)
+        second.conduct()
+        other = self.make_experiment(1, 8)
+        other.conduct()
+        self.assertTrue(np.array_equal(first.results()['avg_v_max'], second.results()['avg_v_max']))
+        self.assertFalse(np.array_equal(first.results()['avg_v_max'], other.results()['avg_v_max']))
+
+    def test_generator_without_arguments(self):
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                experiment = self.make_experiment(workers, 42, population_generator=unseeded_generator)
+                experiment.conduct()
+                self.assertEqual(5, len(experiment.results()['avg_v_max']))
+
+    def test_log_dir(self):
+        for workers in (1, 2):
+            with self.subTest(workers=workers), tempfile.TemporaryDirectory() as tmp_dir:
+                log_dir = os.path.join(tmp_dir, 'logs')
+                experiment = self.make_experiment(workers, 42, log_dir)
+                experiment.conduct()
+                data = ColumnarLogSink.load(log_dir)
+                # Directories of the runs conducted by the workers are merged and removed.
+                subdirectories = [name for name in os.listdir(log_dir) if os.path.isdir(os.path.join(log_dir, name))]
+                self.assertEqual([], subdirectories)
+                v_max = ColumnarLogSink.to_runs_matrix(data, 'v_max')
+                self.assertEqual((3, 5), v_max.shape)
+                self.assertEqual([0, 1, 2], np.unique(data['run']).tolist())
+                self.assertTrue(np.allclose(experiment.results()['avg_v_max'], v_max.mean(axis=0)))
+
+    def test_run_streams_to_sink(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sink = ColumnarLogSink(tmp_dir, chunk_size=2)
+            algorithm = EvolutionaryAlgorithm(iterations=5, population_size=10)
+            seed = np.random.SeedSequence(0)
+            logger = _conduct_run(algorithm, generator, negate(sphere), {}, seed, sink)
+            data = ColumnarLogSink.load(tmp_dir)
+        self.assertEqual(list(range(5)), data['iteration'].tolist())
+        self.assertEqual(logger.get_logger_data()['v_max'], data['v_max'].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import os
+import json
+import functools
+import tempfile
+import unittest
+from cec2017 import transforms
+from experiment.grid import ExperimentGrid, uniform_population
+from evolutionary.algorithm import EvolutionaryAlgorithm
+from evolutionary.strategies import MutationStrategy
+
+
+@unittest.skipUnless(os.path.exists(transforms._PKL_PATH) or os.path.isdir(transforms._DATA_DIR),
+                     'CEC2017 data is not available')
+class TestExperimentGrid(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def conduct(self, file_name, shard=(0, 1)):
+        algorithms = [
+            EvolutionaryAlgorithm(iterations=3, population_size=10),
+            EvolutionaryAlgorithm(strategy=MutationStrategy(threshold=3), iterations=3, population_size=10),
+        ]
+        results_path = os.path.join(self.tmp_dir.name, file_name)
+        grid = ExperimentGrid(
+            algorithms,
+            ['No strategy', 'Mutation'],
+            function_ids=[1, 3],
+            dimensions=[2, 10],
+            results_path=results_path,
+            repetitions=2,
+            generator=functools.partial(uniform_population, 10),
+            workers=2,
+            seed=42,
+            shard=shard,
+            verbose=False
+        )
+        grid.conduct()
+        return ExperimentGrid.load_results(results_path)
+
+    @staticmethod
+    def by_cell(results):
+        return {(r['algorithm'], r['function'], r['dimension'], r['repetition']): r for r in results}
+
+    def test_grid(self):
+        results = self.by_cell(self.conduct('results.jsonl'))
+        self.assertEqual(2 * 2 * 2 * 2, len(results))
+        for (_, function_id, _, _), result in results.items():
+            self.assertEqual(3, len(result['log']['v_max']))
+            self.assertAlmostEqual(-result['best_value'] - 100 * function_id, result['error'])
+
+    def test_shards_reproduce_grid(self):
+        results = self.by_cell(self.conduct('results.jsonl'))
+        first_shard = self.by_cell(self.conduct('first.jsonl', (0, 2)))
+        second_shard = self.by_cell(self.conduct('second.jsonl', (1, 2)))
+        self.assertEqual(8, len(first_shard))
+        self.assertEqual(results, {**first_shard, **second_shard})
+
+    def test_resume(self):
+        results = self.conduct('results.jsonl')
+        # Simulating interruption while the sixth result was being written.
+        with open(os.path.join(self.tmp_dir.name, 'interrupted.jsonl'), 'w') as results_file:
+            lines = [json.dumps(result) + '\n' for result in results[:5]]
+            results_file.writelines(lines)
+            results_file.write(lines[-1][:10])
+        resumed = self.conduct('interrupted.jsonl')
+        self.assertEqual(len(results), len(resumed))
+        self.assertEqual(self.by_cell(results), self.by_cell(resumed))
+
+    def test_failed_cells(self):
+        # Second algorithm does not match the size of the initial population.
+        results_path = os.path.join(self.tmp_dir.name, 'results.jsonl')
+        grid = ExperimentGrid(
+            [EvolutionaryAlgorithm(iterations=2, population_size=10),
+             EvolutionaryAlgorithm(iterations=2, population_size=7)],
+            ['Valid', 'Invalid'],
+            function_ids=[1],
+            dimensions=[2],
+            results_path=results_path,
+            repetitions=2,
+            generator=functools.partial(uniform_population, 10),
+            workers=2,
+            seed=42,
+            verbose=False
+        )
+        grid.conduct()
+        self.assertEqual({('Valid', 1, 2, 0), ('Valid', 1, 2, 1)},
+                         {(r['algorithm'], r['function'], r['dimension'], r['repetition'])
+                          for r in ExperimentGrid.load_results(results_path)})
+        self.assertEqual({('Invalid', 1, 2, 0), ('Invalid', 1, 2, 1)}, {key for key, _ in grid.get_failed_cells()})
+
+
+    def test_default_generator(self):
+        # Initial populations match the sizes of the algorithms.
+        results_path = os.path.join(self.tmp_dir.name, 'results.jsonl')
+        grid = ExperimentGrid(
+            [EvolutionaryAlgorithm(iterations=2, population_size=10),
+             EvolutionaryAlgorithm(iterations=2, population_size=7)],
+            ['Ten', 'Seven'],
+            function_ids=[1],
+            dimensions=[2],
+            results_path=results_path,
+            repetitions=1,
+            workers=1,
+            seed=42,
+            verbose=False
+        )
+        grid.conduct()
+        self.assertEqual([], grid.get_failed_cells())
+        self.assertEqual({'Ten': 10 * 3, 'Seven': 7 * 3},
+                         {r['algorithm']: r['evaluations'] for r in ExperimentGrid.load_results(results_path)})
+
+class TestExperimentGridValidation(unittest.TestCase):
+    def test_missing_data(self):
+        # Hybrid and composition functions with shuffles have no data in dimensions 2 and 20.
+        for function_id, dimension in ((11, 2), (20, 20), (29, 2), (1, 7), (31, 10)):
+            with self.subTest(function_id=function_id, dimension=dimension):
+                with self.assertRaises(RuntimeError):
+                    ExperimentGrid([EvolutionaryAlgorithm()], ['No strategy'], [1, function_id], [10, dimension],
+                                   results_path='unused.jsonl')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from logger.regular import Logger
+from logger.averaging import AveragingLogger
+
+
+class TestAveragingLogger(unittest.TestCase):
+    @staticmethod
+    def make_run_logger(values):
+        logger = Logger()
+        for i in values:
+            logger.generate_new_log_entry([(np.array([0.0]), i - 1.0), (np.array([1.0]), i + 1.0)])
+        return logger
+
+    def conduct(self, avg_logger, runs):
+        avg_logger.clean_up()
+        for values in runs[:-1]:
+            avg_logger.add_run_logger(self.make_run_logger(values))
+        # The last run is logged the same way as by the Experiment.
+        avg_logger.logging_for_new_run()
+        for i in runs[-1]:
+            avg_logger.generate_new_log_entry([(np.array([0.0]), i - 1.0), (np.array([1.0]), i + 1.0)])
+
+    def test_online_matches_regular(self):
+        runs = np.random.uniform(-10, 10, (7, 5))
+        regular = AveragingLogger()
+        self.conduct(regular, runs)
+        online = AveragingLogger(online=True, quantiles=[0.5])
+        self.conduct(online, runs)
+        regular_data = regular.get_logger_data()
+        online_data = online.get_logger_data()
+        for key in ('avg_v_max', 'avg_v_min', 'avg_v_avg'):
+            self.assertTrue(np.allclose(regular_data[key], online_data[key]))
+        self.assertTrue(np.allclose(np.std(runs, axis=0), online_data['std_v_avg']))
+        # Quantiles of less than 5 runs are exact, otherwise estimated.
+        self.assertEqual(5, len(online_data['q0.5_v_max']))
+        self.assertTrue(np.all(online_data['q0.5_v_max'] >= np.min(runs, axis=0) + 1))
+        self.assertTrue(np.all(online_data['q0.5_v_max'] <= np.max(runs, axis=0) + 1))
+        # Querying the data again gives the same results.
+        self.assertTrue(np.array_equal(online_data['avg_v_max'], online.get_logger_data()['avg_v_max']))
+
+    def test_online_single_run(self):
+        online = AveragingLogger(online=True)
+        self.conduct(online, [[1.0, 2.0]])
+        with self.assertRaises(RuntimeError):
+            online.get_logger_data(0)
+
+    def test_quantiles_require_online_mode(self):
+        with self.assertRaises(RuntimeError):
+            AveragingLogger(quantiles=[0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
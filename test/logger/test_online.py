@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from logger.online import OnlineStatistics, P2Quantile
+
+
+class TestOnlineStatistics(unittest.TestCase):
+    def test_statistics(self):
+        series = np.random.uniform(-10, 10, (50, 4))
+        statistics = OnlineStatistics()
+        for s in series:
+            statistics.add(s)
+        # Shorter series affect only the first iterations.
+        statistics.add([100.0])
+        expected_mean = np.mean(series, axis=0)
+        expected_mean[0] = np.mean(np.append(series[:, 0], 100.0))
+        self.assertEqual([51, 50, 50, 50], statistics.count().tolist())
+        self.assertTrue(np.allclose(expected_mean, statistics.mean()))
+        self.assertTrue(np.allclose(np.std(series[:, 1:], axis=0), statistics.std()[1:]))
+
+
+class TestP2Quantile(unittest.TestCase):
+    def test_quantile(self):
+        series = np.random.default_rng(0).standard_normal((2000, 3))
+        for p in (0.1, 0.5, 0.9):
+            estimator = P2Quantile(p)
+            for s in series:
+                estimator.add(s)
+            self.assertTrue(np.allclose(np.quantile(series, p, axis=0), estimator.quantile(), atol=0.15))
+
+    def test_exact_for_few_series(self):
+        estimator = P2Quantile(0.5)
+        for s in ([1.0, 8.0], [5.0, 2.0], [3.0]):
+            estimator.add(s)
+        self.assertEqual([3.0, 5.0], estimator.quantile().tolist())
+
+    def test_invalid_quantile(self):
+        with self.assertRaises(RuntimeError):
+            P2Quantile(1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+from logger.regular import Logger
+from population.array import PopulationArray
+
+
+class TestLogger(unittest.TestCase):
+    def test_entry_inputs(self):
+        fitness = np.array([3.0, -1.0, 4.0, 2.0])
+        genomes = np.zeros((4, 2))
+        eval_population = list(zip(genomes, fitness))
+        for log_input in (eval_population, PopulationArray(genomes, fitness), fitness):
+            logger = Logger({'v_std': True, 'v_median': True})
+            logger.generate_new_log_entry(log_input)
+            self.assertEqual({
+                'v_max': [4.0],
+                'v_min': [-1.0],
+                'v_avg': [2.0],
+                'v_std': [np.std(fitness)],
+                'v_median': [2.5],
+            }, logger.get_logger_data())
+
+    def test_decimation(self):
+        logger = Logger({'v_min': False, 'v_avg': False, 'decimation': 3})
+        for i in range(7):
+            logger.generate_new_log_entry(np.array([float(i)]))
+        self.assertEqual({'v_max': [0.0, 3.0, 6.0]}, logger.get_logger_data())
+        self.assertEqual([1, 4, 7], logger.get_logged_iterations())
+        logger.clean_up()
+        self.assertEqual({'v_max': []}, logger.get_logger_data())
+
+    def test_diversity(self):
+        genomes = np.array([[0.0, 0.0], [2.0, 0.0], [0.0, 4.0], [2.0, 4.0]])
+        options = {'d_centroid': True, 'd_std': True, 'd_pairwise': True}
+        logger = Logger(options)
+        logger.generate_new_log_entry(PopulationArray(genomes, np.zeros(4)))
+        data = logger.get_logger_data()
+        self.assertAlmostEqual(np.sqrt(5), data['d_centroid'][0])
+        self.assertAlmostEqual(1.5, data['d_std'][0])
+        # Every pair of the small population is used: 2 x 2, 2 x 4 and 2 x sqrt(20).
+        self.assertAlmostEqual((4 + 8 + 2 * np.sqrt(20)) / 6, data['d_pairwise'][0])
+        with self.assertRaises(RuntimeError):
+            logger.generate_new_log_entry(np.zeros(4))
+
+    def test_sampled_pairwise_distance(self):
+        genomes = np.random.default_rng(1).standard_normal((300, 5))
+        distances = np.linalg.norm(genomes[:, np.newaxis] - genomes[np.newaxis], axis=2)
+        exact = distances[np.triu_indices(300, k=1)].mean()
+        logger = Logger({'d_pairwise': True, 'pairwise_samples': 4000})
+        logger.generate_new_log_entry(PopulationArray(genomes, np.zeros(300)))
+        self.assertAlmostEqual(exact, logger.get_logger_data()['d_pairwise'][0], delta=0.05 * exact)
+
+    def test_invalid_decimation(self):
+        with self.assertRaises(RuntimeError):
+            Logger({'decimation': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from logger.sink import ColumnarLogSink
+from logger.regular import Logger
+from logger.averaging import AveragingLogger
+
+
+class TestColumnarLogSink(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.log_dir = os.path.join(self.tmp_dir.name, 'logs')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_logger_streaming(self):
+        sink = ColumnarLogSink(self.log_dir, chunk_size=2)
+        logger = Logger(sink=sink)
+        for i in range(3):
+            logger.generate_new_log_entry([(np.array([0.0]), float(i)), (np.array([1.0]), float(i + 2))])
+        # Only the full chunk is written before flushing.
+        self.assertEqual(2, len(ColumnarLogSink.load(self.log_dir)['run']))
+        sink.flush()
+        data = ColumnarLogSink.load(self.log_dir)
+        self.assertEqual([0, 0, 0], data['run'].tolist())
+        self.assertEqual([0, 1, 2], data['iteration'].tolist())
+        self.assertEqual([2.0, 3.0, 4.0], data['v_max'].tolist())
+        self.assertEqual([0.0, 1.0, 2.0], data['v_min'].tolist())
+        self.assertEqual([1.0, 2.0, 3.0], data['v_avg'].tolist())
+
+    def test_averaging_logger_runs(self):
+        sink = ColumnarLogSink(self.log_dir)
+        avg_logger = AveragingLogger({'v_min': False, 'v_avg': False}, sink)
+        avg_logger.clean_up()
+        avg_logger.logging_for_new_run()
+        avg_logger.get_logging_logger().generate_new_log_entry([(np.array([0.0]), 1.0)])
+        finished = Logger({'v_min': False, 'v_avg': False})
+        finished.generate_new_log_entry([(np.array([0.0]), 2.0)])
+        finished.generate_new_log_entry([(np.array([0.0]), 3.0)])
+        avg_logger.add_run_logger(finished)
+        sink.close()
+        # Sink opened later appends new runs.
+        with ColumnarLogSink(self.log_dir) as other_sink:
+            Logger({'v_min': False, 'v_avg': False}, other_sink).generate_new_log_entry([(np.array([0.0]), 4.0)])
+        data = ColumnarLogSink.load(self.log_dir)
+        self.assertEqual({'run', 'iteration', 'v_max'}, set(data))
+        matrix = ColumnarLogSink.to_runs_matrix(data, 'v_max')
+        self.assertTrue(np.array_equal([[1.0, np.nan], [2.0, 3.0], [4.0, np.nan]], matrix, equal_nan=True))
+
+    def test_mismatched_entry(self):
+        sink = ColumnarLogSink(self.log_dir)
+        sink.write(0, 0, {'v_max': 1.0})
+        with self.assertRaises(RuntimeError):
+            sink.write(0, 1, {'v_min': 1.0})
+
+
+    def test_merge(self):
+        other_dir = os.path.join(self.tmp_dir.name, 'other')
+        with ColumnarLogSink(other_dir) as other:
+            for run in (other.new_run(), other.new_run()):
+                for iteration in range(3):
+                    other.write(run, iteration, {'v_max': float(10 * run + iteration)})
+        with ColumnarLogSink(self.log_dir) as sink:
+            sink.write(sink.new_run(), 0, {'v_max': -1.0})
+            sink.merge(other_dir)
+            sink.merge(os.path.join(self.tmp_dir.name, 'empty'))
+        data = ColumnarLogSink.load(self.log_dir)
+        self.assertEqual([0, 1, 1, 1, 2, 2, 2], data['run'].tolist())
+        self.assertEqual([0, 0, 1, 2, 0, 1, 2], data['iteration'].tolist())
+        self.assertEqual([-1.0, 0.0, 1.0, 2.0, 10.0, 11.0, 12.0], data['v_max'].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+
+from population.array import PopulationArray
+
+
+class TestPopulationArray(unittest.TestCase):
+    def test_conversion(self):
+        eval_population = [
+            (np.array([1.0, 2.0]), 3.0),
+            (np.array([4.0, 5.0]), 6.0),
+        ]
+        population = PopulationArray.from_evaluated_population(eval_population)
+        self.assertEqual((2, 2), population.genomes.shape)
+        self.assertTrue(population.genomes.flags.c_contiguous)
+        self.assertEqual([3.0, 6.0], population.fitness.tolist())
+        result = population.to_evaluated_population()
+        for (genome, value), (expected_genome, expected_value) in zip(result, eval_population):
+            self.assertTrue((genome == expected_genome).all())
+            self.assertEqual(value, expected_value)
+
+    def test_take_concatenate_and_best(self):
+        population = PopulationArray(np.array([[0.0], [1.0], [2.0]]), np.array([5.0, 7.0, 6.0]))
+        joined = PopulationArray.concatenate([population.take([2]), population.take([0, 1])])
+        self.assertEqual([[2.0], [0.0], [1.0]], joined.genomes.tolist())
+        self.assertEqual([6.0, 5.0, 7.0], joined.fitness.tolist())
+        best, best_value = joined.best()
+        self.assertEqual([1.0], best.tolist())
+        self.assertEqual(7.0, best_value)
+
+    def test_best_indices_and_split_weakest(self):
+        population = PopulationArray(np.arange(6, dtype=float).reshape(6, 1), np.array([3.0, 0.0, 5.0, 1.0, 4.0, 2.0]))
+        self.assertEqual([2, 4], population.best_indices(2).tolist())
+        weakest, others = population.split_weakest(3)
+        self.assertEqual([1, 3, 5], weakest.tolist())
+        self.assertEqual([0, 2, 4], others.tolist())
+        weakest, others = population.split_weakest(10)
+        self.assertEqual(list(range(6)), weakest.tolist())
+        self.assertEqual([], others.tolist())
+        self.assertEqual([], population.best_indices(0).tolist())
+
+    def test_mismatched_shapes(self):
+        with self.assertRaises(RuntimeError):
+            PopulationArray(np.zeros((3, 2)), np.zeros(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+
+from population.generator import PopulationGenerator
+
+
+class TestPopulationGenerator(unittest.TestCase):
+    def test_distributions(self):
+        uniform = PopulationGenerator.generate_population_uniform_distribution(-100, 100, 10, 50, 0)
+        normal = PopulationGenerator.generate_population_normal_distribution(0, 1, 10, 50, 0)
+        self.assertEqual((50, 10), uniform.shape)
+        self.assertEqual((50, 10), normal.shape)
+        self.assertTrue(np.all((-100 <= uniform) & (uniform < 100)))
+        self.assertTrue(np.array_equal(
+            uniform, PopulationGenerator.generate_population_uniform_distribution(-100, 100, 10, 50, 0)
+        ))
+
+    def test_latin_hypercube(self):
+        genomes = PopulationGenerator.generate_population_latin_hypercube(-100, 100, 30, 40, 0)
+        self.assertEqual((40, 30), genomes.shape)
+        # Every interval of every coordinate holds a single individual.
+        intervals = np.floor((genomes + 100) / 200 * 40)
+        for column in intervals.T:
+            self.assertTrue(np.array_equal(np.arange(40), np.sort(column)))
+
+    def test_halton(self):
+        genomes = PopulationGenerator.generate_population_halton([-100, 0], [100, 10], 2, 64, 0)
+        self.assertEqual((64, 2), genomes.shape)
+        self.assertTrue(np.all(genomes >= [-100, 0]) and np.all(genomes < [100, 10]))
+        # Base 2 coordinate of the first 2^k - 1 points fills the dyadic grid.
+        first = PopulationGenerator.generate_population_halton(0, 1, 1, 7, 0)[:, 0]
+        self.assertTrue(np.allclose(np.arange(1, 8) / 8, np.sort(first)))
+        high = PopulationGenerator.generate_population_halton(-100, 100, 100, 200, 0)
+        self.assertTrue(np.all((-100 <= high) & (high < 100)))
+
+    def test_opposition_based(self):
+        genomes = PopulationGenerator.generate_population_opposition_based(
+            -100, 100, 5, 20, lambda x: float(np.sum(x)), 0
+        )
+        uniform = PopulationGenerator.generate_population_uniform_distribution(-100, 100, 5, 20, 0)
+        # Exactly one individual of every opposite pair has positive sum, so it is selected.
+        expected = np.where((np.sum(uniform, axis=1) > 0)[:, np.newaxis], uniform, -uniform)
+        self.assertEqual((20, 5), genomes.shape)
+        self.assertEqual(sorted(map(tuple, expected)), sorted(map(tuple, genomes)))
+
+
+if __name__ == '__main__':
+    unittest.main()